@@ -0,0 +1,153 @@
+"""
+Adaptive practice exams for the PCEP tutor.
+
+Each topic's accuracy is tracked as a Beta posterior over the chance of
+answering one of its questions wrong, updated in O(1) per answer (and
+rebuilt from the answer log at startup). Exams draw topics in proportion to
+bucket size times expected error rate, so weak topics come up more often
+while a learner with no history still gets a uniform draw over the bank.
+
+Topics are drawn from a Vose alias table: building it is O(number of
+topics) and every draw is O(1), so a k-question exam costs O(k) whatever
+the size of the bank.
+"""
+
+import random
+
+
+# Beta(1, 1) prior: a topic nobody has answered counts as a coin flip
+PRIOR_CORRECT = 1.0
+PRIOR_WRONG = 1.0
+
+
+class TopicPosterior:
+    """
+    Running Beta(correct, wrong) counts per topic.
+
+    Args:
+        answers (iterable): Answer records to start from (answer_log.read_answers)
+    """
+
+    def __init__(self, answers=()):
+        self._counts = {}
+        for record in answers:
+            topic = record.get("topic")
+            if topic is not None:
+                self.update(topic, bool(record.get("correct")))
+
+    def update(self, topic, correct):
+        """Add one answer to a topic's posterior"""
+        counts = self._counts.get(topic)
+        if counts is None:
+            counts = self._counts[topic] = [PRIOR_CORRECT, PRIOR_WRONG]
+        counts[0 if correct else 1] += 1
+
+    def error_rate(self, topic):
+        """Return the posterior mean chance of getting a topic's question wrong"""
+        right, wrong = self._counts.get(topic, (PRIOR_CORRECT, PRIOR_WRONG))
+        return wrong / (right + wrong)
+
+    def answered(self, topic):
+        """Return how many answers have been recorded for a topic"""
+        right, wrong = self._counts.get(topic, (PRIOR_CORRECT, PRIOR_WRONG))
+        return int(right + wrong - PRIOR_CORRECT - PRIOR_WRONG)
+
+
+class AliasTable:
+    """
+    Vose's alias method: O(n) setup, O(1) weighted draws.
+
+    Args:
+        weights (list): Non-negative weights, at least one positive
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        scaled = [w * n / total for w in weights]
+        self._prob = [0.0] * n
+        self._alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error
+        for i in small + large:
+            self._prob[i] = 1.0
+
+    def draw(self, rng=random):
+        """Return an index with probability proportional to its weight"""
+        i = int(rng.random() * len(self._prob))
+        return i if rng.random() < self._prob[i] else self._alias[i]
+
+
+def sample_weighted(bank, posterior, k, rng=random, taken_clusters=None, **filters):
+    """
+    Draw k questions, favouring topics with a high expected error rate.
+
+    A topic's weight is its number of unused questions times its posterior
+    error rate, and a question is then picked uniformly within the drawn
+    topic. Questions whose near-duplicate cluster is already used are
+    redrawn; a topic with nothing left is dropped and the alias table
+    rebuilt, which happens at most once per topic.
+
+    Args:
+        bank (QuestionBank): Question pool indexed by topic
+        posterior (TopicPosterior): Per-topic accuracy
+        k (int): Number of questions
+        rng (random.Random): Random source
+        taken_clusters (set): Near-duplicate clusters already used by the
+            caller; updated with the new picks
+        **filters: Restrict the draw (lesson, source, difficulty and/or section)
+
+    Returns:
+        list: Questions (question_bank.Question)
+
+    Raises:
+        ValueError: If fewer than k distinct questions match
+    """
+    if k > bank.count(**filters):
+        raise ValueError("Sample larger than question bank")
+    buckets = {topic: bank.ids(topic=topic, **filters) for topic in bank.keys("topic")}
+    buckets = {topic: ids for topic, ids in buckets.items() if ids}
+    remaining = {topic: len(ids) for topic, ids in buckets.items()}
+    clusters = bank.clusters()
+    taken = set() if taken_clusters is None else taken_clusters
+    picked = []
+    table = topics = None
+    while len(picked) < k:
+        if not remaining:
+            raise ValueError("Not enough distinct questions")
+        if table is None:
+            topics = list(remaining)
+            table = AliasTable([remaining[t] * posterior.error_rate(t) for t in topics])
+        topic = topics[table.draw(rng)]
+        ids = buckets[topic]
+        qid = None
+        if remaining[topic] * 2 > len(ids):
+            for _ in range(4):
+                candidate = ids[int(rng.random() * len(ids))]
+                if clusters[candidate] not in taken:
+                    qid = candidate
+                    break
+        if qid is None:
+            # Mostly used up - pick among what is left instead of retrying
+            free = [i for i in ids if clusters[i] not in taken]
+            if not free:
+                del remaining[topic]
+                table = None
+                continue
+            qid = rng.choice(free)
+        taken.add(clusters[qid])
+        picked.append(qid)
+        remaining[topic] -= 1
+        if remaining[topic] == 0:
+            del remaining[topic]
+            table = None
+    return [bank[qid] for qid in picked]
@@ -0,0 +1,127 @@
+"""
+Per-answer event log for the PCEP tutor.
+
+Every quiz and exam answer is recorded (question id, chosen option, correct
+flag, latency) so adaptive features and reporting can read the history later.
+Records are buffered in memory and appended to a JSON Lines file in batches,
+so the question loop never waits on disk I/O.
+
+Learners sharing a machine (python_tutor.py --db --user NAME) each get
+their own log file next to the default one (user_log_path), so reading one
+learner's history never parses the rest of the class's answers.
+"""
+
+import json
+import os
+import time
+import urllib.parse
+
+
+def user_log_path(path, user):
+    """
+    Return the answer log file of one learner.
+
+    Args:
+        path (str): Log file of the single local learner
+            (pcep_tutor_answers.jsonl)
+        user (str): Learner name, None for the single local learner
+
+    Returns:
+        str: path itself for None, else e.g. pcep_tutor_answers.alice.jsonl
+            (the name is percent-encoded, so any name is a safe file name)
+    """
+    if user is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{urllib.parse.quote(user, safe='')}{ext}"
+
+
+class AnswerLog:
+    """
+    Buffered JSON Lines writer for answer records.
+
+    Records are kept in memory until batch_size of them have accumulated (or
+    flush()/close() is called), then written with a single append.
+
+    Args:
+        path (str): JSON Lines file to append to, or None to discard records
+        batch_size (int): Number of buffered records that triggers a write
+        user (str): Learner name; records go to their own file (see
+            user_log_path) instead of path (None for the single local learner)
+    """
+
+    def __init__(self, path, batch_size=50, user=None):
+        self.path = path if path is None else user_log_path(path, user)
+        self.batch_size = batch_size
+        self.user = user
+        self._buffer = []
+
+    def record(self, question_id, chosen, correct, latency, **context):
+        """
+        Buffer one answer.
+
+        Args:
+            question_id (str): Stable question id (question_bank.question_id)
+            chosen (str): Option letter the learner entered
+            correct (bool): Whether the answer was right
+            latency (float): Seconds between showing the question and answering
+            **context: Extra fields such as mode ("quiz"/"exam") and topic
+        """
+        record = {
+            "ts": round(time.time(), 3),
+            "qid": question_id,
+            "chosen": chosen,
+            "correct": correct,
+            "latency": round(latency, 3),
+            **context
+        }
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Append all buffered records to the log file in one write"""
+        if not self._buffer:
+            return
+        if self.path is None:
+            self._buffer = []
+            return
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in self._buffer)
+        self._buffer = []
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data.encode('utf-8'))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def close(self):
+        """Write any remaining records"""
+        self.flush()
+
+
+def read_answers(path):
+    """
+    Read the records of an answer log, skipping damaged lines.
+
+    Args:
+        path (str): JSON Lines file written by AnswerLog (AnswerLog.path)
+
+    Returns:
+        list: Answer record dictionaries in the order they were written
+    """
+    records = []
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+    except OSError:
+        pass
+    return records
@@ -0,0 +1,58 @@
+"""
+Atomic file replacement for the PCEP tutor's caches and snapshots.
+
+Every file the tutor rewrites (compiled question cache, practice bank,
+snippet cache, search index, progress snapshot, imported study guide) is
+written to a temporary file next to it and moved into place with
+os.replace(), so readers see either the old or the new contents - never a
+half-written file - and a failed write leaves the old file alone.
+"""
+
+import os
+
+
+def _fsync_directory(path):
+    """Flush a directory entry change (the rename) to disk where supported"""
+    if os.name == 'nt':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, fsync=False):
+    """
+    Replace a file's contents atomically, creating its directory if needed.
+
+    Args:
+        path (str): File to write
+        data (bytes or str): New contents (str is written as UTF-8)
+        fsync (bool): Flush the file and the rename to disk before returning
+            (for data that must survive a crash, not for caches)
+
+    Raises:
+        OSError: If the file can't be written (the temporary file is removed)
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        if fsync:
+            _fsync_directory(path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,347 @@
+"""
+Question bank validation for the PCEP tutor (python_tutor.py --validate-bank).
+
+Checks every raw question before normalization hides its problems:
+
+- options: missing, empty or too few options (e.g. single-option
+  "DRAG DROP" items that can't be asked as multiple choice)
+- answer: missing keys, keys naming options that don't exist, multi-answer
+  keys such as "AB" (the tutor only takes one letter), and explanations that
+  name a different answer letter
+- encoding: mojibake and stray control characters from PDF extraction
+- duplicates: questions whose text is identical after normalizing case,
+  whitespace and punctuation
+- code: snippets embedded in "what is the output" questions are executed
+  and the output is compared with the options - a snippet that prints
+  another option's text contradicts the key
+
+Question text is untrusted, so snippets never run in the validator itself:
+they go to a code_runner.ExecutionPool, whose worker subprocesses enforce
+CPU, memory and wall-clock limits and are replaced when a snippet kills
+them. One worker per job runs snippets concurrently; the cheap text checks
+and duplicate detection (on text hashes, needing the whole bank) run in the
+parent.
+"""
+
+import concurrent.futures
+import hashlib
+import os
+import re
+
+import code_runner
+import question_bank
+
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+CODE_CPU_SECONDS = 1
+CODE_WALL_SECONDS = 2.0
+CODE_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Byte sequences typical of UTF-8 text decoded as cp1252/latin-1, the
+# Unicode replacement character, and PDF extraction artifacts
+_MOJIBAKE = re.compile("Ã.|â€|Â|�|””|““|oe\\+")
+_CONTROL = re.compile("[\x00-\x08\x0b-\x1f\x7f]")
+_ANSWER_IN_EXPLANATION = re.compile(r"\b(?:correct answer|answer) is ([A-D])\b")
+_OPTION_LINE = re.compile(r"^[A-D][.)]\s")
+_ERROR_WORDS = ("error", "exception", "erroneous", "cannot be run")
+_NOTHING_WORDS = ("outputs nothing", "no output", "produces no output")
+_WORD = re.compile(r"\w+")
+
+
+def _issue(severity, check, message):
+    return {"severity": severity, "check": check, "message": message}
+
+
+def to_record(raw, source, index):
+    """
+    Convert a raw question from any supported layout into a validation record.
+
+    Unlike question_bank.normalize_question this keeps everything as found:
+    full text, every option with its letter, and the complete answer key.
+
+    Args:
+        raw (dict): Question in the study guide, lesson quiz or practice layout
+        source (str): Where the question came from
+        index (int): Position within its source
+
+    Returns:
+        dict: source, index, text, options [(letter, text)], answer, explanation
+    """
+    if "question_text" in raw:
+        text = raw.get("question_text") or ""
+        options = raw.get("options")
+        options = sorted(options.items()) if isinstance(options, dict) else []
+        answer = raw.get("correct_answer") or ""
+    else:
+        text = raw.get("question") or ""
+        options = []
+        for position, option in enumerate(raw.get("options") or []):
+            letter = option[0] if _OPTION_LINE.match(option) else chr(ord("A") + position)
+            options.append((letter, option[3:] if _OPTION_LINE.match(option) else option))
+        if "answer" in raw:
+            answer = raw["answer"] or ""
+        elif isinstance(raw.get("correct"), int):
+            answer = chr(ord("A") + raw["correct"])
+        else:
+            answer = ""
+    return {
+        "source": source,
+        "index": index,
+        "text": text,
+        "options": [(str(letter), str(option)) for letter, option in options],
+        "answer": str(answer).strip().upper(),
+        "explanation": raw.get("explanation") or "",
+    }
+
+
+def _check_options(record):
+    issues = []
+    options = record["options"]
+    if not options:
+        issues.append(_issue(SEVERITY_ERROR, "options", "no options"))
+    elif len(options) == 1:
+        issues.append(_issue(SEVERITY_ERROR, "options",
+                             "single option - can't be asked as multiple choice"))
+    elif len(options) < 4:
+        issues.append(_issue(SEVERITY_WARNING, "options", f"only {len(options)} options"))
+    for letter, text in options:
+        if not text.strip():
+            issues.append(_issue(SEVERITY_ERROR, "options", f"option {letter} is empty"))
+    return issues
+
+
+def _check_answer(record):
+    issues = []
+    answer = record["answer"]
+    letters = {letter for letter, _ in record["options"]}
+    if not answer:
+        return [_issue(SEVERITY_ERROR, "answer", "no answer key")]
+    missing = [letter for letter in answer if letter not in letters]
+    if missing:
+        issues.append(_issue(SEVERITY_ERROR, "answer",
+                             f"key {answer!r} names missing option(s) {', '.join(missing)}"))
+    if len(answer) > 1:
+        issues.append(_issue(SEVERITY_WARNING, "answer",
+                             f"multi-answer key {answer!r} - the tutor only accepts {answer[0]!r}"))
+    elif "(select two answers" in record["text"].lower():
+        issues.append(_issue(SEVERITY_ERROR, "answer",
+                             f"asks for two answers but the key is {answer!r}"))
+    stated = _ANSWER_IN_EXPLANATION.search(record["explanation"])
+    if stated and stated.group(1) not in answer:
+        issues.append(_issue(SEVERITY_WARNING, "answer",
+                             f"explanation says the answer is {stated.group(1)}, key is {answer!r}"))
+    return issues
+
+
+def _check_encoding(record):
+    issues = []
+    fields = [("question", record["text"]), ("explanation", record["explanation"])]
+    fields.extend((f"option {letter}", text) for letter, text in record["options"])
+    for name, text in fields:
+        found = _MOJIBAKE.search(text)
+        if found:
+            issues.append(_issue(SEVERITY_WARNING, "encoding", f"garbled text {found.group()!r} in {name}"))
+        if _CONTROL.search(text):
+            issues.append(_issue(SEVERITY_WARNING, "encoding", f"control character in {name}"))
+    return issues
+
+
+def extract_code(text):
+    """
+    Return the code snippet embedded in a question, or None.
+
+    The snippet is everything after the first blank line, minus form feeds
+    and any option lines ("A. 5") that leaked into the question text.
+    """
+    lowered = text.lower()
+    if "output" not in lowered and "code" not in lowered:
+        return None
+    _, sep, body = text.replace("\x0c", "").partition("\n\n")
+    if not sep:
+        return None
+    lines = [line for line in body.strip("\n").splitlines() if not _OPTION_LINE.match(line)]
+    code = "\n".join(lines).strip()
+    return code or None
+
+
+def run_snippet(code, pool):
+    """
+    Execute a snippet in a sandboxed worker and capture what it prints.
+
+    Args:
+        code (str): Snippet source
+        pool (code_runner.ExecutionPool): Workers to run it in
+
+    Returns:
+        tuple: (output, error) - error is "Type: message", "timeout",
+            "syntax" or None
+    """
+    try:
+        compile(code, "<question>", "exec")
+    except (SyntaxError, ValueError):
+        return None, "syntax"
+    result = pool.run(code, restricted=False)
+    if result.timed_out:
+        return result.output, "timeout"
+    return result.output, result.error
+
+
+def _squash(text):
+    return " ".join(text.split())
+
+
+def _check_code(record, pool):
+    code = extract_code(record["text"])
+    if code is None:
+        return []
+    output, error = run_snippet(code, pool)
+    if error == "syntax":
+        if ":\n" in code:
+            return [_issue(SEVERITY_WARNING, "code",
+                           "embedded code does not compile (indentation lost?)")]
+        return []
+
+    key = record["answer"][:1]
+    options = dict(record["options"])
+    if key not in options:
+        return []
+    key_text = options[key].lower()
+    if error is not None:
+        if error != "timeout" and not any(word in key_text for word in _ERROR_WORDS):
+            return [_issue(SEVERITY_WARNING, "code",
+                           f"snippet raises {error.split(':')[0]} but the key is {options[key]!r}")]
+        return []
+
+    printed = _squash(output)
+    matching = [letter for letter, text in record["options"]
+                if _squash(text) == printed
+                or (not printed and any(word in text.lower() for word in _NOTHING_WORDS))]
+    if key in matching:
+        return []
+    if matching:
+        return [_issue(SEVERITY_ERROR, "code",
+                       f"snippet prints {printed!r} (option {matching[0]}) but the key is {key}")]
+    return [_issue(SEVERITY_WARNING, "code", f"snippet prints {printed!r}, which matches no option")]
+
+
+CHECKS = (_check_options, _check_answer, _check_encoding)
+
+
+def check_question(record, pool=None):
+    """
+    Run every per-question check; return a list of issues.
+
+    Args:
+        record (dict): Record from to_record()
+        pool (code_runner.ExecutionPool): Workers for the code check
+            (skipped when None)
+    """
+    issues = []
+    for check in CHECKS:
+        issues.extend(check(record))
+    if pool is not None:
+        issues.extend(_check_code(record, pool))
+    return issues
+
+
+def _make_pool(jobs):
+    return code_runner.ExecutionPool(size=jobs, cpu_seconds=CODE_CPU_SECONDS,
+                                     wall_seconds=CODE_WALL_SECONDS, memory_bytes=CODE_MEMORY_BYTES)
+
+
+def _text_key(text):
+    """Hash of a question's words, ignoring case, whitespace and punctuation"""
+    words = " ".join(_WORD.findall(text.lower()))
+    return hashlib.sha1(words.encode("utf-8")).hexdigest()
+
+
+def find_duplicates(records):
+    """
+    Return duplicate questions as [(record, first record with the same text)].
+
+    Questions with no words at all are skipped (reported by other checks).
+    """
+    seen = {}
+    duplicates = []
+    for record in records:
+        if not _WORD.search(record["text"]):
+            continue
+        key = _text_key(record["text"] + "\n" + "\n".join(text for _, text in record["options"]))
+        first = seen.setdefault(key, record)
+        if first is not record:
+            duplicates.append((record, first))
+    return duplicates
+
+
+def validate(records, jobs=None):
+    """
+    Validate records, running embedded code in sandboxed workers.
+
+    Args:
+        records (list): Records from to_record()
+        jobs (int): Snippets run at the same time, one worker subprocess
+            each (default: CPU count)
+
+    Returns:
+        list: (source, index, issue) for every problem found, in bank order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pool = _make_pool(jobs)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as threads:
+            code_issues = threads.map(lambda record: _check_code(record, pool), records)
+            found = []
+            for record, issues in zip(records, code_issues):
+                issues = [issue for check in CHECKS for issue in check(record)] + issues
+                found.extend((record["source"], record["index"], issue) for issue in issues)
+    finally:
+        pool.close()
+
+    for record, first in find_duplicates(records):
+        found.append((record["source"], record["index"], _issue(
+            SEVERITY_WARNING, "duplicate", f"same question as {first['source']} #{first['index'] + 1}")))
+    return found
+
+
+def load_json_records(path, source=None):
+    """Stream a JSON array or JSON Lines file of questions and convert each to a record"""
+    source = source or os.path.basename(path)
+    return [to_record(raw, source, index)
+            for index, raw in enumerate(question_bank.iter_json_questions(path))]
+
+
+def run(records, jobs=None, limit=50):
+    """
+    Validate records and print a report.
+
+    Args:
+        records (list): Records from to_record()
+        jobs (int): Worker processes (default: CPU count)
+        limit (int): Maximum number of individual issues listed
+
+    Returns:
+        int: Exit status (1 if any error-level issue was found)
+    """
+    found = validate(records, jobs)
+    counts = {}
+    for _, _, issue in found:
+        key = (issue["check"], issue["severity"])
+        counts[key] = counts.get(key, 0) + 1
+
+    print("=" * 70)
+    print("  🔎 QUESTION BANK VALIDATION")
+    print("=" * 70)
+    print(f"\nChecked {len(records)} questions: {len(found)} issues")
+    for (check, severity), count in sorted(counts.items()):
+        print(f"  {check:<10}{severity:<9}{count:>6}")
+
+    ordered = sorted(found, key=lambda item: item[2]["severity"] != SEVERITY_ERROR)
+    if ordered:
+        print()
+    for source, index, issue in ordered[:limit]:
+        print(f"[{issue['severity']}] {source} #{index + 1}: {issue['check']}: {issue['message']}")
+    if len(ordered) > limit:
+        print(f"... and {len(ordered) - limit} more")
+    return 1 if any(issue["severity"] == SEVERITY_ERROR for _, _, issue in found) else 0
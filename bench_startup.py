@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the PCEP tutor question bank.
+
+Compares a cold start (no compiled cache, JSON parsed and formatted) with a
+warm start (compiled cache loaded directly). Run from the repository root:
+
+    python3 bench_startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import question_bank
+
+
+JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PCEP_Questions.json")
+
+
+def _remove_cache():
+    """Delete the compiled cache so the next load is cold"""
+    try:
+        os.remove(JSON_PATH + question_bank.CACHE_SUFFIX)
+    except OSError:
+        pass
+
+
+def _time_load():
+    """Return (seconds, question count) for one question bank load"""
+    start = time.perf_counter()
+    questions = question_bank.load_study_questions(JSON_PATH)
+    return time.perf_counter() - start, len(questions)
+
+
+def _report(label, samples):
+    """Print median and best timings in milliseconds"""
+    print(f"  {label:<6} median {statistics.median(samples) * 1000:8.3f} ms"
+          f" | best {min(samples) * 1000:8.3f} ms")
+
+
+def main():
+    """Run cold and warm loads and print the comparison"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="loads per scenario")
+    args = parser.parse_args()
+
+    cold = []
+    count = 0
+    for _ in range(args.repeat):
+        _remove_cache()
+        elapsed, count = _time_load()
+        cold.append(elapsed)
+
+    # The last cold load left a fresh cache behind
+    warm = [_time_load()[0] for _ in range(args.repeat)]
+
+    print(f"Question bank: {count} questions from {os.path.basename(JSON_PATH)}")
+    _report("cold", cold)
+    _report("warm", warm)
+    print(f"  speedup {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
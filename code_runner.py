@@ -0,0 +1,438 @@
+"""
+Sandboxed code execution for the PCEP tutor.
+
+Lesson examples and learner exercises used to run with exec() inside the
+tutor process, so an exercise like `while True: pass` froze the whole
+session. ExecutionPool keeps a few pre-warmed worker subprocesses instead:
+
+- Each snippet runs in a worker with a CPU-time limit and (on POSIX) an
+  address-space limit, plus a wall-clock timeout enforced by the tutor
+- Output is streamed back line by line while the snippet runs
+- A worker that times out, crashes or exceeds a limit is killed and replaced
+
+The worker side of the protocol lives in this file too: the pool starts it
+with `python code_runner.py`, and jobs and replies travel as JSON lines over
+the worker's stdin/stdout.
+
+Lesson examples are only compiled once: workers share a SnippetCache of code
+objects persisted with marshal in __pycache__ (filled by the runs of jobs
+marked cache=True and by --precompile), and the pool can memoize the output
+of deterministic snippets so re-running one costs nothing beyond printing.
+Learner code is looked up in the cache but compiled without persisting it,
+so exercise attempts never grow the shared file.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import atomic_file
+
+try:
+    import resource
+except ImportError:  # Windows - only the wall-clock timeout applies
+    resource = None
+
+
+# Builtins available to lesson examples (restricted mode)
+SAFE_BUILTINS = (
+    'print', 'len', 'range', 'enumerate', 'zip', 'list',
+    'dict', 'set', 'tuple', 'str', 'int', 'float', 'bool', 'type',
+    'max', 'min', 'sum', 'sorted', 'reversed', 'filter', 'map'
+)
+
+DEFAULT_CPU_SECONDS = 2
+DEFAULT_WALL_SECONDS = 5.0
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+MAX_OUTPUT_CHARS = 64 * 1024
+
+SNIPPET_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__pycache__",
+    f"pcep_snippets.{sys.implementation.cache_tag}.marshal"
+)
+
+
+def snippet_key(code):
+    """Return the cache key (SHA-1 hex digest) for a snippet's source"""
+    return hashlib.sha1(code.encode('utf-8')).hexdigest()
+
+
+class SnippetCache:
+    """
+    Compiled code objects for snippets, keyed by a hash of their source.
+
+    The cache file is specific to the interpreter version (its name carries
+    sys.implementation.cache_tag), like the .pyc files next to it.
+
+    Args:
+        path (str): marshal file holding {source hash: code object}
+    """
+
+    def __init__(self, path=SNIPPET_CACHE_PATH):
+        self.path = path
+        self._codes = {}
+        self.dirty = False
+
+    def load(self):
+        """Read the persisted code objects, ignoring a missing or damaged file"""
+        try:
+            with open(self.path, 'rb') as f:
+                codes = marshal.loads(f.read())
+            if isinstance(codes, dict):
+                self._codes.update(codes)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    def get(self, code):
+        """Return the cached code object for a snippet, or None"""
+        return self._codes.get(snippet_key(code))
+
+    def code_for(self, code):
+        """
+        Return the compiled code object for a snippet, compiling on a miss.
+
+        Raises:
+            SyntaxError: If the snippet does not compile (nothing is cached)
+        """
+        key = snippet_key(code)
+        compiled = self._codes.get(key)
+        if compiled is None:
+            compiled = compile(code, "<snippet>", "exec")
+            self._codes[key] = compiled
+            self.dirty = True
+        return compiled
+
+    def precompile(self, sources):
+        """
+        Compile every snippet in sources and persist the cache.
+
+        Args:
+            sources (iterable): Snippet source strings
+
+        Returns:
+            int: Number of snippets that failed to compile
+        """
+        failures = 0
+        for code in sources:
+            try:
+                self.code_for(code)
+            except SyntaxError:
+                failures += 1
+        self.save()
+        return failures
+
+    def save(self):
+        """Atomically write the cache file, ignoring unwritable locations"""
+        # Merge with entries other workers saved since this one loaded
+        self.load()
+        try:
+            atomic_file.atomic_write(self.path, marshal.dumps(self._codes))
+            self.dirty = False
+        except OSError:
+            pass
+
+
+class ExecutionResult:
+    """
+    Outcome of running one snippet.
+
+    Attributes:
+        output (str): Everything the snippet printed
+        error (str): Error message, or None if the snippet finished cleanly
+        timed_out (bool): True if a time limit stopped the snippet
+    """
+
+    __slots__ = ("output", "error", "timed_out")
+
+    def __init__(self, output="", error=None, timed_out=False):
+        self.output = output
+        self.error = error
+        self.timed_out = timed_out
+
+    @property
+    def ok(self):
+        """True when the snippet ran to completion without an exception"""
+        return self.error is None
+
+
+class _Worker:
+    """One worker subprocess plus a thread that turns its replies into a queue"""
+
+    def __init__(self, memory_bytes):
+        env = dict(os.environ, PCEP_RUNNER_MEMORY=str(memory_bytes or 0))
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", os.path.abspath(__file__)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        self.replies = queue.Queue()
+        reader = threading.Thread(target=self._read_replies, daemon=True)
+        reader.start()
+
+    def _read_replies(self):
+        for line in self.process.stdout:
+            try:
+                self.replies.put(json.loads(line))
+            except ValueError:
+                continue
+        self.replies.put(None)  # worker exited
+
+    def send(self, job):
+        self.process.stdin.write((json.dumps(job) + "\n").encode('utf-8'))
+        self.process.stdin.flush()
+
+    def exit_status(self, timeout=1.0):
+        """Return the exited worker's return code (None if it is still running)"""
+        try:
+            return self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    def kill(self):
+        try:
+            self.process.kill()
+            self.process.wait()
+        except OSError:
+            pass
+
+
+def _death_message(status):
+    """
+    Describe why a worker died in the middle of a snippet.
+
+    Args:
+        status (int): Popen return code (negative for a signal), or None
+
+    Returns:
+        tuple: (error message, timed_out)
+    """
+    if status is not None and status < 0:
+        number = -status
+        if number == getattr(signal, "SIGXCPU", None):
+            return "CPU time limit exceeded", True
+        try:
+            name = signal.Signals(number).name
+        except ValueError:
+            name = str(number)
+        return f"Worker killed by signal {name}", False
+    if status is None:
+        return "Worker stopped responding", False
+    return f"Snippet ended the worker (exit status {status})", False
+
+
+class ExecutionPool:
+    """
+    Pool of pre-warmed worker subprocesses that run code snippets.
+
+    Args:
+        size (int): Number of workers kept ready
+        cpu_seconds (int): CPU-time limit per snippet
+        wall_seconds (float): Wall-clock limit per snippet (catches sleeping code)
+        memory_bytes (int): Address-space limit per worker (POSIX only)
+    """
+
+    def __init__(self, size=1, cpu_seconds=DEFAULT_CPU_SECONDS,
+                 wall_seconds=DEFAULT_WALL_SECONDS, memory_bytes=DEFAULT_MEMORY_BYTES):
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_bytes = memory_bytes
+        self._lock = threading.Lock()
+        self._idle = [_Worker(memory_bytes) for _ in range(size)]
+        self._outputs = {}
+
+    def _acquire(self):
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.poll() is None:
+                    return worker
+        return _Worker(self.memory_bytes)
+
+    def _release(self, worker):
+        with self._lock:
+            self._idle.append(worker)
+
+    def _replace(self, worker):
+        """Kill a misbehaving worker and pre-warm a fresh one in its place"""
+        worker.kill()
+        self._release(_Worker(self.memory_bytes))
+
+    def run(self, code, restricted=True, on_output=None, memoize=False, cache=False):
+        """
+        Run a snippet in a worker and wait for it to finish.
+
+        Args:
+            code (str): Python source to execute
+            restricted (bool): Only expose SAFE_BUILTINS to the snippet
+            on_output (callable): Called with each chunk of output as it arrives
+            memoize (bool): The snippet is deterministic - reuse the output of
+                an earlier run of the same source instead of executing it again
+            cache (bool): Persist the compiled snippet in the shared
+                SnippetCache (lesson code only, never learner input)
+
+        Returns:
+            ExecutionResult: Output, error message and timeout flag
+        """
+        key = (snippet_key(code), restricted)
+        if memoize and key in self._outputs:
+            result = self._outputs[key]
+            if on_output is not None and result.output:
+                on_output(result.output)
+            return result
+
+        result = self._execute(code, restricted, on_output, cache)
+        if memoize and not result.timed_out:
+            self._outputs[key] = result
+        return result
+
+    def _execute(self, code, restricted, on_output, cache):
+        """Send one job to a worker and collect its streamed replies"""
+        worker = self._acquire()
+        chunks = []
+        try:
+            worker.send({"code": code, "restricted": restricted, "cpu": self.cpu_seconds, "cache": cache})
+        except OSError:
+            self._replace(worker)
+            return ExecutionResult(error="Execution worker unavailable")
+
+        deadline = time.monotonic() + self.wall_seconds
+        while True:
+            try:
+                reply = worker.replies.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._replace(worker)
+                return ExecutionResult("".join(chunks), "Time limit exceeded", timed_out=True)
+
+            if reply is None:
+                # The worker died - the CPU limit (SIGXCPU), another signal
+                # or a snippet calling os._exit()
+                error, timed_out = _death_message(worker.exit_status())
+                self._replace(worker)
+                return ExecutionResult("".join(chunks), error, timed_out=timed_out)
+            if "out" in reply:
+                chunks.append(reply["out"])
+                if on_output is not None:
+                    on_output(reply["out"])
+            if reply.get("done"):
+                self._release(worker)
+                return ExecutionResult("".join(chunks), reply.get("error"))
+
+    def close(self):
+        """Stop all idle workers"""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+class _StreamingOutput:
+    """sys.stdout replacement that forwards output to the tutor line by line"""
+
+    def __init__(self, send):
+        self._send = send
+        self._pending = []
+        self._sent = 0
+        self.truncated = False
+
+    def write(self, text):
+        if self._sent >= MAX_OUTPUT_CHARS:
+            self.truncated = True
+            return len(text)
+        self._pending.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self._pending:
+            text = "".join(self._pending)
+            room = MAX_OUTPUT_CHARS - self._sent
+            if len(text) > room:
+                text = text[:room]
+                self.truncated = True
+            self._pending = []
+            self._sent += len(text)
+            self._send({"out": text})
+
+
+def _limit_cpu(seconds):
+    """Allow the worker `seconds` more CPU time before SIGXCPU ends it"""
+    if resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main():
+    """Serve jobs from the tutor until stdin closes"""
+    import builtins
+
+    # Keep private copies of the protocol pipes and point the standard
+    # descriptors at /dev/null, so snippets can neither read the job stream
+    # (input() just hits EOF) nor corrupt the replies
+    jobs = os.fdopen(os.dup(0), 'rb')
+    replies = os.fdopen(os.dup(1), 'wb')
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    sys.stdin = open(os.devnull, 'r')
+
+    memory = int(os.environ.get("PCEP_RUNNER_MEMORY", "0"))
+    if resource is not None and memory:
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+        except (ValueError, OSError):
+            pass
+
+    def send(message):
+        replies.write((json.dumps(message) + "\n").encode('utf-8'))
+        replies.flush()
+
+    safe_builtins = {name: getattr(builtins, name) for name in SAFE_BUILTINS}
+    snippets = SnippetCache()
+    snippets.load()
+
+    for line in jobs:
+        job = json.loads(line)
+        output = _StreamingOutput(send)
+        sys.stdout = sys.stderr = output
+        namespace = {'__builtins__': safe_builtins} if job.get("restricted") else {'__name__': '__main__'}
+        error = None
+        _limit_cpu(job.get("cpu", DEFAULT_CPU_SECONDS))
+        try:
+            if job.get("cache"):
+                compiled = snippets.code_for(job["code"])
+            else:
+                compiled = snippets.get(job["code"]) or compile(job["code"], "<snippet>", "exec")
+            exec(compiled, namespace)
+        except MemoryError:
+            error = "Memory limit exceeded"
+        except BaseException as e:  # NOSONAR - report anything the snippet raises
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        output.flush()
+        if output.truncated:
+            send({"out": "\n[output truncated]\n"})
+        send({"done": True, "error": error})
+        if snippets.dirty:
+            # Persist newly compiled snippets once the tutor has its reply
+            snippets.save()
+
+
+if __name__ == "__main__":
+    _worker_main()
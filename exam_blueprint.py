@@ -0,0 +1,117 @@
+"""
+Exam blueprints for the PCEP tutor.
+
+A Blueprint describes an exam: how many questions, what share of them comes
+from each PCEP section, and how long the learner has. assemble() fills the
+per-section quotas from the question bank's section buckets, so a practice
+exam covers the sections in the same proportions as the real one:
+
+1. Basic Concepts (18%)
+2. Data Types, Variables, I/O, Operators (29%)
+3. Boolean, Conditionals, Loops, Lists, Logic (25%)
+4. Functions, Tuples, Dictionaries, Modules (28%)
+
+Passing a seed makes the assembled exam reproducible.
+"""
+
+import random
+
+import adaptive
+
+
+PCEP_SECTION_WEIGHTS = {1: 0.18, 2: 0.29, 3: 0.25, 4: 0.28}
+
+
+class Blueprint:
+    """
+    Shape of an exam.
+
+    Args:
+        name (str): Title shown to the learner
+        question_count (int): Number of questions
+        section_weights (dict): {section: share of the questions}
+        time_limit (float): Seconds allowed for the whole exam, None for untimed
+        passing_score (int): Percentage needed to pass
+    """
+
+    def __init__(self, name, question_count, section_weights=PCEP_SECTION_WEIGHTS,
+                 time_limit=None, passing_score=70):
+        self.name = name
+        self.question_count = question_count
+        self.section_weights = section_weights
+        self.time_limit = time_limit
+        self.passing_score = passing_score
+
+    def quotas(self):
+        """
+        Split question_count across the sections by weight.
+
+        Uses largest remainders, so the quotas always add up to question_count
+        (30 questions at 18/29/25/28% gives 5/9/8/8).
+
+        Returns:
+            dict: {section: number of questions}
+        """
+        total = sum(self.section_weights.values())
+        exact = {section: self.question_count * weight / total
+                 for section, weight in self.section_weights.items()}
+        quotas = {section: int(share) for section, share in exact.items()}
+        leftover = self.question_count - sum(quotas.values())
+        by_remainder = sorted(exact, key=lambda section: exact[section] - quotas[section], reverse=True)
+        for section in by_remainder[:leftover]:
+            quotas[section] += 1
+        return quotas
+
+
+# Quick practice exam from the main menu
+PRACTICE_EXAM = Blueprint("PCEP PRACTICE EXAM", 20)
+
+# The real PCEP-30-0x format: 30 questions in 40 minutes
+PCEP_EXAM = Blueprint("PCEP EXAM SIMULATION", 30, time_limit=40 * 60)
+
+
+def assemble(bank, blueprint, seed=None, posterior=None):
+    """
+    Draw an exam that follows a blueprint's section quotas.
+
+    Questions are grouped by section in blueprint order, and no two of them
+    are near duplicates (even across sections). When a section has fewer
+    unused near-duplicate clusters than its quota, the rest is drawn from
+    the other sections.
+
+    Args:
+        bank (QuestionBank): Question pool indexed by section
+        blueprint (Blueprint): Exam shape
+        seed: Random seed for a reproducible exam (None for a fresh one)
+        posterior (adaptive.TopicPosterior): Weight each section's draw
+            towards weak topics; uniform within each section when None
+
+    Returns:
+        list: Questions (question_bank.Question)
+
+    Raises:
+        ValueError: If the bank has fewer distinct (non near-duplicate)
+            questions than the blueprint needs
+    """
+    clusters = bank.clusters()
+    if len(set(clusters)) < blueprint.question_count:
+        raise ValueError("Not enough questions for this exam")
+    rng = random.Random(seed) if seed is not None else random
+
+    questions = []
+    taken = set()
+    shortfall = 0
+    for section, quota in blueprint.quotas().items():
+        # Earlier sections may have used up clusters this one shares
+        free = {clusters[qid] for qid in bank.ids(section=section)} - taken
+        count = min(quota, len(free))
+        shortfall += quota - count
+        if posterior is not None:
+            questions.extend(adaptive.sample_weighted(bank, posterior, count, rng,
+                                                      taken_clusters=taken, section=section))
+        else:
+            questions.extend(bank.sample(count, rng=rng, taken_clusters=taken, section=section))
+
+    if shortfall:
+        questions.extend(bank.sample(shortfall, rng=rng, taken_clusters=taken))
+    return questions
@@ -0,0 +1,168 @@
+"""
+Headless scripted sessions for the PCEP tutor (python_tutor.py --script).
+
+Runs the real menus, quizzes and exams with answers read from a script
+instead of the keyboard, and writes one JSON result per session. Screens are
+discarded, progress stays in memory (MemoryProgressStore) and no answer log
+is written, so sessions are independent and leave no files behind.
+
+Script formats:
+
+- Plain text: every line is one answer, exactly what a learner would type
+  at a prompt ("Press Enter" pauses are skipped). The whole input is one
+  session.
+- JSON Lines: one session per line, e.g.
+  {"id": "s1", "seed": 7, "answers": ["x", "A", "C", ...]}
+  The optional seed makes the session's exams reproducible.
+
+The question bank and the code execution workers are built once and shared
+by every session in a run, so thousands of sessions cost little more than
+the answers themselves.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+
+import progress_store
+import tutor_io
+
+
+def _session_result(session_id, tutor, io, status, error, elapsed):
+    """Build the JSON-serializable result of one session"""
+    result = {
+        "id": session_id,
+        "status": status,
+        "answers_used": io.asked,
+        "seconds": round(elapsed, 4),
+        "events": io.records,
+        "progress": {
+            "current_lesson": tutor.current_lesson,
+            "completed_lessons": sorted(tutor.completed_lessons),
+            "quiz_scores": tutor.quiz_scores,
+            "reviews_scheduled": len(tutor.reviews),
+        },
+    }
+    if error is not None:
+        result["error"] = error
+    return result
+
+
+class HeadlessRunner:
+    """
+    Replays scripted sessions against fresh tutors.
+
+    Args:
+        tutor_class: PythonTutor (passed in to avoid importing the script twice)
+    """
+
+    def __init__(self, tutor_class):
+        self.tutor_class = tutor_class
+        self._bank = None
+        self._executor = None
+        self._devnull = open(os.devnull, 'w')
+
+    def run_session(self, answers, session_id=None, seed=None):
+        """
+        Run one session until the script quits or runs out of answers.
+
+        Args:
+            answers (iterable): Answer strings in prompt order
+            session_id: Identifier copied into the result
+            seed (int): Exam seed for reproducible question selection
+
+        Returns:
+            dict: id, status ("quit", "script-ended" or "error"), answers
+                used, events (quiz/exam/review/exercise reports) and the
+                final progress
+        """
+        io = tutor_io.ScriptedIO(answers)
+        status, error = "quit", None
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(self._devnull):
+            tutor = self.tutor_class(progress_store.MemoryProgressStore(), io=io, answer_log_path=None)
+            tutor.exam_seed = seed
+            if self._bank is not None:
+                tutor._practice_questions = self._bank
+            tutor._executor = self._executor
+            try:
+                tutor.run()
+            except EOFError:
+                status = "script-ended"
+            except Exception as e:  # NOSONAR - one broken script must not stop the batch
+                status, error = "error", f"{type(e).__name__}: {e}"
+            # Keep what this session built for the next one
+            self._bank = tutor._practice_questions
+            self._executor = tutor._executor
+        return _session_result(session_id, tutor, io, status, error, time.perf_counter() - start)
+
+    def run_stream(self, stream, out):
+        """
+        Run every session in a script and write one JSON line per session.
+
+        Args:
+            stream: Text stream with a plain-text or JSON Lines script
+            out: Text stream the results are written to
+
+        Returns:
+            int: Number of sessions that ended in an error
+        """
+        first = stream.readline()
+        errors = 0
+        if first.lstrip().startswith("{"):
+            lines = (line for line in _chain(first, stream) if line.strip())
+            for number, line in enumerate(lines, 1):
+                try:
+                    session = json.loads(line)
+                    result = self.run_session(session.get("answers", []), session.get("id", number),
+                                              session.get("seed"))
+                except (ValueError, AttributeError) as e:
+                    result = {"id": number, "status": "error", "error": f"bad session line: {e}"}
+                errors += result["status"] == "error"
+                out.write(json.dumps(result) + "\n")
+        else:
+            answers = (line.rstrip("\r\n") for line in _chain(first, stream))
+            result = self.run_session(answers, session_id=1)
+            errors += result["status"] == "error"
+            out.write(json.dumps(result) + "\n")
+        out.flush()
+        return errors
+
+    def close(self):
+        """Stop the shared execution workers"""
+        if self._executor is not None:
+            self._executor.close()
+        self._devnull.close()
+
+
+def _chain(first, stream):
+    """Yield an already-read first line, then the rest of the stream"""
+    if first:
+        yield first
+    yield from stream
+
+
+def run(tutor_class, script_path, results_path=None):
+    """
+    Run a script file ("-" for stdin) and write the results.
+
+    Args:
+        tutor_class: PythonTutor
+        script_path (str): Script file, or "-" to read stdin
+        results_path (str): JSON Lines results file (default: stdout)
+
+    Returns:
+        int: Exit status (1 if any session ended in an error)
+    """
+    runner = HeadlessRunner(tutor_class)
+    with contextlib.ExitStack() as stack:
+        if script_path == "-":
+            stream = sys.stdin
+        else:
+            stream = stack.enter_context(open(script_path, 'r', encoding='utf-8'))
+        out = stack.enter_context(open(results_path, 'w')) if results_path else sys.stdout
+        stack.callback(runner.close)
+        errors = runner.run_stream(stream, out)
+    return 1 if errors else 0
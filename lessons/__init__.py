@@ -0,0 +1,80 @@
+"""
+PCEP tutor lessons, loaded on demand.
+
+Each lesson lives in its own module (lesson_01 ... lesson_15) defining a
+LESSON dict with:
+- title: Lesson name
+- section: PCEP exam section reference
+- content: Detailed explanation with key concepts and theory
+- example: Real-world Python code examples
+- exercise: Guided practice with hint and validation checker
+- quiz: Multiple-choice questions to test understanding
+
+Only LESSON_INDEX (titles and sections) is needed to draw the main menu, so the
+large content strings and check lambdas are imported the first time a lesson
+is opened.
+"""
+
+import importlib
+
+
+# Constants for duplicate literals in quiz options (reduces code duplication)
+OPTION_A_YES = "A) Yes"
+OPTION_B_NO = "B) No"
+OPTION_D_ERROR = "D) Error"
+
+
+# (module, title, section) for every lesson, in menu order
+LESSON_INDEX = (
+    ("lesson_01", "Python Fundamentals & Compilation", "PCEP Section 1"),
+    ("lesson_02", "Literals, Variables & Numeric Types", "PCEP Section 2.1"),
+    ("lesson_03", "Operators & Expressions", "PCEP Section 2.2"),
+    ("lesson_04", "Strings & Basic I/O", "PCEP Section 2.3"),
+    ("lesson_05", "Boolean Values & Comparison Operators", "PCEP Section 3.1"),
+    ("lesson_06", "Conditional Statements (if/elif/else)", "PCEP Section 3.2"),
+    ("lesson_07", "Loops: while and for", "PCEP Section 3.3"),
+    ("lesson_08", "Lists and List Operations", "PCEP Section 3.4"),
+    ("lesson_09", "Logical & Bitwise Operations", "PCEP Section 3.5"),
+    ("lesson_10", "Functions - Defining & Calling", "PCEP Section 4.1"),
+    ("lesson_11", "Tuples - Immutable Sequences", "PCEP Section 4.2"),
+    ("lesson_12", "Dictionaries - Key-Value Pairs", "PCEP Section 4.3"),
+    ("lesson_13", "Modules and Packages", "PCEP Section 4.4"),
+    ("lesson_14", "Exception Handling", "PCEP Bonus Topic"),
+    ("lesson_15", "PCEP Bonus Questions - Study Guide Edition", "PCEP Bonus"),
+)
+
+
+class LessonRegistry:
+    """
+    Sequence of lessons that imports each lesson body on first access.
+
+    Indexing returns the full lesson dict (loading its module if needed);
+    headers() only uses the index, so the menu never loads lesson bodies.
+    """
+
+    def __init__(self, index=LESSON_INDEX):
+        self._index = index
+        self._loaded = {}
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, lesson_num):
+        lesson = self._loaded.get(lesson_num)
+        if lesson is None:
+            module_name = self._index[lesson_num][0]
+            lesson = importlib.import_module(f"{__name__}.{module_name}").LESSON
+            self._loaded[lesson_num] = lesson
+        return lesson
+
+    def __iter__(self):
+        for lesson_num in range(len(self._index)):
+            yield self[lesson_num]
+
+    def headers(self):
+        """Return (title, section) pairs for every lesson without loading bodies"""
+        return [(title, section) for _, title, section in self._index]
+
+    def is_loaded(self, lesson_num):
+        """Return True if the lesson body has already been imported"""
+        return lesson_num in self._loaded
@@ -0,0 +1,83 @@
+"""Lesson 1: Python Fundamentals & Compilation"""
+
+# SECTION 1: Introduction to Python and Computer Programming
+
+from lessons import OPTION_A_YES, OPTION_B_NO
+
+
+LESSON = {
+    "title": "Python Fundamentals & Compilation",
+    "section": "PCEP Section 1",
+    "content": """
+PCEP EXAM TOPIC: Understanding Python basics, compilation vs interpretation
+
+Python is an interpreted, high-level programming language created by Guido van Rossum.
+
+Key Concepts for PCEP:
+- Python is INTERPRETED (not compiled to machine code before running)
+- CPython is the reference implementation (written in C)
+- Python code is compiled to bytecode (.pyc files), then interpreted
+- .pyc files are stored in __pycache__ directory
+- Python is:
+  * Multi-paradigm (procedural, OOP, functional)
+  * Dynamically typed
+  * Case-sensitive
+  * Uses indentation for code blocks (usually 4 spaces)
+
+Compilation vs Interpretation:
+- Compiled: Source → Machine code → Execution (C, C++)
+- Interpreted: Source → Executed line by line (Python, JavaScript)
+- Python: Hybrid (source → bytecode → interpretation)
+                """,
+    "example": """
+# Python basics - case sensitivity
+Name = "Alice"
+name = "Bob"
+print(Name)  # Alice
+print(name)  # Bob - different variable!
+
+# Indentation is mandatory
+if True:
+    print("This is indented")  # 4 spaces
+    print("This too")
+# print("This would cause IndentationError if uncommented")
+
+# Comments
+# Single line comment
+x = 5  # Inline comment
+\"\"\"
+Multi-line comment
+or docstring
+\"\"\"
+
+# Python is dynamically typed
+var = 10        # int
+var = "hello"   # now it's str - no error!
+print(var)
+                """,
+    "exercise": {
+        "description": "Create a variable 'python_version' and assign it the value 3. Then reassign it to 'PCEP'",
+        "hint": "python_version = 3, then python_version = 'PCEP'",
+        "check": lambda code: "python_version" in code and "=" in code
+    },
+    "quiz": [
+        {
+            "question": "Python is primarily a(n) _____ language.",
+            "options": ["A) Compiled", "B) Interpreted", "C) Assembly", "D) Machine"],
+            "answer": "B",
+            "explanation": "Python is an interpreted language. Code is executed by an interpreter."
+        },
+        {
+            "question": "What is stored in __pycache__ directory?",
+            "options": ["A) Source code", "B) Documentation", "C) Bytecode files (.pyc)", "D) Log files"],
+            "answer": "C",
+            "explanation": "Python compiles source code to bytecode (.pyc) files stored in __pycache__."
+        },
+        {
+            "question": "Is Python case-sensitive?",
+            "options": [OPTION_A_YES, OPTION_B_NO, "C) Only for variables", "D) Only for functions"],
+            "answer": "A",
+            "explanation": "Python is case-sensitive. 'Variable' and 'variable' are different identifiers."
+        }
+    ]
+}
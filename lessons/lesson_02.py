@@ -0,0 +1,86 @@
+"""Lesson 2: Literals, Variables & Numeric Types"""
+
+# SECTION 2: Data Types, Variables, Basic I/O, Operators
+
+
+LESSON = {
+    "title": "Literals, Variables & Numeric Types",
+    "section": "PCEP Section 2.1",
+    "content": """
+PCEP EXAM TOPIC: Literals, variables, and numeric data types
+
+LITERALS - fixed values in code:
+- Integer: 42, -10, 0
+- Float: 3.14, -0.5, 4. (trailing dot is valid!)
+- Scientific notation: 3e8 (3 × 10^8), 1.5e-3 (0.0015)
+- Octal: 0o123 (prefix 0o)
+- Hexadecimal: 0x1A (prefix 0x)
+- String: "hello", 'world', '''multi
+  line'''
+- Boolean: True, False (capitalized!)
+- None: represents absence of value
+
+NUMERIC TYPES:
+- int: unlimited precision (no overflow!)
+- float: IEEE 754 double precision
+- complex: 3+4j (j for imaginary part)
+
+VARIABLES:
+- Names: letters, digits, underscore (can't start with digit)
+- Convention: lowercase_with_underscores (snake_case)
+- Reserved keywords cannot be used as names
+                """,
+    "example": """
+# Different number formats
+decimal = 100
+octal = 0o144       # 100 in octal
+hexadecimal = 0x64  # 100 in hex
+print(decimal, octal, hexadecimal)  # All print 100
+
+# Floats
+f1 = 3.14
+f2 = 4.           # Valid! Same as 4.0
+f3 = .5           # Same as 0.5
+scientific = 3e2  # 300.0
+print(f1, f2, f3, scientific)
+
+# Underscores for readability (Python 3.6+)
+million = 1_000_000
+print(million)  # 1000000
+
+# Multiple assignment
+a = b = c = 0
+x, y, z = 1, 2, 3
+print(x, y, z)
+
+# Type checking
+print(type(42))      # <class 'int'>
+print(type(3.14))    # <class 'float'>
+print(type(True))    # <class 'bool'>
+                """,
+    "exercise": {
+        "description": "Create an integer, float, and boolean variable. Use scientific notation for the float (e.g., 2e3)",
+        "hint": "num = 10, sci = 2e3, flag = True",
+        "check": lambda code: "=" in code and "e" in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What is the value of 0o12 in decimal?",
+            "options": ["A) 12", "B) 10", "C) 8", "D) 14"],
+            "answer": "B",
+            "explanation": "0o12 is octal. 1×8 + 2 = 10 in decimal."
+        },
+        {
+            "question": "Which is a valid float literal?",
+            "options": ["A) 4.", "B) 4,0", "C) 4f", "D) 4_f"],
+            "answer": "A",
+            "explanation": "4. is valid (equals 4.0). Python uses dots, not commas for decimals."
+        },
+        {
+            "question": "What does 2e3 equal?",
+            "options": ["A) 6", "B) 8", "C) 2000", "D) 23"],
+            "answer": "C",
+            "explanation": "2e3 means 2 × 10^3 = 2000"
+        }
+    ]
+}
@@ -0,0 +1,89 @@
+"""Lesson 3: Operators & Expressions"""
+
+
+LESSON = {
+    "title": "Operators & Expressions",
+    "section": "PCEP Section 2.2",
+    "content": """
+PCEP EXAM TOPIC: Operators and their priorities
+
+ARITHMETIC OPERATORS (highest to lowest priority):
+1. ** (exponentiation) - right associative!
+2. +x, -x (unary plus, minus)
+3. *, /, //, % (multiply, divide, floor division, modulo)
+4. +, - (addition, subtraction)
+
+IMPORTANT:
+- ** is right associative: 2**3**2 = 2**(3**2) = 512
+- // is floor division: 7 // 2 = 3
+- % is modulo (remainder): 7 % 3 = 1
+- / always returns float: 6 / 3 = 2.0
+
+SHORTCUT OPERATORS:
+x += 1  # x = x + 1
+x -= 2  # x = x - 2
+x *= 3  # x = x * 3
+x /= 4  # x = x / 4
+x //= 5 # x = x // 5
+x %= 6  # x = x % 6
+x **= 2 # x = x ** 2
+
+TYPE CONVERSIONS:
+int(x), float(x), str(x)
+                """,
+    "example": """
+# Operator priority
+print(2 + 3 * 4)      # 14 (not 20)
+print((2 + 3) * 4)    # 20
+print(2 ** 3 ** 2)    # 512 (right associative!)
+print((2 ** 3) ** 2)  # 64
+
+# Division types
+print(7 / 2)    # 3.5 (float division)
+print(7 // 2)   # 3 (floor division)
+print(7 % 2)    # 1 (remainder/modulo)
+print(-7 // 2)  # -4 (floors toward negative infinity!)
+
+# Unary operators
+x = 5
+print(+x)  # 5
+print(-x)  # -5
+
+# Shortcut operators
+counter = 10
+counter += 5  # Now 15
+counter *= 2  # Now 30
+print(counter)
+
+# Type conversion
+print(int(3.9))      # 3 (truncates)
+print(int("42"))     # 42
+print(float("3.14")) # 3.14
+print(str(100))      # "100"
+                """,
+    "exercise": {
+        "description": "Calculate: 10 // 3 and 10 % 3. Store results in variables 'quotient' and 'remainder'",
+        "hint": "quotient = 10 // 3, remainder = 10 % 3",
+        "check": lambda code: "//" in code and "%" in code
+    },
+    "quiz": [
+        {
+            "question": "What is 2 ** 3 ** 2?",
+            "options": ["A) 64", "B) 512", "C) 256", "D) 128"],
+            "answer": "B",
+            "explanation": "** is right associative: 2**(3**2) = 2**9 = 512"
+        },
+        {
+            "question": "What is -11 // 2?",
+            "options": ["A) -5", "B) -5.5", "C) -6", "D) -4"],
+            "answer": "C",
+            "explanation": "Floor division floors toward negative infinity: -11 // 2 = -6"
+        },
+        {
+            "question": "What does x *= 3 mean?",
+            "options": ["A) x = 3", "B) x = x * 3", "C) x = x + 3", "D) x = 3 * x"],
+            "answer": "B",
+            "explanation": "x *= 3 is shorthand for x = x * 3"
+        }
+    ]
+}
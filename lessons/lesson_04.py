@@ -0,0 +1,99 @@
+"""Lesson 4: Strings & Basic I/O"""
+
+from lessons import OPTION_D_ERROR
+
+
+LESSON = {
+    "title": "Strings & Basic I/O",
+    "section": "PCEP Section 2.3",
+    "content": """
+PCEP EXAM TOPIC: String operations and input/output
+
+STRINGS:
+- Enclosed in quotes: "hello", 'world'
+- Triple quotes for multiline: '''text''' or \"\"\"text\"\"\"
+- Escape sequences: \\n (newline), \\t (tab), \\\\ (backslash), \\' \\"
+- String concatenation: "hello" + " " + "world"
+- String repetition: "Hi" * 3 = "HiHiHi"
+- Indexing: s[0] (first char), s[-1] (last char)
+- Slicing: s[start:end:step]
+- Immutable: cannot change individual characters
+
+STRING METHODS (important for PCEP):
+- len(s): length
+- s.upper(), s.lower(): case conversion
+- s.strip(): remove whitespace from ends
+- s.replace(old, new): replace substring
+- s.split(): split into list
+- s.find(sub): find substring (-1 if not found)
+- s.isdigit(), s.isalpha(), s.isalnum(): check content
+
+INPUT/OUTPUT:
+- print(*values, sep=' ', end='\\n'): output
+- input(prompt): read string from user (always returns string!)
+                """,
+    "example": """
+# String basics
+s = "Python"
+print(s[0])      # P (first character)
+print(s[-1])     # n (last character)
+print(s[0:3])    # Pyt (slice: index 0, 1, 2)
+print(s[::-1])   # nohtyP (reverse)
+
+# String operations
+print("Hello" + " " + "World")  # Concatenation
+print("=" * 20)                 # Repetition
+
+# Escape sequences
+print("Line 1\\nLine 2")  # Newline
+print("Column1\\tColumn2") # Tab
+
+# String methods
+text = "  Hello World  "
+print(text.strip())       # "Hello World"
+print(text.upper())       # "  HELLO WORLD  "
+print(text.replace("World", "Python"))  # "  Hello Python  "
+
+words = "apple,banana,cherry"
+print(words.split(","))   # ['apple', 'banana', 'cherry']
+
+# Type checking
+print("123".isdigit())    # True
+print("abc".isalpha())    # True
+print("abc123".isalnum()) # True
+
+# Input (always returns string!)
+# name = input("Enter your name: ")
+# age = int(input("Enter your age: "))  # Convert to int
+
+# Print with custom separator and end
+print(1, 2, 3, sep="-")           # 1-2-3
+print("Hello", end=" ")
+print("World")                     # Hello World (no newline between)
+                """,
+    "exercise": {
+        "description": "Create a string 'pcep' and print it reversed and in uppercase",
+        "hint": "s = 'pcep', print(s[::-1].upper())",
+        "check": lambda code: "[::-1]" in code or ".upper()" in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What does 'Hi' * 3 produce?",
+            "options": ["A) HiHiHi", "B) Hi Hi Hi", "C) Hi3", OPTION_D_ERROR],
+            "answer": "A",
+            "explanation": "String * number repeats the string that many times with no spaces."
+        },
+        {
+            "question": "What does input() return?",
+            "options": ["A) Integer", "B) Float", "C) String", "D) Depends on input"],
+            "answer": "C",
+            "explanation": "input() always returns a string, even if user enters numbers."
+        },
+        {
+            "question": "What is 'Python'[-1]?",
+            "options": ["A) P", "B) n", "C) o", OPTION_D_ERROR],
+            "answer": "B",
+            "explanation": "Negative indices count from the end. -1 is the last character: 'n'"
+        }
+    ]
+}
@@ -0,0 +1,97 @@
+"""Lesson 5: Boolean Values & Comparison Operators"""
+
+# SECTION 3: Boolean, Control Flow, Lists, Logic
+
+
+LESSON = {
+    "title": "Boolean Values & Comparison Operators",
+    "section": "PCEP Section 3.1",
+    "content": """
+PCEP EXAM TOPIC: Boolean values, relational operators, logic
+
+BOOLEAN VALUES:
+- True, False (must be capitalized!)
+- Result of comparisons and logical operations
+
+COMPARISON OPERATORS:
+- == (equal to) - NOT = (which is assignment!)
+- != (not equal to)
+- > (greater than)
+- < (less than)
+- >= (greater than or equal)
+- <= (less than or equal)
+
+LOGICAL OPERATORS (priority: not > and > or):
+- not: logical negation
+- and: True if both True
+- or: True if at least one True
+
+SHORT-CIRCUIT EVALUATION:
+- and: stops at first False
+- or: stops at first True
+
+TRUTHY/FALSY VALUES:
+Falsy: False, 0, 0.0, "", [], {}, None
+Truthy: Everything else
+                """,
+    "example": """
+# Boolean basics
+print(True)          # True
+print(type(True))    # <class 'bool'>
+print(bool(1))       # True
+print(bool(0))       # False
+print(bool(""))      # False
+print(bool("text"))  # True
+
+# Comparison operators
+print(5 == 5)   # True
+print(5 != 3)   # True
+print(5 > 3)    # True
+print(5 <= 5)   # True
+print("a" < "b")  # True (lexicographic comparison)
+
+# Logical operators
+print(True and True)   # True
+print(True and False)  # False
+print(True or False)   # True
+print(not True)        # False
+
+# Operator priority: not > and > or
+print(True or True and False)  # True (and first, then or)
+# Equivalent to: True or (True and False) = True or False = True
+
+# Short-circuit evaluation
+x = 10
+print(x > 5 or x < 0)  # True (doesn't check x < 0)
+print(x > 20 and print("Hi"))  # False (doesn't print)
+
+# Chaining comparisons
+x = 5
+print(1 < x < 10)  # True (equivalent to: 1 < x and x < 10)
+                """,
+    "exercise": {
+        "description": "Create a boolean expression checking if a number is between 10 and 20 (inclusive)",
+        "hint": "result = 10 <= num <= 20",
+        "check": lambda code: "<=" in code and ("and" in code.lower() or code.count("<=") >= 2)
+    },
+    "quiz": [
+        {
+            "question": "What is the result of: True or True and False?",
+            "options": ["A) True", "B) False", "C) Error", "D) None"],
+            "answer": "A",
+            "explanation": "'and' has higher priority than 'or': True or (True and False) = True or False = True"
+        },
+        {
+            "question": "Which is falsy in Python?",
+            "options": ["A) []", "B) 'False'", "C) 1", "D) [0]"],
+            "answer": "A",
+            "explanation": "Empty list [] is falsy. String 'False' is truthy (non-empty string)."
+        },
+        {
+            "question": "What does 5 == 5.0 return?",
+            "options": ["A) True", "B) False", "C) Error", "D) 1"],
+            "answer": "A",
+            "explanation": "== compares values, not types. 5 and 5.0 have equal values."
+        }
+    ]
+}
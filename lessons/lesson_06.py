@@ -0,0 +1,101 @@
+"""Lesson 6: Conditional Statements (if/elif/else)"""
+
+from lessons import OPTION_D_ERROR
+
+
+LESSON = {
+    "title": "Conditional Statements (if/elif/else)",
+    "section": "PCEP Section 3.2",
+    "content": """
+PCEP EXAM TOPIC: Conditional execution
+
+SYNTAX:
+if condition:
+    # code block (must be indented!)
+elif another_condition:
+    # code block
+else:
+    # code block
+
+IMPORTANT:
+- Colon (:) is REQUIRED after conditions
+- Indentation is MANDATORY (usually 4 spaces)
+- elif (not "else if")
+- Can have multiple elif blocks
+- else is optional
+
+CONDITIONAL EXPRESSION (ternary operator):
+value_if_true if condition else value_if_false
+
+Example: max_val = a if a > b else b
+                """,
+    "example": """
+# Basic if statement
+age = 18
+if age >= 18:
+    print("You are an adult")
+
+# if-elif-else chain
+score = 85
+if score >= 90:
+    grade = "A"
+elif score >= 80:
+    grade = "B"
+elif score >= 70:
+    grade = "C"
+else:
+    grade = "F"
+print(f"Grade: {grade}")
+
+# Nested conditions
+x = 10
+if x > 0:
+    if x % 2 == 0:
+        print("Positive even number")
+    else:
+        print("Positive odd number")
+else:
+    print("Non-positive number")
+
+# Conditional expression (ternary)
+a, b = 5, 10
+max_value = a if a > b else b
+print(f"Max: {max_value}")  # Max: 10
+
+# Multiple conditions
+temperature = 75
+is_sunny = True
+if temperature > 70 and is_sunny:
+    print("Great day for the beach!")
+
+# Checking membership
+fruits = ["apple", "banana"]
+if "apple" in fruits:
+    print("We have apples!")
+                """,
+    "exercise": {
+        "description": "Write an if-elif-else chain that categorizes a number as positive, negative, or zero",
+        "hint": "if num > 0: ... elif num < 0: ... else: ...",
+        "check": lambda code: 'if' in code.lower() and 'elif' in code.lower() and 'else' in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What comes after 'if condition'?",
+            "options": ["A) Colon :", "B) Semicolon ;", "C) Brace {", "D) Nothing"],
+            "answer": "A",
+            "explanation": "In Python, if statements must end with a colon :"
+        },
+        {
+            "question": "What is 10 if 5 > 3 else 20?",
+            "options": ["A) 10", "B) 20", "C) True", OPTION_D_ERROR],
+            "answer": "A",
+            "explanation": "Since 5 > 3 is True, it returns 10"
+        },
+        {
+            "question": "Which keyword is used for additional conditions?",
+            "options": ["A) elseif", "B) else if", "C) elif", "D) elsif"],
+            "answer": "C",
+            "explanation": "Python uses 'elif' (not 'elseif' or 'else if')"
+        }
+    ]
+}
@@ -0,0 +1,116 @@
+"""Lesson 7: Loops: while and for"""
+
+
+LESSON = {
+    "title": "Loops: while and for",
+    "section": "PCEP Section 3.3",
+    "content": """
+PCEP EXAM TOPIC: Iteration with loops
+
+WHILE LOOP:
+while condition:
+    # code block
+    # update condition!
+else:  # optional
+    # executes if loop completes normally (no break)
+
+FOR LOOP:
+for variable in sequence:
+    # code block
+else:  # optional
+    # executes if loop completes normally
+
+RANGE FUNCTION:
+- range(stop): 0 to stop-1
+- range(start, stop): start to stop-1
+- range(start, stop, step): with custom step
+
+LOOP CONTROL:
+- break: exit loop immediately
+- continue: skip rest of current iteration
+- pass: do nothing (placeholder)
+
+IMPORTANT: else clause runs only if loop completes without break!
+                """,
+    "example": """
+# while loop
+count = 0
+while count < 5:
+    print(count)
+    count += 1
+# Prints: 0, 1, 2, 3, 4
+
+# while with else
+i = 0
+while i < 3:
+    print(i)
+    i += 1
+else:
+    print("Loop completed")
+
+# for loop with range
+for i in range(5):
+    print(i)  # 0, 1, 2, 3, 4
+
+for i in range(2, 7):
+    print(i)  # 2, 3, 4, 5, 6
+
+for i in range(0, 10, 2):
+    print(i)  # 0, 2, 4, 6, 8
+
+# for loop with sequence
+fruits = ["apple", "banana", "cherry"]
+for fruit in fruits:
+    print(fruit)
+
+# break statement
+for i in range(10):
+    if i == 5:
+        break
+    print(i)  # 0, 1, 2, 3, 4
+
+# continue statement
+for i in range(5):
+    if i == 2:
+        continue  # Skip 2
+    print(i)  # 0, 1, 3, 4
+
+# else with break
+for i in range(5):
+    if i == 3:
+        break
+    print(i)
+else:
+    print("Completed")  # Won't print (break was used)
+
+# Nested loops
+for i in range(3):
+    for j in range(2):
+        print(f"({i},{j})")
+                """,
+    "exercise": {
+        "description": "Write a for loop that prints even numbers from 0 to 10 using range",
+        "hint": "for i in range(0, 11, 2): print(i)",
+        "check": lambda code: 'for' in code.lower() and 'range' in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What does range(5) produce?",
+            "options": ["A) 1,2,3,4,5", "B) 0,1,2,3,4", "C) 0,1,2,3,4,5", "D) 1,2,3,4"],
+            "answer": "B",
+            "explanation": "range(5) generates numbers from 0 to 4 (5 is excluded)"
+        },
+        {
+            "question": "What does 'continue' do?",
+            "options": ["A) Exit loop", "B) Skip to next iteration", "C) Restart loop", "D) Pause loop"],
+            "answer": "B",
+            "explanation": "'continue' skips the rest of the current iteration and goes to the next one"
+        },
+        {
+            "question": "When does the 'else' clause of a loop execute?",
+            "options": ["A) Always", "B) If loop completes without break", "C) If break is used", "D) Never"],
+            "answer": "B",
+            "explanation": "Loop's 'else' executes only if loop completes normally (no break)"
+        }
+    ]
+}
@@ -0,0 +1,115 @@
+"""Lesson 8: Lists and List Operations"""
+
+from lessons import OPTION_D_ERROR
+
+
+LESSON = {
+    "title": "Lists and List Operations",
+    "section": "PCEP Section 3.4",
+    "content": """
+PCEP EXAM TOPIC: Lists - creation, indexing, slicing, methods
+
+LISTS:
+- Ordered, mutable sequences
+- Created with square brackets: [1, 2, 3]
+- Can contain mixed types: [1, "hello", 3.14]
+- Zero-indexed: list[0] is first element
+- Negative indexing: list[-1] is last element
+
+SLICING: list[start:end:step]
+- list[1:4]: elements at index 1, 2, 3
+- list[:3]: first 3 elements
+- list[2:]: from index 2 to end
+- list[::-1]: reverse list
+- list[::2]: every 2nd element
+
+LIST METHODS (important for PCEP):
+- append(x): add x to end
+- insert(i, x): add x at index i
+- remove(x): remove first occurrence of x
+- pop(i): remove and return element at index i (default: last)
+- index(x): return index of first x
+- count(x): count occurrences of x
+- sort(): sort in place
+- reverse(): reverse in place
+- clear(): remove all elements
+
+OPERATORS:
+- len(list): get length
+- x in list: check membership
+- list1 + list2: concatenation
+- list * n: repetition
+                """,
+    "example": """
+# Creating lists
+numbers = [1, 2, 3, 4, 5]
+mixed = [1, "hello", 3.14, True]
+empty = []
+
+# Indexing
+print(numbers[0])   # 1 (first)
+print(numbers[-1])  # 5 (last)
+print(numbers[2])   # 3
+
+# Slicing
+print(numbers[1:4])    # [2, 3, 4]
+print(numbers[:3])     # [1, 2, 3]
+print(numbers[2:])     # [3, 4, 5]
+print(numbers[::-1])   # [5, 4, 3, 2, 1] (reverse)
+print(numbers[::2])    # [1, 3, 5] (every 2nd)
+
+# Modifying lists
+numbers[0] = 10
+print(numbers)  # [10, 2, 3, 4, 5]
+
+# List methods
+fruits = ["apple", "banana"]
+fruits.append("cherry")      # ["apple", "banana", "cherry"]
+fruits.insert(0, "mango")    # ["mango", "apple", "banana", "cherry"]
+fruits.remove("apple")       # ["mango", "banana", "cherry"]
+last = fruits.pop()          # Returns "cherry", list is ["mango", "banana"]
+
+print(len(fruits))           # 2
+print("mango" in fruits)     # True
+
+# List operations
+list1 = [1, 2]
+list2 = [3, 4]
+combined = list1 + list2     # [1, 2, 3, 4]
+repeated = list1 * 3         # [1, 2, 1, 2, 1, 2]
+
+# Sorting
+nums = [3, 1, 4, 1, 5]
+nums.sort()                  # [1, 1, 3, 4, 5]
+nums.reverse()               # [5, 4, 3, 1, 1]
+
+# List iteration
+for item in fruits:
+    print(item)
+                """,
+    "exercise": {
+        "description": "Create a list with 5 numbers, add a 6th using append, and print it reversed using slicing",
+        "hint": "nums = [1,2,3,4,5], nums.append(6), print(nums[::-1])",
+        "check": lambda code: "append" in code.lower() and "[::-1]" in code
+    },
+    "quiz": [
+        {
+            "question": "What is [1,2,3][1:3]?",
+            "options": ["A) [1,2]", "B) [2,3]", "C) [1,2,3]", "D) [3]"],
+            "answer": "B",
+            "explanation": "[1:3] gets elements at index 1 and 2: [2, 3]"
+        },
+        {
+            "question": "What does list.pop() return?",
+            "options": ["A) First element", "B) Last element", "C) Nothing", "D) The list"],
+            "answer": "B",
+            "explanation": "pop() without argument removes and returns the last element"
+        },
+        {
+            "question": "What is [1,2,3][::-1]?",
+            "options": ["A) [1,2,3]", "B) [3,2,1]", "C) [2,1,3]", OPTION_D_ERROR],
+            "answer": "B",
+            "explanation": "[::-1] reverses the list: [3, 2, 1]"
+        }
+    ]
+}
@@ -0,0 +1,102 @@
+"""Lesson 9: Logical & Bitwise Operations"""
+
+from lessons import OPTION_D_ERROR
+
+
+LESSON = {
+    "title": "Logical & Bitwise Operations",
+    "section": "PCEP Section 3.5",
+    "content": """
+PCEP EXAM TOPIC: Logical and bitwise operations
+
+LOGICAL OPERATORS (work with boolean values):
+- and: both must be True
+- or: at least one must be True  
+- not: negation
+
+BITWISE OPERATORS (work with bits in integers):
+- & (AND): 1 if both bits are 1
+- | (OR): 1 if at least one bit is 1
+- ^ (XOR): 1 if bits are different
+- ~ (NOT): flip all bits (NOT x = -x-1)
+- << (left shift): multiply by 2^n
+- >> (right shift): divide by 2^n
+
+EXAMPLES:
+12 in binary: 1100
+10 in binary: 1010
+
+12 & 10 = 1000 = 8
+12 | 10 = 1110 = 14
+12 ^ 10 = 0110 = 6
+~12 = -13
+12 << 1 = 24 (multiply by 2)
+12 >> 1 = 6 (divide by 2)
+
+PRIORITY: ~ > << >> > & > ^ > |
+                """,
+    "example": """
+# Logical operators
+print(True and True)   # True
+print(True and False)  # False
+print(True or False)   # True
+print(not True)        # False
+
+# Bitwise operators
+a = 12  # 1100 in binary
+b = 10  # 1010 in binary
+
+print(a & b)   # 8  (1000 in binary)
+print(a | b)   # 14 (1110 in binary)
+print(a ^ b)   # 6  (0110 in binary)
+print(~a)      # -13
+print(a << 1)  # 24 (shift left = multiply by 2)
+print(a >> 1)  # 6  (shift right = divide by 2)
+
+# Practical use: checking if number is even
+num = 42
+if num & 1 == 0:
+    print("Even")  # If last bit is 0, number is even
+
+# Setting flags
+FLAG_READ = 1   # 001
+FLAG_WRITE = 2  # 010
+FLAG_EXEC = 4   # 100
+
+permissions = FLAG_READ | FLAG_WRITE  # 011 = 3
+print(permissions & FLAG_READ)  # Non-zero, has read permission
+print(permissions & FLAG_EXEC)  # 0, no execute permission
+
+# XOR swap (clever trick)
+x, y = 5, 10
+x = x ^ y
+y = x ^ y
+x = x ^ y
+print(x, y)  # 10, 5 (swapped without temp variable!)
+                """,
+    "exercise": {
+        "description": "Use bitwise AND to check if number 17 is odd (hint: check last bit)",
+        "hint": "result = 17 & 1 (if 1, it's odd)",
+        "check": lambda code: "&" in code and ("17" in code or "num" in code.lower())
+    },
+    "quiz": [
+        {
+            "question": "What is 5 & 3?",
+            "options": ["A) 1", "B) 7", "C) 5", "D) 3"],
+            "answer": "A",
+            "explanation": "5=101, 3=011, AND=001=1"
+        },
+        {
+            "question": "What is 8 << 2?",
+            "options": ["A) 16", "B) 4", "C) 32", "D) 2"],
+            "answer": "C",
+            "explanation": "<< 2 shifts left 2 positions = multiply by 4: 8 * 4 = 32"
+        },
+        {
+            "question": "What is ~0?",
+            "options": ["A) 0", "B) -1", "C) 1", OPTION_D_ERROR],
+            "answer": "B",
+            "explanation": "~x equals -x-1, so ~0 = -0-1 = -1"
+        }
+    ]
+}
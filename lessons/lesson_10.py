@@ -0,0 +1,129 @@
+"""Lesson 10: Functions - Defining & Calling"""
+
+# SECTION 4: Functions, Tuples, Dictionaries
+
+from lessons import OPTION_D_ERROR
+
+
+LESSON = {
+    "title": "Functions - Defining & Calling",
+    "section": "PCEP Section 4.1",
+    "content": """
+PCEP EXAM TOPIC: Functions, parameters, return values, scope
+
+FUNCTION DEFINITION:
+def function_name(parameters):
+    \"\"\"Docstring (optional)\"\"\"
+    # function body
+    return value  # optional
+
+KEY CONCEPTS:
+- def keyword starts function definition
+- Parameters are optional
+- return is optional (returns None if omitted)
+- Functions must be defined before calling
+- Docstrings describe function purpose
+
+PARAMETERS:
+- Positional: def func(a, b): ...
+- Default values: def func(a, b=10): ...
+- Keyword arguments: func(a=5, b=10)
+- *args: variable positional arguments (tuple)
+- **kwargs: variable keyword arguments (dict)
+
+SCOPE:
+- Local: variables inside function
+- Global: variables outside functions
+- global keyword: modify global variable inside function
+
+IMPORTANT: None is returned if no return statement
+                """,
+    "example": """
+# Simple function
+def greet():
+    print("Hello!")
+
+greet()  # Call function
+
+# Function with parameters
+def add(a, b):
+    return a + b
+
+result = add(5, 3)
+print(result)  # 8
+
+# Default parameters
+def power(base, exponent=2):
+    return base ** exponent
+
+print(power(5))      # 25 (uses default exponent=2)
+print(power(5, 3))   # 125
+
+# Keyword arguments
+def describe_person(name, age, city):
+    print(f"{name}, {age}, from {city}")
+
+describe_person(age=25, name="Alice", city="NYC")
+
+# Return multiple values (actually a tuple)
+def min_max(numbers):
+    return min(numbers), max(numbers)
+
+minimum, maximum = min_max([1, 5, 3, 9, 2])
+print(minimum, maximum)  # 1 9
+
+# Function returning None
+def no_return():
+    print("I don't return anything")
+
+result = no_return()
+print(result)  # None
+
+# Scope example
+x = 10  # Global
+
+def modify():
+    global x  # Access global x
+    x = 20
+
+modify()
+print(x)  # 20
+
+# Variable arguments
+def sum_all(*numbers):
+    return sum(numbers)
+
+print(sum_all(1, 2, 3, 4))  # 10
+
+def print_info(**kwargs):
+    for key, value in kwargs.items():
+        print(f"{key}: {value}")
+
+print_info(name="Alice", age=25, city="NYC")
+                """,
+    "exercise": {
+        "description": "Create a function 'rectangle_area' that takes width and height, returns their product",
+        "hint": "def rectangle_area(width, height): return width * height",
+        "check": lambda code: 'def' in code.lower() and 'return' in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What does a function return if there's no return statement?",
+            "options": ["A) 0", "B) None", "C) False", OPTION_D_ERROR],
+            "answer": "B",
+            "explanation": "Functions without return statement return None"
+        },
+        {
+            "question": "What keyword is used to access global variable in function?",
+            "options": ["A) global", "B) nonlocal", "C) extern", "D) public"],
+            "answer": "A",
+            "explanation": "'global' keyword allows modifying global variables inside functions"
+        },
+        {
+            "question": "In def func(a, b=5):, what is b?",
+            "options": ["A) Required parameter", "B) Default parameter", "C) Keyword parameter", "D) Variable parameter"],
+            "answer": "B",
+            "explanation": "b=5 is a default parameter (optional, has default value)"
+        }
+    ]
+}
@@ -0,0 +1,123 @@
+"""Lesson 11: Tuples - Immutable Sequences"""
+
+from lessons import OPTION_A_YES, OPTION_B_NO
+
+
+LESSON = {
+    "title": "Tuples - Immutable Sequences",
+    "section": "PCEP Section 4.2",
+    "content": """
+PCEP EXAM TOPIC: Tuples and tuple operations
+
+TUPLES:
+- Ordered, IMMUTABLE sequences
+- Created with parentheses: (1, 2, 3)
+- Or without: 1, 2, 3
+- Single element tuple: (1,) - comma is required!
+- Empty tuple: ()
+- Can contain mixed types
+
+CHARACTERISTICS:
+- Cannot be modified after creation
+- Faster than lists
+- Can be used as dictionary keys (lists cannot!)
+- Indexing and slicing work like lists
+- Can be unpacked: a, b, c = (1, 2, 3)
+
+TUPLE OPERATIONS:
+- len(tuple): get length
+- x in tuple: check membership
+- tuple1 + tuple2: concatenation
+- tuple * n: repetition
+- tuple.count(x): count occurrences
+- tuple.index(x): find index
+
+WHEN TO USE:
+- Data that shouldn't change
+- Return multiple values from function
+- Dictionary keys
+- Faster than lists for read-only data
+                """,
+    "example": """
+# Creating tuples
+coordinates = (10, 20)
+rgb = (255, 128, 0)
+single = (42,)  # Comma is required!
+empty = ()
+
+# Tuple without parentheses
+point = 5, 10, 15
+print(type(point))  # <class 'tuple'>
+
+# Indexing and slicing
+numbers = (1, 2, 3, 4, 5)
+print(numbers[0])     # 1
+print(numbers[-1])    # 5
+print(numbers[1:4])   # (2, 3, 4)
+
+# Tuples are immutable
+# numbers[0] = 10  # TypeError!
+
+# Tuple unpacking
+x, y = (10, 20)
+print(x, y)  # 10 20
+
+# Multiple assignment
+a, b, c = 1, 2, 3
+
+# Swap values
+a, b = b, a
+print(a, b)  # 2 1
+
+# Function returning tuple
+def get_dimensions():
+    return 1920, 1080  # Returns tuple
+
+width, height = get_dimensions()
+
+# Tuple operations
+t1 = (1, 2)
+t2 = (3, 4)
+combined = t1 + t2        # (1, 2, 3, 4)
+repeated = t1 * 3         # (1, 2, 1, 2, 1, 2)
+
+# Tuple methods
+nums = (1, 2, 2, 3, 2)
+print(nums.count(2))      # 3
+print(nums.index(3))      # 3
+
+# Nested tuples
+matrix = ((1, 2), (3, 4), (5, 6))
+print(matrix[1][0])       # 3
+
+# Converting between list and tuple
+my_list = [1, 2, 3]
+my_tuple = tuple(my_list)
+back_to_list = list(my_tuple)
+                """,
+    "exercise": {
+        "description": "Create a tuple with 3 values and unpack it into three variables",
+        "hint": "coords = (10, 20, 30) then x, y, z = coords",
+        "check": lambda code: "," in code and "=" in code
+    },
+    "quiz": [
+        {
+            "question": "How do you create a single-element tuple?",
+            "options": ["A) (1)", "B) (1,)", "C) [1]", "D) 1,"],
+            "answer": "B",
+            "explanation": "(1,) creates a tuple. (1) is just 1 in parentheses. Comma is required!"
+        },
+        {
+            "question": "Can tuples be modified after creation?",
+            "options": [OPTION_A_YES, OPTION_B_NO, "C) Only if nested", "D) Only first element"],
+            "answer": "B",
+            "explanation": "Tuples are immutable - cannot be changed after creation"
+        },
+        {
+            "question": "What does a, b = b, a do?",
+            "options": ["A) Error", "B) Swaps a and b", "C) Sets both to b", "D) Creates tuple"],
+            "answer": "B",
+            "explanation": "Tuple unpacking allows swapping without temporary variable"
+        }
+    ]
+}
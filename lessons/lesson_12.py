@@ -0,0 +1,126 @@
+"""Lesson 12: Dictionaries - Key-Value Pairs"""
+
+from lessons import OPTION_A_YES, OPTION_B_NO
+
+
+LESSON = {
+    "title": "Dictionaries - Key-Value Pairs",
+    "section": "PCEP Section 4.3",
+    "content": """
+PCEP EXAM TOPIC: Dictionaries and dictionary methods
+
+DICTIONARIES:
+- Unordered collection of key-value pairs
+- Created with curly braces: {"key": "value"}
+- Keys must be immutable (strings, numbers, tuples)
+- Keys must be unique
+- Values can be any type
+- Very fast lookups
+
+ACCESSING VALUES:
+- dict[key]: get value (KeyError if key doesn't exist!)
+- dict.get(key, default): safe access (returns default if key missing)
+
+DICTIONARY METHODS (important for PCEP):
+- dict.keys(): get all keys
+- dict.values(): get all values
+- dict.items(): get key-value pairs
+- dict.update(other): merge dictionaries
+- dict.pop(key): remove and return value
+- dict.clear(): remove all items
+- key in dict: check if key exists
+
+OPERATIONS:
+- len(dict): number of items
+- dict[key] = value: add/update
+- del dict[key]: remove item
+                """,
+    "example": """
+# Creating dictionaries
+person = {
+    "name": "Alice",
+    "age": 25,
+    "city": "NYC"
+}
+
+empty_dict = {}
+also_empty = dict()
+
+# Accessing values
+print(person["name"])        # Alice
+print(person.get("age"))     # 25
+print(person.get("email", "N/A"))  # N/A (key doesn't exist)
+
+# Adding/modifying
+person["email"] = "alice@example.com"  # Add
+person["age"] = 26                      # Modify
+
+# Removing items
+age = person.pop("age")      # Remove and return value
+del person["city"]           # Delete key
+# person.clear()             # Remove all items
+
+# Checking membership
+print("name" in person)      # True
+print("age" in person)       # False (we removed it)
+
+# Dictionary methods
+person = {"name": "Alice", "age": 25, "city": "NYC"}
+
+print(person.keys())         # dict_keys(['name', 'age', 'city'])
+print(person.values())       # dict_values(['Alice', 25, 'NYC'])
+print(person.items())        # dict_items([('name', 'Alice'), ...])
+
+# Iterating
+for key in person:
+    print(key, person[key])
+
+for key, value in person.items():
+    print(f"{key}: {value}")
+
+# Update dictionary
+person.update({"job": "Developer", "age": 26})
+print(person)
+
+# Dictionary from lists
+keys = ["a", "b", "c"]
+values = [1, 2, 3]
+d = dict(zip(keys, values))  # {"a": 1, "b": 2, "c": 3}
+
+# Nested dictionaries
+users = {
+    "user1": {"name": "Alice", "age": 25},
+    "user2": {"name": "Bob", "age": 30}
+}
+print(users["user1"]["name"])  # Alice
+
+# Dictionary comprehension
+squares = {x: x**2 for x in range(5)}
+print(squares)  # {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
+                """,
+    "exercise": {
+        "description": "Create a dictionary 'student' with keys: name, grade, subject. Access grade using .get()",
+        "hint": "student = {'name': 'John', 'grade': 'A', 'subject': 'Math'}, student.get('grade')",
+        "check": lambda code: "{" in code and ":" in code and ".get" in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "What happens if you access dict[key] and key doesn't exist?",
+            "options": ["A) Returns None", "B) Returns 0", "C) KeyError", "D) Returns ''"],
+            "answer": "C",
+            "explanation": "Accessing non-existent key with [] raises KeyError. Use .get() for safe access."
+        },
+        {
+            "question": "Can a list be a dictionary key?",
+            "options": [OPTION_A_YES, OPTION_B_NO, "C) Only empty lists", "D) Only if unique"],
+            "answer": "B",
+            "explanation": "Dictionary keys must be immutable. Lists are mutable, so cannot be keys."
+        },
+        {
+            "question": "What does dict.items() return?",
+            "options": ["A) Keys only", "B) Values only", "C) Key-value pairs", "D) Length"],
+            "answer": "C",
+            "explanation": "dict.items() returns key-value pairs as tuples"
+        }
+    ]
+}
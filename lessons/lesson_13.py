@@ -0,0 +1,127 @@
+"""Lesson 13: Modules and Packages"""
+
+# SECTION 5: Modules and Packages
+
+
+LESSON = {
+    "title": "Modules and Packages",
+    "section": "PCEP Section 4.4",
+    "content": """
+PCEP EXAM TOPIC: Importing and using modules
+
+MODULES:
+- Python file (.py) containing functions, classes, variables
+- Imported using 'import' statement
+- Allows code reusability and organization
+
+IMPORT SYNTAX:
+1. import module_name
+   - Use: module_name.function()
+   
+2. import module_name as alias
+   - Use: alias.function()
+   
+3. from module_name import function
+   - Use: function()
+   
+4. from module_name import *
+   - Imports all (not recommended!)
+
+STANDARD LIBRARY MODULES (important for PCEP):
+- math: mathematical functions
+- random: random number generation
+- platform: platform information
+- sys: system-specific parameters
+
+MODULE ATTRIBUTES:
+- __name__: module name ("__main__" if run directly)
+- dir(module): list all names in module
+
+IMPORTANT:
+- Import statements usually at top of file
+- Each module imported only once
+- from module import * can cause name conflicts
+                """,
+    "example": """
+# Import entire module
+import math
+print(math.pi)           # 3.141592653589793
+print(math.sqrt(16))     # 4.0
+print(math.ceil(3.2))    # 4
+print(math.floor(3.8))   # 3
+
+# Import with alias
+import random as rnd
+print(rnd.randint(1, 10))      # Random number 1-10
+print(rnd.choice(['a', 'b', 'c']))  # Random choice
+
+# Import specific items
+from math import pi, sqrt
+print(pi)       # 3.141592653589793
+print(sqrt(25)) # 5.0 (no math. prefix needed!)
+
+# Platform module
+import platform
+print(platform.platform())  # Platform info
+print(platform.python_version())  # Python version
+
+# Random module functions
+import random
+numbers = [1, 2, 3, 4, 5]
+random.shuffle(numbers)  # Shuffle in place
+print(numbers)
+
+print(random.random())   # Random float 0.0-1.0
+print(random.uniform(1, 10))  # Random float 1.0-10.0
+
+# Math module functions
+import math
+print(math.pow(2, 3))    # 8.0 (same as 2**3)
+print(math.factorial(5)) # 120
+print(math.sin(math.pi/2))  # 1.0
+print(math.log(10))      # Natural log
+print(math.log10(100))   # 2.0 (base 10)
+
+# Dir function - see module contents
+print(dir(math)[:5])  # First 5 names in math module
+
+# __name__ attribute
+print(__name__)  # __main__ if running this file directly
+
+# Creating simple module (in separate file)
+# mymodule.py:
+# def greet(name):
+#     return f"Hello, {name}!"
+# PI = 3.14159
+
+# Using it:
+# import mymodule
+# print(mymodule.greet("Alice"))
+# print(mymodule.PI)
+                """,
+    "exercise": {
+        "description": "Import the math module and use sqrt to find the square root of 144",
+        "hint": "import math, then print(math.sqrt(144))",
+        "check": lambda code: "import" in code.lower() and "math" in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "After 'from math import pi', how do you access pi?",
+            "options": ["A) math.pi", "B) pi", "C) import.pi", "D) from.pi"],
+            "answer": "B",
+            "explanation": "'from math import pi' imports pi directly, use it without prefix"
+        },
+        {
+            "question": "What is __name__ when file is run directly?",
+            "options": ["A) '__main__'", "B) filename", "C) '__file__'", "D) 'main'"],
+            "answer": "A",
+            "explanation": "__name__ is '__main__' when script is executed directly"
+        },
+        {
+            "question": "What does random.randint(1, 10) do?",
+            "options": ["A) Random float 1-10", "B) Random int 1-9", "C) Random int 1-10", "D) Random int 0-10"],
+            "answer": "C",
+            "explanation": "randint(a, b) returns random integer from a to b, inclusive"
+        }
+    ]
+}
@@ -0,0 +1,116 @@
+"""Lesson 14: Exception Handling"""
+
+
+LESSON = {
+    "title": "Exception Handling",
+    "section": "PCEP Bonus Topic",
+    "content": """
+EXCEPTION HANDLING (basic level for PCEP):
+
+try-except blocks handle errors gracefully:
+
+try:
+    # code that might raise exception
+except ExceptionType:
+    # handle specific exception
+except:
+    # handle any exception (not recommended)
+else:
+    # executes if no exception (optional)
+finally:
+    # always executes (optional)
+
+COMMON EXCEPTIONS:
+- ValueError: invalid value (e.g., int("abc"))
+- TypeError: wrong type
+- KeyError: dictionary key doesn't exist
+- IndexError: list index out of range
+- ZeroDivisionError: division by zero
+- FileNotFoundError: file doesn't exist
+
+RAISING EXCEPTIONS:
+raise ExceptionType("error message")
+                """,
+    "example": """
+# Basic try-except
+try:
+    x = int("abc")  # ValueError
+except ValueError:
+    print("Cannot convert to integer!")
+
+# Multiple except blocks
+try:
+    numbers = [1, 2, 3]
+    print(numbers[10])  # IndexError
+except ValueError:
+    print("Value error occurred")
+except IndexError:
+    print("Index out of range!")
+
+# Generic except (catches all)
+try:
+    result = 10 / 0
+except:
+    print("An error occurred")
+
+# try-except-else-finally
+try:
+    value = int(input("Enter number: "))
+except ValueError:
+    print("Invalid input!")
+else:
+    print(f"You entered: {value}")
+finally:
+    print("This always runs")
+
+# Raising exceptions
+def divide(a, b):
+    if b == 0:
+        raise ValueError("Cannot divide by zero!")
+    return a / b
+
+try:
+    result = divide(10, 0)
+except ValueError as e:
+    print(f"Error: {e}")
+
+# Catching exception object
+try:
+    x = int("abc")
+except ValueError as error:
+    print(f"Caught: {error}")
+
+# Safe input reading
+while True:
+    try:
+        age = int(input("Enter age: "))
+        break
+    except ValueError:
+        print("Please enter a valid number")
+                """,
+    "exercise": {
+        "description": "Write a try-except block that attempts int conversion and catches ValueError",
+        "hint": "try: x = int('abc') except ValueError: print('Error')",
+        "check": lambda code: "try" in code.lower() and "except" in code.lower()
+    },
+    "quiz": [
+        {
+            "question": "Which exception is raised for int('hello')?",
+            "options": ["A) TypeError", "B) ValueError", "C) KeyError", "D) NameError"],
+            "answer": "B",
+            "explanation": "Invalid conversion to int raises ValueError"
+        },
+        {
+            "question": "When does the 'finally' block execute?",
+            "options": ["A) Only if no error", "B) Only if error", "C) Always", "D) Never"],
+            "answer": "C",
+            "explanation": "'finally' block always executes, regardless of exceptions"
+        },
+        {
+            "question": "What does 10 / 0 raise?",
+            "options": ["A) ValueError", "B) TypeError", "C) ZeroDivisionError", "D) ArithmeticError"],
+            "answer": "C",
+            "explanation": "Division by zero raises ZeroDivisionError"
+        }
+    ]
+}
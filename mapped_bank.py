@@ -0,0 +1,235 @@
+"""
+Memory-mapped practice question bank for the PCEP tutor.
+
+Building the practice bank imports every lesson module, normalizes every
+question source and keeps all question texts and explanations in memory.
+Instead, the built bank is written once to a binary file in __pycache__ and
+opened with mmap on later starts. Only the fixed-width record table is read
+up front (answer codes, sections, topics, cluster ids - enough to rebuild
+the indexes and sample). A question's text, options and explanation are
+decoded from the mapped UTF-8 blob when it is actually shown, so an exam
+touches 20-30 questions however large the bank is.
+
+File layout (little endian):
+
+- header: magic, format version, question count, metadata length
+- metadata: JSON with the source key and the topic, difficulty and source
+  string tables
+- record table: one RECORD per question
+- blob: UTF-8 text of every question (text, NUL-separated options,
+  explanation), addressed by the records' offsets and lengths
+
+The file is keyed by the size and mtime of every file the bank is built
+from and rebuilt when any of them changes.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import atomic_file
+import question_bank
+
+
+MAGIC = b"PCEPBANK"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHII")
+# blob offset; text, options and explanation byte lengths; answer code;
+# section; topic, difficulty and source codes; lesson (-1 for none);
+# near-duplicate cluster; stable id (question_id as 6 bytes)
+_RECORD = struct.Struct("<QIIIBBHBBhI6s")
+_OPTION_SEPARATOR = "\x00"
+
+
+def source_key(paths):
+    """Return a key that changes whenever one of the files changes (size and mtime)"""
+    parts = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{os.path.basename(path)}:missing")
+    return f"{FORMAT_VERSION}|" + "|".join(parts)
+
+
+class _BlobColumn:
+    """One text field of every question, decoded from the mapped blob on access"""
+
+    def __init__(self, data, starts, lengths, split=False):
+        self._data = data
+        self._starts = starts
+        self._lengths = lengths
+        self._split = split
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, question_id):
+        start = self._starts[question_id]
+        text = self._data[start:start + self._lengths[question_id]].decode('utf-8')
+        if self._split:
+            return tuple(text.split(_OPTION_SEPARATOR)) if text else ()
+        return text
+
+    def __iter__(self):
+        for question_id in range(len(self._starts)):
+            yield self[question_id]
+
+
+class MappedQuestionBank(question_bank.QuestionBank):
+    """
+    Read-only QuestionBank backed by a memory-mapped bank file.
+
+    Indexes, filters, sampling and find() work as for an in-memory bank;
+    question texts stay in the mapped file until a question is read.
+
+    Args:
+        path (str): Bank file written by write_bank()
+
+    Raises:
+        OSError: If the file can't be opened
+        ValueError: If it is not a bank file of this format version
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, meta_length = _HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError("not a practice bank file of this version")
+            meta_end = _HEADER.size + meta_length
+            self.meta = json.loads(self._data[_HEADER.size:meta_end].decode('utf-8'))
+            table_end = meta_end + count * _RECORD.size
+            if table_end > len(self._data):
+                raise ValueError("truncated practice bank file")
+            records = _RECORD.iter_unpack(self._data[meta_end:table_end])
+            self._load_records(records, table_end)
+        except (ValueError, struct.error):
+            self._data.close()
+            raise
+
+    def _load_records(self, records, blob_start):
+        """Fill the small columns and the indexes from the record table"""
+        topics = [sys.intern(topic) for topic in self.meta["topics"]]
+        difficulties = [sys.intern(label) for label in self.meta["difficulties"]]
+        sources = self.meta["sources"]
+        text_starts, text_lengths = array('Q'), array('I')
+        option_starts, option_lengths = array('Q'), array('I')
+        explanation_starts, explanation_lengths = array('Q'), array('I')
+        self._clusters = array('I')
+        by_topic, by_lesson, by_source, by_difficulty, by_section = (
+            self._indexes[name] for name in ("topic", "lesson", "source", "difficulty", "section"))
+
+        for new_id, record in enumerate(records):
+            (offset, text_length, options_length, explanation_length, answer, section,
+             topic, difficulty, source, lesson, cluster, stable_id) = record
+            start = blob_start + offset
+            text_starts.append(start)
+            text_lengths.append(text_length)
+            option_starts.append(start + text_length)
+            option_lengths.append(options_length)
+            explanation_starts.append(start + text_length + options_length)
+            explanation_lengths.append(explanation_length)
+            self._answer.append(answer)
+            self._section.append(section)
+            self._topic.append(topics[topic])
+            self._difficulty.append(difficulties[difficulty])
+            self._clusters.append(cluster)
+            self._by_stable_id[stable_id.hex()] = new_id
+            by_topic.setdefault(topics[topic], []).append(new_id)
+            by_lesson.setdefault(None if lesson < 0 else lesson, []).append(new_id)
+            by_source.setdefault(sources[source], []).append(new_id)
+            by_difficulty.setdefault(difficulties[difficulty], []).append(new_id)
+            by_section.setdefault(section, []).append(new_id)
+
+        self._text = _BlobColumn(self._data, text_starts, text_lengths)
+        self._options = _BlobColumn(self._data, option_starts, option_lengths, split=True)
+        self._explanation = _BlobColumn(self._data, explanation_starts, explanation_lengths)
+
+    def add(self, question, source, lesson=None, difficulty=None, section=None):
+        raise TypeError("a mapped question bank is read-only")
+
+    def close(self):
+        """Unmap the bank file (questions can no longer be read)"""
+        self._data.close()
+
+
+def write_bank(bank, path, key):
+    """
+    Write a bank to a bank file, atomically.
+
+    Args:
+        bank (QuestionBank): Bank to store
+        path (str): Bank file
+        key (str): Source key stored in the metadata (see source_key())
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    topics, difficulties, sources = {}, {}, {}
+    source_of = bank.labels("source")
+    lesson_of = bank.labels("lesson")
+    clusters = bank.clusters()
+    records = bytearray()
+    blob = bytearray()
+    for new_id, question in enumerate(bank):
+        text = question.question.encode('utf-8')
+        options = _OPTION_SEPARATOR.join(question.options).encode('utf-8')
+        explanation = question.explanation.encode('utf-8')
+        lesson = lesson_of[new_id]
+        records += _RECORD.pack(
+            len(blob), len(text), len(options), len(explanation),
+            question.answer_code, question.section,
+            topics.setdefault(question.topic, len(topics)),
+            difficulties.setdefault(question.difficulty, len(difficulties)),
+            sources.setdefault(source_of[new_id], len(sources)),
+            -1 if lesson is None else lesson,
+            clusters[new_id],
+            bytes.fromhex(question_bank.question_id(question)),
+        )
+        blob += text + options + explanation
+
+    meta = json.dumps({
+        "key": key,
+        "topics": list(topics),
+        "difficulties": list(difficulties),
+        "sources": list(sources),
+    }).encode('utf-8')
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(bank), len(meta))
+    atomic_file.atomic_write(path, b"".join((header, meta, records, blob)))
+
+
+def load_bank(path, key, build):
+    """
+    Open the bank file if it matches key, otherwise build the bank and store it.
+
+    Args:
+        path (str): Bank file
+        key (str): Source key of the current sources (see source_key())
+        build: Function returning a fresh QuestionBank
+
+    Returns:
+        QuestionBank: A MappedQuestionBank, or the freshly built in-memory
+            bank when the file can't be written (e.g. a read-only install)
+    """
+    try:
+        bank = MappedQuestionBank(path)
+        if bank.meta.get("key") == key:
+            return bank
+        bank.close()
+    except (OSError, ValueError):
+        pass
+
+    built = build()
+    try:
+        write_bank(built, path, key)
+        return MappedQuestionBank(path)
+    except (OSError, ValueError):
+        return built
@@ -0,0 +1,96 @@
+"""
+Near-duplicate question detection for the PCEP tutor.
+
+The practice bank merges lesson quizzes, the study guide and the extra
+practice sets, which overlap: the same question can appear twice with
+slightly different wording or punctuation. This module groups such
+questions into clusters so an exam never contains two of them.
+
+Each question is reduced to a set of word 3-gram shingles (question text
+plus options) and a MinHash signature. Locality-sensitive hashing splits
+the signatures into bands; questions that share a band bucket become
+candidates, and only candidates have their real Jaccard similarity
+computed. Building the clusters is close to linear in the bank size.
+
+The cluster ids are stored in the practice bank file (see mapped_bank.py),
+so clustering only runs when the bank itself is rebuilt.
+"""
+
+import random
+import re
+import zlib
+
+
+NUM_PERMUTATIONS = 16
+BANDS = 8  # 2 rows per band: candidate pairs from ~35% similarity upward
+SIMILARITY_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+# Fixed seed so clusters (and seeded exams) are the same on every run
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(NUM_PERMUTATIONS)]
+
+
+def shingles(question):
+    """
+    Return the set of hashed word 3-grams of a question and its options.
+
+    Args:
+        question (dict): Question in the bank schema
+    """
+    text = " ".join([question.get("question", "")] + list(question.get("options", [])))
+    words = _WORD.findall(text.lower())
+    if len(words) < 3:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {zlib.crc32(" ".join(words[i:i + 3]).encode("utf-8")) for i in range(len(words) - 2)}
+
+
+def signature(shingle_set):
+    """Return the MinHash signature (one minimum per permutation) of a shingle set"""
+    return tuple(min((a * x + b) % _MERSENNE_PRIME for x in shingle_set) for a, b in _PERMUTATIONS)
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster(questions, threshold=SIMILARITY_THRESHOLD):
+    """
+    Group near-identical questions.
+
+    Args:
+        questions (list): Questions in the bank schema
+        threshold (float): Jaccard similarity of shingle sets that counts as
+            a near duplicate
+
+    Returns:
+        list: Cluster id for every question (the index of the first question
+            in its cluster, so unique questions map to themselves)
+    """
+    sets = [shingles(q) for q in questions]
+    rows = NUM_PERMUTATIONS // BANDS
+    buckets = {}
+    parent = list(range(len(questions)))
+    checked = set()
+    for i, shingle_set in enumerate(sets):
+        sig = signature(shingle_set)
+        for band in range(BANDS):
+            key = (band, sig[band * rows:(band + 1) * rows])
+            for j in buckets.setdefault(key, []):
+                if (j, i) in checked:
+                    continue
+                checked.add((j, i))
+                other = sets[j]
+                if len(shingle_set & other) >= threshold * len(shingle_set | other):
+                    root_i, root_j = _find(parent, i), _find(parent, j)
+                    if root_i != root_j:
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+            buckets[key].append(i)
+    return [_find(parent, i) for i in range(len(questions))]
+
@@ -0,0 +1,396 @@
+"""
+Progress persistence for the PCEP tutor.
+
+Progress used to be saved by rewriting the whole JSON file after every quiz,
+which truncated the file before writing it - a crash at the wrong moment lost
+everything. JournalProgressStore keeps two files instead:
+
+- A snapshot (pcep_tutor_progress.json, same layout as before)
+- An append-only journal of compact event records, one JSON object per line
+
+Each event is appended and fsync'ed on its own; record_batch() appends a
+group of events (the review cards of one quiz or exam) with a single fsync.
+On exit the journal is compacted into a new snapshot, written to a temporary
+file and atomically renamed into place, so the previous snapshot survives
+any crash. Loading replays the journal on top of the snapshot and skips a
+torn final line.
+
+Spaced-repetition review state (see scheduler.py) is part of the progress:
+one EVENT_REVIEW per answered question, kept under "reviews" in the snapshot,
+and an EVENT_DISCARD when a card's question has left the bank.
+
+SQLiteProgressStore is an optional engine for shared machines: many learners
+(and many concurrent tutor processes) keep per-user rows in one database.
+MemoryProgressStore keeps progress in memory only (scripted sessions, see
+headless.py). All stores offer the same load/record/record_batch/compact/close
+interface.
+"""
+
+import json
+import os
+import time
+
+import atomic_file
+
+try:
+    import sqlite3
+except ImportError:  # Python built without the sqlite3 module
+    sqlite3 = None
+
+
+# Journal event types
+EVENT_QUIZ = "quiz"            # quiz finished: lesson, score
+EVENT_COMPLETED = "completed"  # lesson marked complete: lesson
+EVENT_CURRENT = "current"      # current lesson moved: lesson
+EVENT_RESET = "reset"          # all progress cleared
+EVENT_REVIEW = "review"        # question rescheduled: qid, card ([ease, interval, reps, due])
+EVENT_DISCARD = "discard"      # question dropped from the review schedule: qid
+
+
+def empty_state():
+    """Return progress for a learner who has not started yet"""
+    return {"current_lesson": 0, "completed_lessons": set(), "quiz_scores": {}, "reviews": {}}
+
+
+def apply_event(state, record):
+    """
+    Apply one journal record to a progress state in place.
+
+    Every event sets absolute values, so replaying a journal over a snapshot
+    that already contains it leaves the state unchanged.
+
+    Args:
+        state (dict): Progress state from empty_state()
+        record (dict): Event with "e" (type) and its fields
+    """
+    event = record.get("e")
+    if event == EVENT_QUIZ:
+        state["quiz_scores"][str(record["lesson"])] = record["score"]
+    elif event == EVENT_COMPLETED:
+        state["completed_lessons"].add(record["lesson"])
+    elif event == EVENT_CURRENT:
+        state["current_lesson"] = record["lesson"]
+    elif event == EVENT_REVIEW:
+        state["reviews"][record["qid"]] = list(record["card"])
+    elif event == EVENT_DISCARD:
+        state["reviews"].pop(record["qid"], None)
+    elif event == EVENT_RESET:
+        state.update(empty_state())
+
+
+class JournalProgressStore:
+    """
+    Snapshot plus append-only journal progress backend.
+
+    Args:
+        snapshot_path (str): JSON snapshot file
+        journal_path (str): Journal file (defaults to the snapshot name with
+            a .journal extension)
+    """
+
+    def __init__(self, snapshot_path, journal_path=None):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + ".journal"
+        self._journal = None
+
+    def load(self):
+        """
+        Read the snapshot and replay the journal on top of it.
+
+        Returns:
+            dict: Progress state (current_lesson, completed_lessons, quiz_scores, reviews)
+        """
+        state = empty_state()
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            state["current_lesson"] = data.get('current_lesson', 0)
+            state["completed_lessons"] = set(data.get('completed_lessons', []))
+            state["quiz_scores"] = data.get('quiz_scores', {})
+            state["reviews"] = data.get('reviews', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        try:
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        apply_event(state, json.loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # Torn or corrupt record from an interrupted write
+                        continue
+        except OSError:
+            pass
+        return state
+
+    def record(self, event, **fields):
+        """
+        Durably append one event to the journal.
+
+        Args:
+            event (str): One of the EVENT_* constants
+            **fields: Event data (lesson, score, qid, card)
+        """
+        self.record_batch([(event, fields)])
+
+    def record_batch(self, events):
+        """
+        Durably append several events with one write and one fsync.
+
+        Args:
+            events (list): (event, fields dict) pairs
+
+        Raises:
+            OSError: If the journal can't be written (the caller tells the
+                learner - the events are not saved)
+        """
+        lines = "".join(json.dumps({"e": event, **fields}, separators=(",", ":")) + "\n"
+                        for event, fields in events)
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+        self._journal.write(lines.encode('utf-8'))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def compact(self, state):
+        """
+        Write state as the new snapshot and empty the journal.
+
+        The snapshot is written to a temporary file, fsync'ed and renamed over
+        the old one; the journal is only truncated after the rename succeeds.
+
+        Args:
+            state (dict): Current progress state
+        """
+        snapshot = json.dumps({
+            'current_lesson': state["current_lesson"],
+            'completed_lessons': sorted(state["completed_lessons"]),
+            'quiz_scores': state["quiz_scores"],
+            'reviews': state.get("reviews", {})
+        }, indent=2)
+        try:
+            atomic_file.atomic_write(self.snapshot_path, snapshot, fsync=True)
+        except OSError:
+            return
+
+        try:
+            if self._journal is not None:
+                self._journal.truncate(0)
+                os.fsync(self._journal.fileno())
+            elif os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        except OSError:
+            pass
+
+    def close(self):
+        """Close the journal file handle"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class MemoryProgressStore:
+    """
+    Progress backend that keeps everything in memory and never touches disk.
+
+    Args:
+        state (dict): Starting progress (defaults to empty_state())
+    """
+
+    def __init__(self, state=None):
+        self.state = state or empty_state()
+
+    def load(self):
+        """Return the progress state"""
+        return self.state
+
+    def record(self, event, **fields):
+        """Apply one event to the in-memory state"""
+        apply_event(self.state, {"e": event, **fields})
+
+    def record_batch(self, events):
+        """Apply several (event, fields) pairs to the in-memory state"""
+        for event, fields in events:
+            apply_event(self.state, {"e": event, **fields})
+
+    def compact(self, state):
+        """Nothing to do - there is no journal"""
+
+    def close(self):
+        """Nothing to release"""
+
+
+# A write transaction that still finds the database busy or locked after the
+# connection's busy timeout is retried this many times, pausing
+# SQLITE_RETRY_DELAY seconds and doubling the pause each time
+SQLITE_WRITE_RETRIES = 3
+SQLITE_RETRY_DELAY = 0.1
+
+# Schema and statements for SQLiteProgressStore. The statement strings are
+# module constants so sqlite3's per-connection statement cache reuses the
+# prepared statements for every event.
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learners (
+    user TEXT PRIMARY KEY,
+    current_lesson INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS lesson_progress (
+    user TEXT NOT NULL,
+    lesson INTEGER NOT NULL,
+    quiz_score INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user, lesson)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS reviews (
+    user TEXT NOT NULL,
+    qid TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (user, qid)
+) WITHOUT ROWID;
+"""
+_SQL_SELECT_LEARNER = "SELECT current_lesson FROM learners WHERE user = ?"
+_SQL_SELECT_LESSONS = "SELECT lesson, quiz_score, completed FROM lesson_progress WHERE user = ?"
+_SQL_UPSERT_CURRENT = (
+    "INSERT INTO learners (user, current_lesson) VALUES (?, ?) "
+    "ON CONFLICT(user) DO UPDATE SET current_lesson = excluded.current_lesson"
+)
+_SQL_UPSERT_SCORE = (
+    "INSERT INTO lesson_progress (user, lesson, quiz_score) VALUES (?, ?, ?) "
+    "ON CONFLICT(user, lesson) DO UPDATE SET quiz_score = excluded.quiz_score"
+)
+_SQL_UPSERT_COMPLETED = (
+    "INSERT INTO lesson_progress (user, lesson, completed) VALUES (?, ?, 1) "
+    "ON CONFLICT(user, lesson) DO UPDATE SET completed = 1"
+)
+_SQL_DELETE_LESSONS = "DELETE FROM lesson_progress WHERE user = ?"
+_SQL_SELECT_REVIEWS = "SELECT qid, ease, interval, reps, due FROM reviews WHERE user = ?"
+_SQL_UPSERT_REVIEW = (
+    "INSERT INTO reviews (user, qid, ease, interval, reps, due) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(user, qid) DO UPDATE SET ease = excluded.ease, interval = excluded.interval, "
+    "reps = excluded.reps, due = excluded.due"
+)
+_SQL_DELETE_REVIEW = "DELETE FROM reviews WHERE user = ? AND qid = ?"
+_SQL_DELETE_REVIEWS = "DELETE FROM reviews WHERE user = ?"
+
+
+class SQLiteProgressStore:
+    """
+    Multi-user progress backend on a shared SQLite database.
+
+    Rows are keyed by (user, lesson); the WITHOUT ROWID primary key doubles as
+    the (user, lesson) index, so every read and write touches one learner's
+    rows only. The database runs in WAL mode so readers never block the
+    writer, and each event is a single short write transaction - with a busy
+    timeout, hundreds of tutor processes can share one file.
+
+    Args:
+        db_path (str): SQLite database file (created if missing)
+        user (str): Learner name the rows belong to
+        timeout (float): Seconds to wait for another process's write lock
+    """
+
+    def __init__(self, db_path, user, timeout=10.0):
+        if sqlite3 is None:
+            raise RuntimeError("SQLite progress storage needs Python's sqlite3 module")
+        self.db_path = db_path
+        self.user = user
+        # Autocommit mode: each statement commits on its own unless wrapped
+        # in an explicit BEGIN IMMEDIATE (multi-statement events and batches)
+        self._conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+
+    def load(self):
+        """
+        Read this user's progress.
+
+        Returns:
+            dict: Progress state (current_lesson, completed_lessons, quiz_scores, reviews)
+        """
+        state = empty_state()
+        row = self._conn.execute(_SQL_SELECT_LEARNER, (self.user,)).fetchone()
+        if row is not None:
+            state["current_lesson"] = row[0]
+        for lesson, quiz_score, completed in self._conn.execute(_SQL_SELECT_LESSONS, (self.user,)):
+            if quiz_score is not None:
+                state["quiz_scores"][str(lesson)] = quiz_score
+            if completed:
+                state["completed_lessons"].add(lesson)
+        for qid, ease, interval, reps, due in self._conn.execute(_SQL_SELECT_REVIEWS, (self.user,)):
+            state["reviews"][qid] = [ease, interval, reps, due]
+        return state
+
+    def record(self, event, **fields):
+        """
+        Write one event for this user in its own transaction.
+
+        Args:
+            event (str): One of the EVENT_* constants
+            **fields: Event data (lesson, score, qid, card)
+        """
+        self.record_batch([(event, fields)])
+
+    def record_batch(self, events):
+        """
+        Write several events for this user in one transaction.
+
+        A transaction that fails because other processes hold the database
+        (busy or locked even after the busy timeout) is retried
+        SQLITE_WRITE_RETRIES times with a growing pause.
+
+        Args:
+            events (list): (event, fields dict) pairs
+
+        Raises:
+            OSError: If the events could not be written (the caller tells
+                the learner - the batch is not saved)
+        """
+        delay = SQLITE_RETRY_DELAY
+        for attempt in range(SQLITE_WRITE_RETRIES + 1):
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for event, fields in events:
+                        self._write(event, fields)
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    raise
+                return
+            except sqlite3.OperationalError as e:
+                busy = "locked" in str(e) or "busy" in str(e)
+                if not busy or attempt == SQLITE_WRITE_RETRIES:
+                    raise OSError(f"progress database write failed: {e}") from e
+                time.sleep(delay)
+                delay *= 2
+            except sqlite3.Error as e:
+                raise OSError(f"progress database write failed: {e}") from e
+
+    def _write(self, event, fields):
+        """Execute the statements of one event (inside record_batch's transaction)"""
+        if event == EVENT_QUIZ:
+            self._conn.execute(_SQL_UPSERT_SCORE, (self.user, fields["lesson"], fields["score"]))
+        elif event == EVENT_COMPLETED:
+            self._conn.execute(_SQL_UPSERT_COMPLETED, (self.user, fields["lesson"]))
+        elif event == EVENT_CURRENT:
+            self._conn.execute(_SQL_UPSERT_CURRENT, (self.user, fields["lesson"]))
+        elif event == EVENT_REVIEW:
+            self._conn.execute(_SQL_UPSERT_REVIEW, (self.user, fields["qid"], *fields["card"]))
+        elif event == EVENT_DISCARD:
+            self._conn.execute(_SQL_DELETE_REVIEW, (self.user, fields["qid"]))
+        elif event == EVENT_RESET:
+            self._conn.execute(_SQL_DELETE_LESSONS, (self.user,))
+            self._conn.execute(_SQL_DELETE_REVIEWS, (self.user,))
+            self._conn.execute(_SQL_UPSERT_CURRENT, (self.user, 0))
+
+    def compact(self, state):
+        """Nothing to do - every event is already committed to the database"""
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
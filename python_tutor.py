@@ -9,14 +9,29 @@ Python Programmer) exam preparation. Features include:
 - Interactive quizzes after each lesson
 - 20-question practice exams
 - Progress tracking and persistence
-- 245+ practice questions (original + study guide)
+- 277 practice questions (lessons, study guide and extra practice sets)
 - Real exam-style questions from Certify4Sure study materials
 """
 
 import sys
-import json
+import argparse
+import getpass
 import os
-import random
+import time
+
+import adaptive
+import answer_log
+import code_runner
+import exam_blueprint
+import lessons
+import mapped_bank
+import near_duplicates
+import progress_store
+import question_bank
+import scheduler
+import search_index
+import terminal
+import tutor_io
 
 
 class PythonTutor:
@@ -28,1683 +43,116 @@ class PythonTutor:
         current_lesson (int): Index of current lesson
         completed_lessons (set): Lessons marked as completed (80%+ quiz score)
         quiz_scores (dict): Quiz scores keyed by lesson index
-        lessons (list): All 16 lessons with content, examples, exercises, and quizzes
-        practice_questions (list): Pool of 245+ questions for practice exams
+        lessons (LessonRegistry): All lessons, each loaded on first access
+        practice_questions (QuestionBank): Indexed pool of 277 practice questions (built lazily)
     """
     
     # Constants for duplicate literals (reduces code duplication)
-    OPTION_A_YES = "A) Yes"
-    OPTION_B_NO = "B) No"
-    OPTION_D_ERROR = "D) Error"
+    OPTION_A_YES = lessons.OPTION_A_YES
+    OPTION_B_NO = lessons.OPTION_B_NO
+    OPTION_D_ERROR = lessons.OPTION_D_ERROR
     PRESS_ENTER = "Press Enter to continue..."
     PRESS_ENTER_NEWLINE = "\nPress Enter to continue..."
 
-    def __init__(self):  # NOSONAR - data initialization increases complexity
+    def __init__(self, store=None, io=None, answer_log_path="pcep_tutor_answers.jsonl"):
         """
-        Initialize the tutor with all 16 lessons and load user progress.
+        Initialize the tutor's lesson index and load user progress.
         
         Sets up:
-        - 15 original lessons covering PCEP exam topics
-        - 1 bonus lesson with 20 study guide questions
-        - Practice question pool (245+ questions)
+        - Lesson registry for 14 lessons plus 1 bonus lesson (bodies load lazily)
+        - Practice question pool (277 questions, generated on first exam)
         - Progress persistence (quiz scores, completed lessons)
+        
+        Args:
+            store: Progress backend (progress_store.JournalProgressStore or
+                SQLiteProgressStore); defaults to the local JSON journal
+            io: Source of learner input (tutor_io.ConsoleIO or ScriptedIO);
+                defaults to the keyboard
+            answer_log_path (str): JSON Lines file for every answer, None to
+                keep no answer log
         """
         self.progress_file = "pcep_tutor_progress.json"
+        self.progress_store = store or progress_store.JournalProgressStore(self.progress_file)
+        # Shared stores (--db) name the learner; their answers get a log file of their own
+        self.answer_log = answer_log.AnswerLog(answer_log_path, user=getattr(self.progress_store, "user", None))
+        self.io = io or tutor_io.ConsoleIO()
+        
+        # Code execution workers, started when the first lesson is opened
+        self._executor = None
+        
+        self.terminal = terminal.Terminal()
+        self.lesson_scroll = 0
+        self.lesson_page_rows = None
         self.current_lesson = 0
         self.completed_lessons = set()
         self.quiz_scores = {}
+        self.reviews = scheduler.ReviewScheduler()
+        # Review cards answered since the last flush, journaled together per session
+        self._pending_reviews = {}
         self.load_progress()
         
-        # LESSONS STRUCTURE: 16 comprehensive lessons covering all PCEP topics
-        # Each lesson contains:
-        # - title: Lesson name
-        # - section: PCEP exam section reference
-        # - content: Detailed explanation with key concepts and theory
-        # - example: Real-world Python code examples
-        # - exercise: Guided practice with hint and validation checker
-        # - quiz: 3 multiple-choice questions to test understanding
-        #
-        # PCEP EXAM TOPICS COVERED:
-        # Section 1: Basic Concepts (Python fundamentals, compilation)
-        # Section 2: Data Types (literals, variables, operators, I/O)
-        # Section 3: Boolean, Conditionals, Loops (logic, control flow)
-        # Section 4: Data Structures (lists, dictionaries, tuples, sets)
-        # Section 5: Functions (definition, scope, arguments, returns)
-        # Section 6: Advanced Topics (modules, strings, exception handling)
-        self.lessons = [
-            # SECTION 1: Introduction to Python and Computer Programming
-            {
-                "title": "Python Fundamentals & Compilation",
-                "section": "PCEP Section 1",
-                "content": """
-PCEP EXAM TOPIC: Understanding Python basics, compilation vs interpretation
-
-Python is an interpreted, high-level programming language created by Guido van Rossum.
-
-Key Concepts for PCEP:
-- Python is INTERPRETED (not compiled to machine code before running)
-- CPython is the reference implementation (written in C)
-- Python code is compiled to bytecode (.pyc files), then interpreted
-- .pyc files are stored in __pycache__ directory
-- Python is:
-  * Multi-paradigm (procedural, OOP, functional)
-  * Dynamically typed
-  * Case-sensitive
-  * Uses indentation for code blocks (usually 4 spaces)
-
-Compilation vs Interpretation:
-- Compiled: Source → Machine code → Execution (C, C++)
-- Interpreted: Source → Executed line by line (Python, JavaScript)
-- Python: Hybrid (source → bytecode → interpretation)
-                """,
-                "example": """
-# Python basics - case sensitivity
-Name = "Alice"
-name = "Bob"
-print(Name)  # Alice
-print(name)  # Bob - different variable!
-
-# Indentation is mandatory
-if True:
-    print("This is indented")  # 4 spaces
-    print("This too")
-# print("This would cause IndentationError if uncommented")
-
-# Comments
-# Single line comment
-x = 5  # Inline comment
-\"\"\"
-Multi-line comment
-or docstring
-\"\"\"
-
-# Python is dynamically typed
-var = 10        # int
-var = "hello"   # now it's str - no error!
-print(var)
-                """,
-                "exercise": {
-                    "description": "Create a variable 'python_version' and assign it the value 3. Then reassign it to 'PCEP'",
-                    "hint": "python_version = 3, then python_version = 'PCEP'",
-                    "check": lambda code: "python_version" in code and "=" in code
-                },
-                "quiz": [
-                    {
-                        "question": "Python is primarily a(n) _____ language.",
-                        "options": ["A) Compiled", "B) Interpreted", "C) Assembly", "D) Machine"],
-                        "answer": "B",
-                        "explanation": "Python is an interpreted language. Code is executed by an interpreter."
-                    },
-                    {
-                        "question": "What is stored in __pycache__ directory?",
-                        "options": ["A) Source code", "B) Documentation", "C) Bytecode files (.pyc)", "D) Log files"],
-                        "answer": "C",
-                        "explanation": "Python compiles source code to bytecode (.pyc) files stored in __pycache__."
-                    },
-                    {
-                        "question": "Is Python case-sensitive?",
-                        "options": [PythonTutor.OPTION_A_YES, PythonTutor.OPTION_B_NO, "C) Only for variables", "D) Only for functions"],
-                        "answer": "A",
-                        "explanation": "Python is case-sensitive. 'Variable' and 'variable' are different identifiers."
-                    }
-                ]
-            },
-            # SECTION 2: Data Types, Variables, Basic I/O, Operators
-            {
-                "title": "Literals, Variables & Numeric Types",
-                "section": "PCEP Section 2.1",
-                "content": """
-PCEP EXAM TOPIC: Literals, variables, and numeric data types
-
-LITERALS - fixed values in code:
-- Integer: 42, -10, 0
-- Float: 3.14, -0.5, 4. (trailing dot is valid!)
-- Scientific notation: 3e8 (3 × 10^8), 1.5e-3 (0.0015)
-- Octal: 0o123 (prefix 0o)
-- Hexadecimal: 0x1A (prefix 0x)
-- String: "hello", 'world', '''multi
-  line'''
-- Boolean: True, False (capitalized!)
-- None: represents absence of value
-
-NUMERIC TYPES:
-- int: unlimited precision (no overflow!)
-- float: IEEE 754 double precision
-- complex: 3+4j (j for imaginary part)
-
-VARIABLES:
-- Names: letters, digits, underscore (can't start with digit)
-- Convention: lowercase_with_underscores (snake_case)
-- Reserved keywords cannot be used as names
-                """,
-                "example": """
-# Different number formats
-decimal = 100
-octal = 0o144       # 100 in octal
-hexadecimal = 0x64  # 100 in hex
-print(decimal, octal, hexadecimal)  # All print 100
-
-# Floats
-f1 = 3.14
-f2 = 4.           # Valid! Same as 4.0
-f3 = .5           # Same as 0.5
-scientific = 3e2  # 300.0
-print(f1, f2, f3, scientific)
-
-# Underscores for readability (Python 3.6+)
-million = 1_000_000
-print(million)  # 1000000
-
-# Multiple assignment
-a = b = c = 0
-x, y, z = 1, 2, 3
-print(x, y, z)
-
-# Type checking
-print(type(42))      # <class 'int'>
-print(type(3.14))    # <class 'float'>
-print(type(True))    # <class 'bool'>
-                """,
-                "exercise": {
-                    "description": "Create an integer, float, and boolean variable. Use scientific notation for the float (e.g., 2e3)",
-                    "hint": "num = 10, sci = 2e3, flag = True",
-                    "check": lambda code: "=" in code and "e" in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What is the value of 0o12 in decimal?",
-                        "options": ["A) 12", "B) 10", "C) 8", "D) 14"],
-                        "answer": "B",
-                        "explanation": "0o12 is octal. 1×8 + 2 = 10 in decimal."
-                    },
-                    {
-                        "question": "Which is a valid float literal?",
-                        "options": ["A) 4.", "B) 4,0", "C) 4f", "D) 4_f"],
-                        "answer": "A",
-                        "explanation": "4. is valid (equals 4.0). Python uses dots, not commas for decimals."
-                    },
-                    {
-                        "question": "What does 2e3 equal?",
-                        "options": ["A) 6", "B) 8", "C) 2000", "D) 23"],
-                        "answer": "C",
-                        "explanation": "2e3 means 2 × 10^3 = 2000"
-                    }
-                ]
-            },
-            {
-                "title": "Operators & Expressions",
-                "section": "PCEP Section 2.2",
-                "content": """
-PCEP EXAM TOPIC: Operators and their priorities
-
-ARITHMETIC OPERATORS (highest to lowest priority):
-1. ** (exponentiation) - right associative!
-2. +x, -x (unary plus, minus)
-3. *, /, //, % (multiply, divide, floor division, modulo)
-4. +, - (addition, subtraction)
-
-IMPORTANT:
-- ** is right associative: 2**3**2 = 2**(3**2) = 512
-- // is floor division: 7 // 2 = 3
-- % is modulo (remainder): 7 % 3 = 1
-- / always returns float: 6 / 3 = 2.0
-
-SHORTCUT OPERATORS:
-x += 1  # x = x + 1
-x -= 2  # x = x - 2
-x *= 3  # x = x * 3
-x /= 4  # x = x / 4
-x //= 5 # x = x // 5
-x %= 6  # x = x % 6
-x **= 2 # x = x ** 2
-
-TYPE CONVERSIONS:
-int(x), float(x), str(x)
-                """,
-                "example": """
-# Operator priority
-print(2 + 3 * 4)      # 14 (not 20)
-print((2 + 3) * 4)    # 20
-print(2 ** 3 ** 2)    # 512 (right associative!)
-print((2 ** 3) ** 2)  # 64
-
-# Division types
-print(7 / 2)    # 3.5 (float division)
-print(7 // 2)   # 3 (floor division)
-print(7 % 2)    # 1 (remainder/modulo)
-print(-7 // 2)  # -4 (floors toward negative infinity!)
-
-# Unary operators
-x = 5
-print(+x)  # 5
-print(-x)  # -5
-
-# Shortcut operators
-counter = 10
-counter += 5  # Now 15
-counter *= 2  # Now 30
-print(counter)
-
-# Type conversion
-print(int(3.9))      # 3 (truncates)
-print(int("42"))     # 42
-print(float("3.14")) # 3.14
-print(str(100))      # "100"
-                """,
-                "exercise": {
-                    "description": "Calculate: 10 // 3 and 10 % 3. Store results in variables 'quotient' and 'remainder'",
-                    "hint": "quotient = 10 // 3, remainder = 10 % 3",
-                    "check": lambda code: "//" in code and "%" in code
-                },
-                "quiz": [
-                    {
-                        "question": "What is 2 ** 3 ** 2?",
-                        "options": ["A) 64", "B) 512", "C) 256", "D) 128"],
-                        "answer": "B",
-                        "explanation": "** is right associative: 2**(3**2) = 2**9 = 512"
-                    },
-                    {
-                        "question": "What is -11 // 2?",
-                        "options": ["A) -5", "B) -5.5", "C) -6", "D) -4"],
-                        "answer": "C",
-                        "explanation": "Floor division floors toward negative infinity: -11 // 2 = -6"
-                    },
-                    {
-                        "question": "What does x *= 3 mean?",
-                        "options": ["A) x = 3", "B) x = x * 3", "C) x = x + 3", "D) x = 3 * x"],
-                        "answer": "B",
-                        "explanation": "x *= 3 is shorthand for x = x * 3"
-                    }
-                ]
-            },
-            {
-                "title": "Strings & Basic I/O",
-                "section": "PCEP Section 2.3",
-                "content": """
-PCEP EXAM TOPIC: String operations and input/output
-
-STRINGS:
-- Enclosed in quotes: "hello", 'world'
-- Triple quotes for multiline: '''text''' or \"\"\"text\"\"\"
-- Escape sequences: \\n (newline), \\t (tab), \\\\ (backslash), \\' \\"
-- String concatenation: "hello" + " " + "world"
-- String repetition: "Hi" * 3 = "HiHiHi"
-- Indexing: s[0] (first char), s[-1] (last char)
-- Slicing: s[start:end:step]
-- Immutable: cannot change individual characters
-
-STRING METHODS (important for PCEP):
-- len(s): length
-- s.upper(), s.lower(): case conversion
-- s.strip(): remove whitespace from ends
-- s.replace(old, new): replace substring
-- s.split(): split into list
-- s.find(sub): find substring (-1 if not found)
-- s.isdigit(), s.isalpha(), s.isalnum(): check content
-
-INPUT/OUTPUT:
-- print(*values, sep=' ', end='\\n'): output
-- input(prompt): read string from user (always returns string!)
-                """,
-                "example": """
-# String basics
-s = "Python"
-print(s[0])      # P (first character)
-print(s[-1])     # n (last character)
-print(s[0:3])    # Pyt (slice: index 0, 1, 2)
-print(s[::-1])   # nohtyP (reverse)
-
-# String operations
-print("Hello" + " " + "World")  # Concatenation
-print("=" * 20)                 # Repetition
-
-# Escape sequences
-print("Line 1\\nLine 2")  # Newline
-print("Column1\\tColumn2") # Tab
-
-# String methods
-text = "  Hello World  "
-print(text.strip())       # "Hello World"
-print(text.upper())       # "  HELLO WORLD  "
-print(text.replace("World", "Python"))  # "  Hello Python  "
-
-words = "apple,banana,cherry"
-print(words.split(","))   # ['apple', 'banana', 'cherry']
-
-# Type checking
-print("123".isdigit())    # True
-print("abc".isalpha())    # True
-print("abc123".isalnum()) # True
-
-# Input (always returns string!)
-# name = input("Enter your name: ")
-# age = int(input("Enter your age: "))  # Convert to int
-
-# Print with custom separator and end
-print(1, 2, 3, sep="-")           # 1-2-3
-print("Hello", end=" ")
-print("World")                     # Hello World (no newline between)
-                """,
-                "exercise": {
-                    "description": "Create a string 'pcep' and print it reversed and in uppercase",
-                    "hint": "s = 'pcep', print(s[::-1].upper())",
-                    "check": lambda code: "[::-1]" in code or ".upper()" in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What does 'Hi' * 3 produce?",
-                        "options": ["A) HiHiHi", "B) Hi Hi Hi", "C) Hi3", PythonTutor.OPTION_D_ERROR],
-                        "answer": "A",
-                        "explanation": "String * number repeats the string that many times with no spaces."
-                    },
-                    {
-                        "question": "What does input() return?",
-                        "options": ["A) Integer", "B) Float", "C) String", "D) Depends on input"],
-                        "answer": "C",
-                        "explanation": "input() always returns a string, even if user enters numbers."
-                    },
-                    {
-                        "question": "What is 'Python'[-1]?",
-                        "options": ["A) P", "B) n", "C) o", PythonTutor.OPTION_D_ERROR],
-                        "answer": "B",
-                        "explanation": "Negative indices count from the end. -1 is the last character: 'n'"
-                    }
-                ]
-            },
-            # SECTION 3: Boolean, Control Flow, Lists, Logic
-            {
-                "title": "Boolean Values & Comparison Operators",
-                "section": "PCEP Section 3.1",
-                "content": """
-PCEP EXAM TOPIC: Boolean values, relational operators, logic
-
-BOOLEAN VALUES:
-- True, False (must be capitalized!)
-- Result of comparisons and logical operations
-
-COMPARISON OPERATORS:
-- == (equal to) - NOT = (which is assignment!)
-- != (not equal to)
-- > (greater than)
-- < (less than)
-- >= (greater than or equal)
-- <= (less than or equal)
-
-LOGICAL OPERATORS (priority: not > and > or):
-- not: logical negation
-- and: True if both True
-- or: True if at least one True
-
-SHORT-CIRCUIT EVALUATION:
-- and: stops at first False
-- or: stops at first True
-
-TRUTHY/FALSY VALUES:
-Falsy: False, 0, 0.0, "", [], {}, None
-Truthy: Everything else
-                """,
-                "example": """
-# Boolean basics
-print(True)          # True
-print(type(True))    # <class 'bool'>
-print(bool(1))       # True
-print(bool(0))       # False
-print(bool(""))      # False
-print(bool("text"))  # True
-
-# Comparison operators
-print(5 == 5)   # True
-print(5 != 3)   # True
-print(5 > 3)    # True
-print(5 <= 5)   # True
-print("a" < "b")  # True (lexicographic comparison)
-
-# Logical operators
-print(True and True)   # True
-print(True and False)  # False
-print(True or False)   # True
-print(not True)        # False
-
-# Operator priority: not > and > or
-print(True or True and False)  # True (and first, then or)
-# Equivalent to: True or (True and False) = True or False = True
-
-# Short-circuit evaluation
-x = 10
-print(x > 5 or x < 0)  # True (doesn't check x < 0)
-print(x > 20 and print("Hi"))  # False (doesn't print)
-
-# Chaining comparisons
-x = 5
-print(1 < x < 10)  # True (equivalent to: 1 < x and x < 10)
-                """,
-                "exercise": {
-                    "description": "Create a boolean expression checking if a number is between 10 and 20 (inclusive)",
-                    "hint": "result = 10 <= num <= 20",
-                    "check": lambda code: "<=" in code and ("and" in code.lower() or code.count("<=") >= 2)
-                },
-                "quiz": [
-                    {
-                        "question": "What is the result of: True or True and False?",
-                        "options": ["A) True", "B) False", "C) Error", "D) None"],
-                        "answer": "A",
-                        "explanation": "'and' has higher priority than 'or': True or (True and False) = True or False = True"
-                    },
-                    {
-                        "question": "Which is falsy in Python?",
-                        "options": ["A) []", "B) 'False'", "C) 1", "D) [0]"],
-                        "answer": "A",
-                        "explanation": "Empty list [] is falsy. String 'False' is truthy (non-empty string)."
-                    },
-                    {
-                        "question": "What does 5 == 5.0 return?",
-                        "options": ["A) True", "B) False", "C) Error", "D) 1"],
-                        "answer": "A",
-                        "explanation": "== compares values, not types. 5 and 5.0 have equal values."
-                    }
-                ]
-            },
-            {
-                "title": "Conditional Statements (if/elif/else)",
-                "section": "PCEP Section 3.2",
-                "content": """
-PCEP EXAM TOPIC: Conditional execution
-
-SYNTAX:
-if condition:
-    # code block (must be indented!)
-elif another_condition:
-    # code block
-else:
-    # code block
-
-IMPORTANT:
-- Colon (:) is REQUIRED after conditions
-- Indentation is MANDATORY (usually 4 spaces)
-- elif (not "else if")
-- Can have multiple elif blocks
-- else is optional
-
-CONDITIONAL EXPRESSION (ternary operator):
-value_if_true if condition else value_if_false
-
-Example: max_val = a if a > b else b
-                """,
-                "example": """
-# Basic if statement
-age = 18
-if age >= 18:
-    print("You are an adult")
-
-# if-elif-else chain
-score = 85
-if score >= 90:
-    grade = "A"
-elif score >= 80:
-    grade = "B"
-elif score >= 70:
-    grade = "C"
-else:
-    grade = "F"
-print(f"Grade: {grade}")
-
-# Nested conditions
-x = 10
-if x > 0:
-    if x % 2 == 0:
-        print("Positive even number")
-    else:
-        print("Positive odd number")
-else:
-    print("Non-positive number")
-
-# Conditional expression (ternary)
-a, b = 5, 10
-max_value = a if a > b else b
-print(f"Max: {max_value}")  # Max: 10
-
-# Multiple conditions
-temperature = 75
-is_sunny = True
-if temperature > 70 and is_sunny:
-    print("Great day for the beach!")
-
-# Checking membership
-fruits = ["apple", "banana"]
-if "apple" in fruits:
-    print("We have apples!")
-                """,
-                "exercise": {
-                    "description": "Write an if-elif-else chain that categorizes a number as positive, negative, or zero",
-                    "hint": "if num > 0: ... elif num < 0: ... else: ...",
-                    "check": lambda code: 'if' in code.lower() and 'elif' in code.lower() and 'else' in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What comes after 'if condition'?",
-                        "options": ["A) Colon :", "B) Semicolon ;", "C) Brace {", "D) Nothing"],
-                        "answer": "A",
-                        "explanation": "In Python, if statements must end with a colon :"
-                    },
-                    {
-                        "question": "What is 10 if 5 > 3 else 20?",
-                        "options": ["A) 10", "B) 20", "C) True", PythonTutor.OPTION_D_ERROR],
-                        "answer": "A",
-                        "explanation": "Since 5 > 3 is True, it returns 10"
-                    },
-                    {
-                        "question": "Which keyword is used for additional conditions?",
-                        "options": ["A) elseif", "B) else if", "C) elif", "D) elsif"],
-                        "answer": "C",
-                        "explanation": "Python uses 'elif' (not 'elseif' or 'else if')"
-                    }
-                ]
-            },
-            {
-                "title": "Loops: while and for",
-                "section": "PCEP Section 3.3",
-                "content": """
-PCEP EXAM TOPIC: Iteration with loops
-
-WHILE LOOP:
-while condition:
-    # code block
-    # update condition!
-else:  # optional
-    # executes if loop completes normally (no break)
-
-FOR LOOP:
-for variable in sequence:
-    # code block
-else:  # optional
-    # executes if loop completes normally
-
-RANGE FUNCTION:
-- range(stop): 0 to stop-1
-- range(start, stop): start to stop-1
-- range(start, stop, step): with custom step
-
-LOOP CONTROL:
-- break: exit loop immediately
-- continue: skip rest of current iteration
-- pass: do nothing (placeholder)
-
-IMPORTANT: else clause runs only if loop completes without break!
-                """,
-                "example": """
-# while loop
-count = 0
-while count < 5:
-    print(count)
-    count += 1
-# Prints: 0, 1, 2, 3, 4
-
-# while with else
-i = 0
-while i < 3:
-    print(i)
-    i += 1
-else:
-    print("Loop completed")
-
-# for loop with range
-for i in range(5):
-    print(i)  # 0, 1, 2, 3, 4
-
-for i in range(2, 7):
-    print(i)  # 2, 3, 4, 5, 6
-
-for i in range(0, 10, 2):
-    print(i)  # 0, 2, 4, 6, 8
-
-# for loop with sequence
-fruits = ["apple", "banana", "cherry"]
-for fruit in fruits:
-    print(fruit)
-
-# break statement
-for i in range(10):
-    if i == 5:
-        break
-    print(i)  # 0, 1, 2, 3, 4
-
-# continue statement
-for i in range(5):
-    if i == 2:
-        continue  # Skip 2
-    print(i)  # 0, 1, 3, 4
-
-# else with break
-for i in range(5):
-    if i == 3:
-        break
-    print(i)
-else:
-    print("Completed")  # Won't print (break was used)
-
-# Nested loops
-for i in range(3):
-    for j in range(2):
-        print(f"({i},{j})")
-                """,
-                "exercise": {
-                    "description": "Write a for loop that prints even numbers from 0 to 10 using range",
-                    "hint": "for i in range(0, 11, 2): print(i)",
-                    "check": lambda code: 'for' in code.lower() and 'range' in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What does range(5) produce?",
-                        "options": ["A) 1,2,3,4,5", "B) 0,1,2,3,4", "C) 0,1,2,3,4,5", "D) 1,2,3,4"],
-                        "answer": "B",
-                        "explanation": "range(5) generates numbers from 0 to 4 (5 is excluded)"
-                    },
-                    {
-                        "question": "What does 'continue' do?",
-                        "options": ["A) Exit loop", "B) Skip to next iteration", "C) Restart loop", "D) Pause loop"],
-                        "answer": "B",
-                        "explanation": "'continue' skips the rest of the current iteration and goes to the next one"
-                    },
-                    {
-                        "question": "When does the 'else' clause of a loop execute?",
-                        "options": ["A) Always", "B) If loop completes without break", "C) If break is used", "D) Never"],
-                        "answer": "B",
-                        "explanation": "Loop's 'else' executes only if loop completes normally (no break)"
-                    }
-                ]
-            },
-            {
-                "title": "Lists and List Operations",
-                "section": "PCEP Section 3.4",
-                "content": """
-PCEP EXAM TOPIC: Lists - creation, indexing, slicing, methods
-
-LISTS:
-- Ordered, mutable sequences
-- Created with square brackets: [1, 2, 3]
-- Can contain mixed types: [1, "hello", 3.14]
-- Zero-indexed: list[0] is first element
-- Negative indexing: list[-1] is last element
-
-SLICING: list[start:end:step]
-- list[1:4]: elements at index 1, 2, 3
-- list[:3]: first 3 elements
-- list[2:]: from index 2 to end
-- list[::-1]: reverse list
-- list[::2]: every 2nd element
-
-LIST METHODS (important for PCEP):
-- append(x): add x to end
-- insert(i, x): add x at index i
-- remove(x): remove first occurrence of x
-- pop(i): remove and return element at index i (default: last)
-- index(x): return index of first x
-- count(x): count occurrences of x
-- sort(): sort in place
-- reverse(): reverse in place
-- clear(): remove all elements
-
-OPERATORS:
-- len(list): get length
-- x in list: check membership
-- list1 + list2: concatenation
-- list * n: repetition
-                """,
-                "example": """
-# Creating lists
-numbers = [1, 2, 3, 4, 5]
-mixed = [1, "hello", 3.14, True]
-empty = []
-
-# Indexing
-print(numbers[0])   # 1 (first)
-print(numbers[-1])  # 5 (last)
-print(numbers[2])   # 3
-
-# Slicing
-print(numbers[1:4])    # [2, 3, 4]
-print(numbers[:3])     # [1, 2, 3]
-print(numbers[2:])     # [3, 4, 5]
-print(numbers[::-1])   # [5, 4, 3, 2, 1] (reverse)
-print(numbers[::2])    # [1, 3, 5] (every 2nd)
-
-# Modifying lists
-numbers[0] = 10
-print(numbers)  # [10, 2, 3, 4, 5]
-
-# List methods
-fruits = ["apple", "banana"]
-fruits.append("cherry")      # ["apple", "banana", "cherry"]
-fruits.insert(0, "mango")    # ["mango", "apple", "banana", "cherry"]
-fruits.remove("apple")       # ["mango", "banana", "cherry"]
-last = fruits.pop()          # Returns "cherry", list is ["mango", "banana"]
-
-print(len(fruits))           # 2
-print("mango" in fruits)     # True
-
-# List operations
-list1 = [1, 2]
-list2 = [3, 4]
-combined = list1 + list2     # [1, 2, 3, 4]
-repeated = list1 * 3         # [1, 2, 1, 2, 1, 2]
-
-# Sorting
-nums = [3, 1, 4, 1, 5]
-nums.sort()                  # [1, 1, 3, 4, 5]
-nums.reverse()               # [5, 4, 3, 1, 1]
-
-# List iteration
-for item in fruits:
-    print(item)
-                """,
-                "exercise": {
-                    "description": "Create a list with 5 numbers, add a 6th using append, and print it reversed using slicing",
-                    "hint": "nums = [1,2,3,4,5], nums.append(6), print(nums[::-1])",
-                    "check": lambda code: "append" in code.lower() and "[::-1]" in code
-                },
-                "quiz": [
-                    {
-                        "question": "What is [1,2,3][1:3]?",
-                        "options": ["A) [1,2]", "B) [2,3]", "C) [1,2,3]", "D) [3]"],
-                        "answer": "B",
-                        "explanation": "[1:3] gets elements at index 1 and 2: [2, 3]"
-                    },
-                    {
-                        "question": "What does list.pop() return?",
-                        "options": ["A) First element", "B) Last element", "C) Nothing", "D) The list"],
-                        "answer": "B",
-                        "explanation": "pop() without argument removes and returns the last element"
-                    },
-                    {
-                        "question": "What is [1,2,3][::-1]?",
-                        "options": ["A) [1,2,3]", "B) [3,2,1]", "C) [2,1,3]", PythonTutor.OPTION_D_ERROR],
-                        "answer": "B",
-                        "explanation": "[::-1] reverses the list: [3, 2, 1]"
-                    }
-                ]
-            },
-            {
-                "title": "Logical & Bitwise Operations",
-                "section": "PCEP Section 3.5",
-                "content": """
-PCEP EXAM TOPIC: Logical and bitwise operations
-
-LOGICAL OPERATORS (work with boolean values):
-- and: both must be True
-- or: at least one must be True  
-- not: negation
-
-BITWISE OPERATORS (work with bits in integers):
-- & (AND): 1 if both bits are 1
-- | (OR): 1 if at least one bit is 1
-- ^ (XOR): 1 if bits are different
-- ~ (NOT): flip all bits (NOT x = -x-1)
-- << (left shift): multiply by 2^n
-- >> (right shift): divide by 2^n
-
-EXAMPLES:
-12 in binary: 1100
-10 in binary: 1010
-
-12 & 10 = 1000 = 8
-12 | 10 = 1110 = 14
-12 ^ 10 = 0110 = 6
-~12 = -13
-12 << 1 = 24 (multiply by 2)
-12 >> 1 = 6 (divide by 2)
-
-PRIORITY: ~ > << >> > & > ^ > |
-                """,
-                "example": """
-# Logical operators
-print(True and True)   # True
-print(True and False)  # False
-print(True or False)   # True
-print(not True)        # False
-
-# Bitwise operators
-a = 12  # 1100 in binary
-b = 10  # 1010 in binary
-
-print(a & b)   # 8  (1000 in binary)
-print(a | b)   # 14 (1110 in binary)
-print(a ^ b)   # 6  (0110 in binary)
-print(~a)      # -13
-print(a << 1)  # 24 (shift left = multiply by 2)
-print(a >> 1)  # 6  (shift right = divide by 2)
-
-# Practical use: checking if number is even
-num = 42
-if num & 1 == 0:
-    print("Even")  # If last bit is 0, number is even
-
-# Setting flags
-FLAG_READ = 1   # 001
-FLAG_WRITE = 2  # 010
-FLAG_EXEC = 4   # 100
-
-permissions = FLAG_READ | FLAG_WRITE  # 011 = 3
-print(permissions & FLAG_READ)  # Non-zero, has read permission
-print(permissions & FLAG_EXEC)  # 0, no execute permission
-
-# XOR swap (clever trick)
-x, y = 5, 10
-x = x ^ y
-y = x ^ y
-x = x ^ y
-print(x, y)  # 10, 5 (swapped without temp variable!)
-                """,
-                "exercise": {
-                    "description": "Use bitwise AND to check if number 17 is odd (hint: check last bit)",
-                    "hint": "result = 17 & 1 (if 1, it's odd)",
-                    "check": lambda code: "&" in code and ("17" in code or "num" in code.lower())
-                },
-                "quiz": [
-                    {
-                        "question": "What is 5 & 3?",
-                        "options": ["A) 1", "B) 7", "C) 5", "D) 3"],
-                        "answer": "A",
-                        "explanation": "5=101, 3=011, AND=001=1"
-                    },
-                    {
-                        "question": "What is 8 << 2?",
-                        "options": ["A) 16", "B) 4", "C) 32", "D) 2"],
-                        "answer": "C",
-                        "explanation": "<< 2 shifts left 2 positions = multiply by 4: 8 * 4 = 32"
-                    },
-                    {
-                        "question": "What is ~0?",
-                        "options": ["A) 0", "B) -1", "C) 1", PythonTutor.OPTION_D_ERROR],
-                        "answer": "B",
-                        "explanation": "~x equals -x-1, so ~0 = -0-1 = -1"
-                    }
-                ]
-            },
-            # SECTION 4: Functions, Tuples, Dictionaries
-            {
-                "title": "Functions - Defining & Calling",
-                "section": "PCEP Section 4.1",
-                "content": """
-PCEP EXAM TOPIC: Functions, parameters, return values, scope
-
-FUNCTION DEFINITION:
-def function_name(parameters):
-    \"\"\"Docstring (optional)\"\"\"
-    # function body
-    return value  # optional
-
-KEY CONCEPTS:
-- def keyword starts function definition
-- Parameters are optional
-- return is optional (returns None if omitted)
-- Functions must be defined before calling
-- Docstrings describe function purpose
-
-PARAMETERS:
-- Positional: def func(a, b): ...
-- Default values: def func(a, b=10): ...
-- Keyword arguments: func(a=5, b=10)
-- *args: variable positional arguments (tuple)
-- **kwargs: variable keyword arguments (dict)
-
-SCOPE:
-- Local: variables inside function
-- Global: variables outside functions
-- global keyword: modify global variable inside function
-
-IMPORTANT: None is returned if no return statement
-                """,
-                "example": """
-# Simple function
-def greet():
-    print("Hello!")
-
-greet()  # Call function
-
-# Function with parameters
-def add(a, b):
-    return a + b
-
-result = add(5, 3)
-print(result)  # 8
-
-# Default parameters
-def power(base, exponent=2):
-    return base ** exponent
-
-print(power(5))      # 25 (uses default exponent=2)
-print(power(5, 3))   # 125
-
-# Keyword arguments
-def describe_person(name, age, city):
-    print(f"{name}, {age}, from {city}")
-
-describe_person(age=25, name="Alice", city="NYC")
-
-# Return multiple values (actually a tuple)
-def min_max(numbers):
-    return min(numbers), max(numbers)
-
-minimum, maximum = min_max([1, 5, 3, 9, 2])
-print(minimum, maximum)  # 1 9
-
-# Function returning None
-def no_return():
-    print("I don't return anything")
-
-result = no_return()
-print(result)  # None
-
-# Scope example
-x = 10  # Global
-
-def modify():
-    global x  # Access global x
-    x = 20
-
-modify()
-print(x)  # 20
-
-# Variable arguments
-def sum_all(*numbers):
-    return sum(numbers)
-
-print(sum_all(1, 2, 3, 4))  # 10
-
-def print_info(**kwargs):
-    for key, value in kwargs.items():
-        print(f"{key}: {value}")
-
-print_info(name="Alice", age=25, city="NYC")
-                """,
-                "exercise": {
-                    "description": "Create a function 'rectangle_area' that takes width and height, returns their product",
-                    "hint": "def rectangle_area(width, height): return width * height",
-                    "check": lambda code: 'def' in code.lower() and 'return' in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What does a function return if there's no return statement?",
-                        "options": ["A) 0", "B) None", "C) False", PythonTutor.OPTION_D_ERROR],
-                        "answer": "B",
-                        "explanation": "Functions without return statement return None"
-                    },
-                    {
-                        "question": "What keyword is used to access global variable in function?",
-                        "options": ["A) global", "B) nonlocal", "C) extern", "D) public"],
-                        "answer": "A",
-                        "explanation": "'global' keyword allows modifying global variables inside functions"
-                    },
-                    {
-                        "question": "In def func(a, b=5):, what is b?",
-                        "options": ["A) Required parameter", "B) Default parameter", "C) Keyword parameter", "D) Variable parameter"],
-                        "answer": "B",
-                        "explanation": "b=5 is a default parameter (optional, has default value)"
-                    }
-                ]
-            },
-            {
-                "title": "Tuples - Immutable Sequences",
-                "section": "PCEP Section 4.2",
-                "content": """
-PCEP EXAM TOPIC: Tuples and tuple operations
-
-TUPLES:
-- Ordered, IMMUTABLE sequences
-- Created with parentheses: (1, 2, 3)
-- Or without: 1, 2, 3
-- Single element tuple: (1,) - comma is required!
-- Empty tuple: ()
-- Can contain mixed types
-
-CHARACTERISTICS:
-- Cannot be modified after creation
-- Faster than lists
-- Can be used as dictionary keys (lists cannot!)
-- Indexing and slicing work like lists
-- Can be unpacked: a, b, c = (1, 2, 3)
-
-TUPLE OPERATIONS:
-- len(tuple): get length
-- x in tuple: check membership
-- tuple1 + tuple2: concatenation
-- tuple * n: repetition
-- tuple.count(x): count occurrences
-- tuple.index(x): find index
-
-WHEN TO USE:
-- Data that shouldn't change
-- Return multiple values from function
-- Dictionary keys
-- Faster than lists for read-only data
-                """,
-                "example": """
-# Creating tuples
-coordinates = (10, 20)
-rgb = (255, 128, 0)
-single = (42,)  # Comma is required!
-empty = ()
-
-# Tuple without parentheses
-point = 5, 10, 15
-print(type(point))  # <class 'tuple'>
-
-# Indexing and slicing
-numbers = (1, 2, 3, 4, 5)
-print(numbers[0])     # 1
-print(numbers[-1])    # 5
-print(numbers[1:4])   # (2, 3, 4)
-
-# Tuples are immutable
-# numbers[0] = 10  # TypeError!
-
-# Tuple unpacking
-x, y = (10, 20)
-print(x, y)  # 10 20
-
-# Multiple assignment
-a, b, c = 1, 2, 3
-
-# Swap values
-a, b = b, a
-print(a, b)  # 2 1
-
-# Function returning tuple
-def get_dimensions():
-    return 1920, 1080  # Returns tuple
-
-width, height = get_dimensions()
-
-# Tuple operations
-t1 = (1, 2)
-t2 = (3, 4)
-combined = t1 + t2        # (1, 2, 3, 4)
-repeated = t1 * 3         # (1, 2, 1, 2, 1, 2)
-
-# Tuple methods
-nums = (1, 2, 2, 3, 2)
-print(nums.count(2))      # 3
-print(nums.index(3))      # 3
-
-# Nested tuples
-matrix = ((1, 2), (3, 4), (5, 6))
-print(matrix[1][0])       # 3
-
-# Converting between list and tuple
-my_list = [1, 2, 3]
-my_tuple = tuple(my_list)
-back_to_list = list(my_tuple)
-                """,
-                "exercise": {
-                    "description": "Create a tuple with 3 values and unpack it into three variables",
-                    "hint": "coords = (10, 20, 30) then x, y, z = coords",
-                    "check": lambda code: "," in code and "=" in code
-                },
-                "quiz": [
-                    {
-                        "question": "How do you create a single-element tuple?",
-                        "options": ["A) (1)", "B) (1,)", "C) [1]", "D) 1,"],
-                        "answer": "B",
-                        "explanation": "(1,) creates a tuple. (1) is just 1 in parentheses. Comma is required!"
-                    },
-                    {
-                        "question": "Can tuples be modified after creation?",
-                        "options": [PythonTutor.OPTION_A_YES, PythonTutor.OPTION_B_NO, "C) Only if nested", "D) Only first element"],
-                        "answer": "B",
-                        "explanation": "Tuples are immutable - cannot be changed after creation"
-                    },
-                    {
-                        "question": "What does a, b = b, a do?",
-                        "options": ["A) Error", "B) Swaps a and b", "C) Sets both to b", "D) Creates tuple"],
-                        "answer": "B",
-                        "explanation": "Tuple unpacking allows swapping without temporary variable"
-                    }
-                ]
-            },
-            {
-                "title": "Dictionaries - Key-Value Pairs",
-                "section": "PCEP Section 4.3",
-                "content": """
-PCEP EXAM TOPIC: Dictionaries and dictionary methods
-
-DICTIONARIES:
-- Unordered collection of key-value pairs
-- Created with curly braces: {"key": "value"}
-- Keys must be immutable (strings, numbers, tuples)
-- Keys must be unique
-- Values can be any type
-- Very fast lookups
-
-ACCESSING VALUES:
-- dict[key]: get value (KeyError if key doesn't exist!)
-- dict.get(key, default): safe access (returns default if key missing)
-
-DICTIONARY METHODS (important for PCEP):
-- dict.keys(): get all keys
-- dict.values(): get all values
-- dict.items(): get key-value pairs
-- dict.update(other): merge dictionaries
-- dict.pop(key): remove and return value
-- dict.clear(): remove all items
-- key in dict: check if key exists
-
-OPERATIONS:
-- len(dict): number of items
-- dict[key] = value: add/update
-- del dict[key]: remove item
-                """,
-                "example": """
-# Creating dictionaries
-person = {
-    "name": "Alice",
-    "age": 25,
-    "city": "NYC"
-}
-
-empty_dict = {}
-also_empty = dict()
-
-# Accessing values
-print(person["name"])        # Alice
-print(person.get("age"))     # 25
-print(person.get("email", "N/A"))  # N/A (key doesn't exist)
-
-# Adding/modifying
-person["email"] = "alice@example.com"  # Add
-person["age"] = 26                      # Modify
-
-# Removing items
-age = person.pop("age")      # Remove and return value
-del person["city"]           # Delete key
-# person.clear()             # Remove all items
-
-# Checking membership
-print("name" in person)      # True
-print("age" in person)       # False (we removed it)
-
-# Dictionary methods
-person = {"name": "Alice", "age": 25, "city": "NYC"}
-
-print(person.keys())         # dict_keys(['name', 'age', 'city'])
-print(person.values())       # dict_values(['Alice', 25, 'NYC'])
-print(person.items())        # dict_items([('name', 'Alice'), ...])
-
-# Iterating
-for key in person:
-    print(key, person[key])
-
-for key, value in person.items():
-    print(f"{key}: {value}")
-
-# Update dictionary
-person.update({"job": "Developer", "age": 26})
-print(person)
-
-# Dictionary from lists
-keys = ["a", "b", "c"]
-values = [1, 2, 3]
-d = dict(zip(keys, values))  # {"a": 1, "b": 2, "c": 3}
-
-# Nested dictionaries
-users = {
-    "user1": {"name": "Alice", "age": 25},
-    "user2": {"name": "Bob", "age": 30}
-}
-print(users["user1"]["name"])  # Alice
-
-# Dictionary comprehension
-squares = {x: x**2 for x in range(5)}
-print(squares)  # {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
-                """,
-                "exercise": {
-                    "description": "Create a dictionary 'student' with keys: name, grade, subject. Access grade using .get()",
-                    "hint": "student = {'name': 'John', 'grade': 'A', 'subject': 'Math'}, student.get('grade')",
-                    "check": lambda code: "{" in code and ":" in code and ".get" in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "What happens if you access dict[key] and key doesn't exist?",
-                        "options": ["A) Returns None", "B) Returns 0", "C) KeyError", "D) Returns ''"],
-                        "answer": "C",
-                        "explanation": "Accessing non-existent key with [] raises KeyError. Use .get() for safe access."
-                    },
-                    {
-                        "question": "Can a list be a dictionary key?",
-                        "options": [PythonTutor.OPTION_A_YES, PythonTutor.OPTION_B_NO, "C) Only empty lists", "D) Only if unique"],
-                        "answer": "B",
-                        "explanation": "Dictionary keys must be immutable. Lists are mutable, so cannot be keys."
-                    },
-                    {
-                        "question": "What does dict.items() return?",
-                        "options": ["A) Keys only", "B) Values only", "C) Key-value pairs", "D) Length"],
-                        "answer": "C",
-                        "explanation": "dict.items() returns key-value pairs as tuples"
-                    }
-                ]
-            },
-            # SECTION 5: Modules and Packages
-            {
-                "title": "Modules and Packages",
-                "section": "PCEP Section 4.4",
-                "content": """
-PCEP EXAM TOPIC: Importing and using modules
-
-MODULES:
-- Python file (.py) containing functions, classes, variables
-- Imported using 'import' statement
-- Allows code reusability and organization
-
-IMPORT SYNTAX:
-1. import module_name
-   - Use: module_name.function()
-   
-2. import module_name as alias
-   - Use: alias.function()
-   
-3. from module_name import function
-   - Use: function()
-   
-4. from module_name import *
-   - Imports all (not recommended!)
-
-STANDARD LIBRARY MODULES (important for PCEP):
-- math: mathematical functions
-- random: random number generation
-- platform: platform information
-- sys: system-specific parameters
-
-MODULE ATTRIBUTES:
-- __name__: module name ("__main__" if run directly)
-- dir(module): list all names in module
-
-IMPORTANT:
-- Import statements usually at top of file
-- Each module imported only once
-- from module import * can cause name conflicts
-                """,
-                "example": """
-# Import entire module
-import math
-print(math.pi)           # 3.141592653589793
-print(math.sqrt(16))     # 4.0
-print(math.ceil(3.2))    # 4
-print(math.floor(3.8))   # 3
-
-# Import with alias
-import random as rnd
-print(rnd.randint(1, 10))      # Random number 1-10
-print(rnd.choice(['a', 'b', 'c']))  # Random choice
-
-# Import specific items
-from math import pi, sqrt
-print(pi)       # 3.141592653589793
-print(sqrt(25)) # 5.0 (no math. prefix needed!)
-
-# Platform module
-import platform
-print(platform.platform())  # Platform info
-print(platform.python_version())  # Python version
-
-# Random module functions
-import random
-numbers = [1, 2, 3, 4, 5]
-random.shuffle(numbers)  # Shuffle in place
-print(numbers)
-
-print(random.random())   # Random float 0.0-1.0
-print(random.uniform(1, 10))  # Random float 1.0-10.0
-
-# Math module functions
-import math
-print(math.pow(2, 3))    # 8.0 (same as 2**3)
-print(math.factorial(5)) # 120
-print(math.sin(math.pi/2))  # 1.0
-print(math.log(10))      # Natural log
-print(math.log10(100))   # 2.0 (base 10)
-
-# Dir function - see module contents
-print(dir(math)[:5])  # First 5 names in math module
-
-# __name__ attribute
-print(__name__)  # __main__ if running this file directly
-
-# Creating simple module (in separate file)
-# mymodule.py:
-# def greet(name):
-#     return f"Hello, {name}!"
-# PI = 3.14159
-
-# Using it:
-# import mymodule
-# print(mymodule.greet("Alice"))
-# print(mymodule.PI)
-                """,
-                "exercise": {
-                    "description": "Import the math module and use sqrt to find the square root of 144",
-                    "hint": "import math, then print(math.sqrt(144))",
-                    "check": lambda code: "import" in code.lower() and "math" in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "After 'from math import pi', how do you access pi?",
-                        "options": ["A) math.pi", "B) pi", "C) import.pi", "D) from.pi"],
-                        "answer": "B",
-                        "explanation": "'from math import pi' imports pi directly, use it without prefix"
-                    },
-                    {
-                        "question": "What is __name__ when file is run directly?",
-                        "options": ["A) '__main__'", "B) filename", "C) '__file__'", "D) 'main'"],
-                        "answer": "A",
-                        "explanation": "__name__ is '__main__' when script is executed directly"
-                    },
-                    {
-                        "question": "What does random.randint(1, 10) do?",
-                        "options": ["A) Random float 1-10", "B) Random int 1-9", "C) Random int 1-10", "D) Random int 0-10"],
-                        "answer": "C",
-                        "explanation": "randint(a, b) returns random integer from a to b, inclusive"
-                    }
-                ]
-            },
-            {
-                "title": "Exception Handling",
-                "section": "PCEP Bonus Topic",
-                "content": """
-EXCEPTION HANDLING (basic level for PCEP):
-
-try-except blocks handle errors gracefully:
-
-try:
-    # code that might raise exception
-except ExceptionType:
-    # handle specific exception
-except:
-    # handle any exception (not recommended)
-else:
-    # executes if no exception (optional)
-finally:
-    # always executes (optional)
-
-COMMON EXCEPTIONS:
-- ValueError: invalid value (e.g., int("abc"))
-- TypeError: wrong type
-- KeyError: dictionary key doesn't exist
-- IndexError: list index out of range
-- ZeroDivisionError: division by zero
-- FileNotFoundError: file doesn't exist
-
-RAISING EXCEPTIONS:
-raise ExceptionType("error message")
-                """,
-                "example": """
-# Basic try-except
-try:
-    x = int("abc")  # ValueError
-except ValueError:
-    print("Cannot convert to integer!")
-
-# Multiple except blocks
-try:
-    numbers = [1, 2, 3]
-    print(numbers[10])  # IndexError
-except ValueError:
-    print("Value error occurred")
-except IndexError:
-    print("Index out of range!")
-
-# Generic except (catches all)
-try:
-    result = 10 / 0
-except:
-    print("An error occurred")
-
-# try-except-else-finally
-try:
-    value = int(input("Enter number: "))
-except ValueError:
-    print("Invalid input!")
-else:
-    print(f"You entered: {value}")
-finally:
-    print("This always runs")
-
-# Raising exceptions
-def divide(a, b):
-    if b == 0:
-        raise ValueError("Cannot divide by zero!")
-    return a / b
-
-try:
-    result = divide(10, 0)
-except ValueError as e:
-    print(f"Error: {e}")
-
-# Catching exception object
-try:
-    x = int("abc")
-except ValueError as error:
-    print(f"Caught: {error}")
-
-# Safe input reading
-while True:
-    try:
-        age = int(input("Enter age: "))
-        break
-    except ValueError:
-        print("Please enter a valid number")
-                """,
-                "exercise": {
-                    "description": "Write a try-except block that attempts int conversion and catches ValueError",
-                    "hint": "try: x = int('abc') except ValueError: print('Error')",
-                    "check": lambda code: "try" in code.lower() and "except" in code.lower()
-                },
-                "quiz": [
-                    {
-                        "question": "Which exception is raised for int('hello')?",
-                        "options": ["A) TypeError", "B) ValueError", "C) KeyError", "D) NameError"],
-                        "answer": "B",
-                        "explanation": "Invalid conversion to int raises ValueError"
-                    },
-                    {
-                        "question": "When does the 'finally' block execute?",
-                        "options": ["A) Only if no error", "B) Only if error", "C) Always", "D) Never"],
-                        "answer": "C",
-                        "explanation": "'finally' block always executes, regardless of exceptions"
-                    },
-                    {
-                        "question": "What does 10 / 0 raise?",
-                        "options": ["A) ValueError", "B) TypeError", "C) ZeroDivisionError", "D) ArithmeticError"],
-                        "answer": "C",
-                        "explanation": "Division by zero raises ZeroDivisionError"
-                    }
-                ]
-            },
-            {
-                "title": "PCEP Bonus Questions - Study Guide Edition",
-                "section": "PCEP Bonus",
-                "content": """
-PCEP EXAM PREPARATION: Comprehensive Bonus Questions
-
-This bonus lesson contains 20 additional exam-style questions from the official
-Certify4Sure PCEP-30-02 study guide. These questions represent real exam scenarios.
-
-TOPICS COVERED:
-- Python syntax and semantics
-- Data types and operations
-- Operators and precedence
-- Control flow structures
-- Data structures (lists, dictionaries, tuples, sets)
-- Functions and scope
-- Exception handling
-- String operations and manipulation
-- Input/output operations
-- Modules and imports
-- Number systems (binary, octal, hex)
-- Object-oriented programming
-
-EXAM STRATEGY FOR SUCCESS:
-1. Read carefully - Pay attention to every word in the question
-2. Identify topic - Determine what concept is being tested
-3. Eliminate answers - Rule out obviously wrong options
-4. Review explanations - Learn from each question answered
-5. Track weak areas - Note topics where you're struggling
-6. Practice consistently - Repetition builds mastery
-
-This bonus section provides valuable practice for last-minute exam prep!
-                """,
-                "example": """
-# Example 1: Operator precedence
-result = 2 + 3 * 4  # Multiplication first: 2 + 12 = 14
-print(result)
-
-# Example 2: Type conversion
-value = int("42")
-text = str(3.14)
-print(type(value), type(text))
-
-# Example 3: List operations
-numbers = [1, 2, 3, 4, 5]
-print(numbers[1:4])   # [2, 3, 4]
-print(numbers[-1])    # 5
-print(len(numbers))   # 5
-
-# Example 4: String methods
-message = "Python Programming"
-print(message.lower())      # python programming
-print(message.split())      # ['Python', 'Programming']
-print("o" in message)       # True
-                """,
-                "exercise": {
-                    "description": "Create a function that takes two numbers and returns their sum, then call it with 5 and 7",
-                    "hint": "def add(a, b): return a + b; print(add(5, 7))",
-                    "check": lambda code: "def" in code and "return" in code
-                },
-                "quiz": [
-                    {
-                        "question": "Python is an example of which programming language category?",
-                        "options": ["A) Interpreted", "B) Assembly", "C) Compiled", "D) Machine"],
-                        "answer": "A",
-                        "explanation": "Python is an interpreted language - code is executed by an interpreter at runtime."
-                    },
-                    {
-                        "question": "A set of rules which defines the ways in which words can be coupled in sentences is called:",
-                        "options": ["A) Lexis", "B) Syntax", "C) Semantics", "D) Dictionary"],
-                        "answer": "B",
-                        "explanation": "Syntax defines the rules for proper code structure and grammar."
-                    },
-                    {
-                        "question": "What is the expected output of: len([1, 2, 3])?",
-                        "options": ["A) 1", "B) 2", "C) 3", "D) Error"],
-                        "answer": "C",
-                        "explanation": "len() returns the number of elements in a list. [1, 2, 3] has 3 elements."
-                    },
-                    {
-                        "question": "What does the modulo operator (%) return?",
-                        "options": ["A) Quotient", "B) Remainder", "C) Product", "D) Power"],
-                        "answer": "B",
-                        "explanation": "The % operator returns the remainder after division. 10 % 3 = 1"
-                    },
-                    {
-                        "question": "Which of these is a mutable data type?",
-                        "options": ["A) Tuple", "B) String", "C) List", "D) Integer"],
-                        "answer": "C",
-                        "explanation": "Lists are mutable - their contents can be changed. Tuples and strings are immutable."
-                    },
-                    {
-                        "question": "What is the range of a while loop with condition 'while x < 5'?",
-                        "options": ["A) x from 0 to 4", "B) x from 0 to 5", "C) Depends on x init", "D) Infinite"],
-                        "answer": "C",
-                        "explanation": "The range depends on the initial value of x and how it's modified in the loop."
-                    },
-                    {
-                        "question": "How do you create an empty dictionary?",
-                        "options": ["A) {}", "B) []", "C) ()", "D) None"],
-                        "answer": "A",
-                        "explanation": "Dictionaries use curly braces {}. An empty dictionary is {}."
-                    },
-                    {
-                        "question": "What does the 'in' operator check?",
-                        "options": ["A) Assignment", "B) Membership", "C) Comparison", "D) Type"],
-                        "answer": "B",
-                        "explanation": "'in' checks if a value exists in a sequence like lists, strings, or tuples."
-                    },
-                    {
-                        "question": "Which exception is raised for division by zero?",
-                        "options": ["A) ValueError", "B) TypeError", "C) ZeroDivisionError", "D) RuntimeError"],
-                        "answer": "C",
-                        "explanation": "Division by zero raises ZeroDivisionError: 10 / 0"
-                    },
-                    {
-                        "question": "What is the output of: print(type(42))?",
-                        "options": ["A) <class 'int'>", "B) int", "C) <int>", "D) 42"],
-                        "answer": "A",
-                        "explanation": "type() returns the class of an object as <class 'typename'>."
-                    },
-                    {
-                        "question": "How do you access the last element of a list?",
-                        "options": ["A) list[0]", "B) list[-1]", "C) list[end]", "D) list.last()"],
-                        "answer": "B",
-                        "explanation": "Negative indexing: list[-1] gives the last element, list[-2] the second-to-last, etc."
-                    },
-                    {
-                        "question": "What does 'pass' do in Python?",
-                        "options": ["A) Ends a loop", "B) Does nothing (null operation)", "C) Returns from function", "D) Continues loop"],
-                        "answer": "B",
-                        "explanation": "'pass' is a null operation - when executed, nothing happens. Used as placeholder."
-                    },
-                    {
-                        "question": "Which keyword is used to create a function?",
-                        "options": ["A) function", "B) func", "C) def", "D) define"],
-                        "answer": "C",
-                        "explanation": "The 'def' keyword defines a function in Python."
-                    },
-                    {
-                        "question": "What is a lambda function?",
-                        "options": ["A) Named function", "B) Anonymous function", "C) Built-in function", "D) Class method"],
-                        "answer": "B",
-                        "explanation": "Lambda creates small anonymous functions: lambda x: x * 2"
-                    },
-                    {
-                        "question": "How do you convert string '42' to integer?",
-                        "options": ["A) str(42)", "B) int('42')", "C) convert('42')", "D) '42'.int()"],
-                        "answer": "B",
-                        "explanation": "int() converts a string to an integer. int('42') returns 42"
-                    },
-                    {
-                        "question": "What does the split() method do?",
-                        "options": ["A) Joins strings", "B) Replaces characters", "C) Splits into list", "D) Checks length"],
-                        "answer": "C",
-                        "explanation": "'hello world'.split() returns ['hello', 'world'] - splits by whitespace."
-                    },
-                    {
-                        "question": "Which loop is best for iterating over a list?",
-                        "options": ["A) while loop", "B) for loop", "C) do-while loop", "D) goto loop"],
-                        "answer": "B",
-                        "explanation": "for loops are preferred for iterating over sequences like lists and strings."
-                    },
-                    {
-                        "question": "What does 'elif' stand for?",
-                        "options": ["A) else if", "B) electric if", "C) elif is standalone", "D) else loop"],
-                        "answer": "A",
-                        "explanation": "'elif' is short for 'else if' and provides additional conditions to check."
-                    },
-                    {
-                        "question": "How do you add an element to a list?",
-                        "options": ["A) list.add(item)", "B) list.append(item)", "C) list.push(item)", "D) list += item"],
-                        "answer": "B",
-                        "explanation": ".append() adds a single element to the end of a list."
-                    },
-                    {
-                        "question": "What is the correct way to write a docstring?",
-                        "options": ["A) # comment", "B) // comment", "C) \"\"\"docstring\"\"\"", "D) -- comment"],
-                        "answer": "C",
-                        "explanation": "Docstrings use triple quotes: \"\"\"This is a docstring\"\"\""
-                    }
-                ]
-            }
-        ]
+        # LESSONS: 15 lessons covering all PCEP topics, one module each in
+        # lessons/. Only titles and sections are read here; a lesson's content,
+        # example, exercise and quiz are imported the first time it is opened.
+        self.lessons = lessons.LessonRegistry()
+        
+        # Quiz bank for practice exams, built on first use (see practice_questions)
+        self._practice_questions = None
+        
+        # Per-topic accuracy for adaptive exams, read from the answer log on first use
+        self._topic_stats = None
         
-        # Add quiz bank for practice exams
-        self.practice_questions = self._generate_practice_bank()
+        # Seed for reproducible practice exams (--seed), None for fresh ones
+        self.exam_seed = None
+        
+        # Full-text index over lessons and questions, loaded on the first search
+        self._search_index = None
+    
+    @property
+    def practice_questions(self):
+        """
+        Practice exam question pool, opened the first time it is needed.
+        
+        The generated bank is stored as a memory-mapped bank file (see
+        mapped_bank.py), so later starts neither import the lesson modules
+        nor hold every question text in memory. The file is rebuilt when a
+        question source changes, or one of the modules that normalize,
+        cluster or lay out the bank.
+        """
+        if self._practice_questions is None:
+            here = os.path.dirname(os.path.abspath(__file__))
+            lesson_dir = os.path.dirname(os.path.abspath(lessons.__file__))
+            sources = [os.path.abspath(__file__), question_bank.__file__, near_duplicates.__file__,
+                       mapped_bank.__file__, os.path.join(here, "PCEP_Questions.json")]
+            sources += [os.path.join(lesson_dir, f"{module}.py") for module, _, _ in lessons.LESSON_INDEX]
+            self._practice_questions = mapped_bank.load_bank(
+                os.path.join(here, "__pycache__", "pcep_practice.bank"),
+                mapped_bank.source_key(sources), self._generate_practice_bank)
+        return self._practice_questions
+    
+    @property
+    def topic_stats(self):
+        """Per-topic accuracy (adaptive.TopicPosterior), rebuilt from this learner's answer log records once"""
+        if self._topic_stats is None:
+            self.answer_log.flush()
+            history = answer_log.read_answers(self.answer_log.path) if self.answer_log.path else []
+            self._topic_stats = adaptive.TopicPosterior(history)
+        return self._topic_stats
+    
+    @property
+    def executor(self):
+        """Pool of sandboxed worker processes for example and exercise code"""
+        return self._start_executor()
+    
+    def _start_executor(self):
+        """Start the code execution workers if they are not running yet"""
+        if self._executor is None:
+            self._executor = code_runner.ExecutionPool()
+        return self._executor
+    
+    def _print_output(self, text):
+        """Stream snippet output to the terminal as it arrives"""
+        print(text, end="", flush=True)
     
     def _generate_practice_bank(self):
         """
@@ -1713,27 +161,35 @@ print("o" in message)       # True
         Combines:
         - 62 questions from 15 lesson quizzes
         - 183 questions from Certify4Sure study guide (JSON file)
-        - Total: 245+ questions for diverse exam practice
+        - 35 questions from ADDITIONAL_QUESTIONS and EXTENDED_QUESTIONS
+        - Total: 277 questions for diverse exam practice (3 study guide
+          questions repeat with the same text and options and are kept once)
+        
+        Every source goes through question_bank.normalize_question once here,
+        so exam code only ever sees one question layout.
         
         Returns:
-            list: Question dictionaries with question, options, answer, explanation, topic
+            QuestionBank: Questions indexed by topic, lesson, source, difficulty
+                and exam section
         """
-        questions = []
+        bank = question_bank.QuestionBank()
         
         # Add all lesson quiz questions
-        for lesson in self.lessons:
-            if "quiz" in lesson:
-                for q in lesson["quiz"]:
-                    questions.append({
-                        **q,
-                        "topic": lesson["title"]
-                    })
-        
-        # Add all 183 questions from PCEP study guide PDF
-        pdf_study_questions = self._load_pdf_study_questions()
-        questions.extend(pdf_study_questions)
-        
-        return questions
+        for lesson_num, lesson in enumerate(self.lessons):
+            bank.ingest(lesson.get("quiz", []), question_bank.SOURCE_LESSON_QUIZ,
+                        topic=lesson["title"], lesson=lesson_num,
+                        section=question_bank.section_number(lesson.get("section")))
+        
+        # Add all 183 questions from PCEP study guide PDF (normalized when cached)
+        bank.add_normalized(self._load_pdf_study_questions(), question_bank.SOURCE_STUDY_GUIDE)
+        
+        # Add the extra practice sets (integer "correct" index, unlabelled options)
+        bank.ingest(ADDITIONAL_QUESTIONS, question_bank.SOURCE_ADDITIONAL,
+                    topic=question_bank.SOURCE_ADDITIONAL)
+        bank.ingest(EXTENDED_QUESTIONS, question_bank.SOURCE_EXTENDED,
+                    topic=question_bank.SOURCE_EXTENDED)
+        
+        return bank
     
     def _load_pdf_study_questions(self):
         """
@@ -1744,89 +200,122 @@ print("o" in message)       # True
         - Full 4-option multiple choice format
         - Topic categorization
         
+        The normalized list is served from a compiled cache next to the JSON
+        file, which is rebuilt automatically whenever the JSON changes.
+        
         Returns:
-            list: Formatted question dictionaries, empty list if file not found
+            list: Normalized question dictionaries, empty list if file not found
         """
-        pdf_json_path = os.path.join(os.path.dirname(__file__), "PCEP_Questions.json")
+        pdf_json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PCEP_Questions.json")
+        return question_bank.load_study_questions(pdf_json_path)
+    
+    def close(self):
+        """Save progress and release files and worker processes"""
+        # Fold the session's journaled events into the snapshot file
+        self.save_progress()
+        self.progress_store.close()
+        self.answer_log.close()
+        if self._executor is not None:
+            self._executor.close()
+    
+    def load_progress(self):
+        """Load user's progress (snapshot plus any journaled events)"""
+        state = self.progress_store.load()
+        self.current_lesson = state['current_lesson']
+        self.completed_lessons = state['completed_lessons']
+        self.quiz_scores = state['quiz_scores']
+        self.reviews = scheduler.ReviewScheduler.from_dict(state['reviews'])
+    
+    def record_progress(self, event, **fields):
+        """
+        Append a progress event to the journal.
         
-        if not os.path.exists(pdf_json_path):
-            return []
+        Cheap enough to call after every change; the full progress file is
+        only rewritten by save_progress() on exit.
         
+        Args:
+            event (str): progress_store.EVENT_* constant
+            **fields: Event data (lesson, score)
+        """
+        self._write_progress([(event, fields)])
+    
+    def _write_progress(self, events):
+        """
+        Hand events to the progress store, warning the learner if they were not saved.
+        
+        Returns:
+            bool: True if the store wrote them
+        """
         try:
-            with open(pdf_json_path, 'r') as f:
-                pdf_questions = json.load(f)
-            
-            formatted_questions = []
-            for q in pdf_questions:
-                options = []
-                if isinstance(q.get('options'), dict):
-                    for key in sorted(q['options'].keys()):
-                        options.append(q['options'][key])
-                
-                # Get correct answer index
-                answer_key = q.get('correct_answer', 'A')
-                answer_key = answer_key[0] if answer_key else 'A'
-                correct_idx = ord(answer_key) - ord('A') if answer_key in 'ABCD' else 0
-                
-                # Ensure we have 4 options
-                while len(options) < 4:
-                    options.append("")
-                
-                formatted_questions.append({
-                    "question": q.get('question_text', '')[:150],
-                    "options": options[:4],
-                    "correct": correct_idx,
-                    "answer": answer_key,
-                    "explanation": q.get('explanation', 'See study guide for details.')[:300],
-                    "topic": "PDF Study Guide"
-                })
-            
-            return formatted_questions
-        except Exception:
-            return []
+            self.progress_store.record_batch(events)
+        except OSError as e:
+            print(f"\n⚠️  Progress could not be saved: {e}")
+            return False
+        return True
     
-    def load_progress(self):
-        """Load user's progress from file"""
-        if os.path.exists(self.progress_file):
-            try:
-                with open(self.progress_file, 'r') as f:
-                    data = json.load(f)
-                    self.current_lesson = data.get('current_lesson', 0)
-                    self.completed_lessons = set(data.get('completed_lessons', []))
-                    self.quiz_scores = data.get('quiz_scores', {})
-            except Exception:
-                pass
+    def _record_answer(self, qid, answer, is_correct, latency, mode, topic):
+        """
+        Log an answer and feed it to the review schedule and topic statistics.
+        
+        Args:
+            qid (str): Stable question id (question_bank.question_id)
+            answer (str): Option letter the learner entered
+            is_correct (bool): Whether the learner got it right
+            latency (float): Seconds taken to answer
+            mode (str): "quiz", "exam" or "review"
+            topic (str): Topic of the question
+        """
+        self.answer_log.record(qid, answer, is_correct, latency, mode=mode, topic=topic)
+        if self._topic_stats is not None:
+            self._topic_stats.update(topic, is_correct)
+        self._schedule_review(qid, is_correct)
+    
+    def _schedule_review(self, qid, is_correct):
+        """Reschedule an answered question for spaced review (journaled by _flush_reviews)"""
+        quality = scheduler.QUALITY_CORRECT if is_correct else scheduler.QUALITY_INCORRECT
+        card = self.reviews.review(qid, quality)
+        self._pending_reviews[qid] = card.to_list()
+    
+    def _flush_reviews(self):
+        """Journal the review cards changed since the last flush in one write"""
+        if not self._pending_reviews:
+            return
+        events = [(progress_store.EVENT_REVIEW, {"qid": qid, "card": card})
+                  for qid, card in self._pending_reviews.items()]
+        # Cards that could not be saved stay pending and go out with the next flush
+        if self._write_progress(events):
+            self._pending_reviews.clear()
     
     def save_progress(self):
-        """Save user's progress to file"""
-        try:
-            with open(self.progress_file, 'w') as f:
-                json.dump({
-                    'current_lesson': self.current_lesson,
-                    'completed_lessons': list(self.completed_lessons),
-                    'quiz_scores': self.quiz_scores
-                }, f, indent=2)
-        except Exception:
-            pass
+        """Compact the progress journal into a fresh snapshot file"""
+        self._flush_reviews()
+        self.progress_store.compact({
+            'current_lesson': self.current_lesson,
+            'completed_lessons': self.completed_lessons,
+            'quiz_scores': self.quiz_scores,
+            'reviews': self.reviews.to_dict()
+        })
     
     def clear_screen(self):
-        """Clear the terminal screen"""
-        import subprocess
-        try:
-            if os.name == 'nt':
-                subprocess.run(['cls'], shell=False, check=False)
-            else:
-                subprocess.run(['clear'], shell=False, check=False)
-        except Exception:
-            pass
+        """Clear the terminal screen (ANSI escape codes, no subprocess where possible)"""
+        self.terminal.clear()
     
     def display_menu(self):
-        """Display main menu"""
-        self.clear_screen()
-        print("=" * 70)
-        print("  🎓 PCEP PYTHON CERTIFICATION EXAM TUTOR")
-        print("  Python Certified Entry-Level Programmer Preparation")
-        print("=" * 70)
+        """
+        Display main menu.
+        
+        The frame goes through the terminal renderer, so moving between
+        lessons with n/p only redraws the two rows whose marker changed. On a
+        short terminal the lesson list scrolls to keep the current lesson
+        in view.
+        """
+        header = [
+            "=" * 70,
+            "  🎓 PCEP PYTHON CERTIFICATION EXAM TUTOR",
+            "  Python Certified Entry-Level Programmer Preparation",
+            "=" * 70,
+            "",
+        ]
         
         # Calculate overall progress
         total_lessons = len(self.lessons)
@@ -1838,18 +327,18 @@ print("o" in message)       # True
         total_quizzes = len(self.quiz_scores)
         avg_score = (total_quiz_score / total_quizzes) if total_quizzes > 0 else 0
         
-        print(f"\n📊 Progress: {completed}/{total_lessons} lessons ({progress_pct:.0f}%)", end="")
+        progress = f"📊 Progress: {completed}/{total_lessons} lessons ({progress_pct:.0f}%)"
         if total_quizzes > 0:
-            print(f" | Quiz Average: {avg_score:.0f}%")
-        else:
-            print()
+            progress += f" | Quiz Average: {avg_score:.0f}%"
+        header.append(progress)
         
-        # Group lessons by section
+        # Group lessons by section (index only - lesson bodies stay unloaded)
+        body = []
+        current_row = 0
         current_section = ""
-        for i, lesson in enumerate(self.lessons):
-            section = lesson.get("section", "")
+        for i, (title, section) in enumerate(self.lessons.headers()):
             if section != current_section:
-                print(f"\n{section}:")
+                body.extend(["", f"{section}:"])
                 current_section = section
             
             status = "✓" if i in self.completed_lessons else " "
@@ -1860,15 +349,28 @@ print("o" in message)       # True
             if str(i) in self.quiz_scores:
                 quiz_info = f" [Quiz: {self.quiz_scores[str(i)]}%]"
             
-            print(f"{current}[{status}] {i+1}. {lesson['title']}{quiz_info}")
+            if i == self.current_lesson:
+                current_row = len(body)
+            body.append(f"{current}[{status}] {i+1}. {title}{quiz_info}")
+        
+        footer = [
+            "",
+            "=" * 70,
+            "",
+            "📚 Commands:",
+            "  [number] - Go to lesson",
+            "  n - Next lesson | p - Previous lesson",
+            "  e - Take practice exam (20 questions) | x - Full exam (30 questions)",
+            f"  v - Review due questions ({self.reviews.due_count()} due) | f - Search lessons and questions",
+            "  s - Show study tips | r - Reset progress | q - Quit",
+            "=" * 70,
+        ]
         
-        print("\n" + "=" * 70)
-        print("\n📚 Commands:")
-        print("  [number] - Go to lesson")
-        print("  n - Next lesson | p - Previous lesson")
-        print("  e - Take practice exam (20 random questions)")
-        print("  s - Show study tips | r - Reset progress | q - Quit")
-        print("=" * 70)
+        rows = self.terminal.body_rows(len(header) + len(footer))
+        if rows is not None and len(body) > rows:
+            offset = min(max(0, current_row - rows // 2), len(body) - rows)
+            body = body[offset:offset + rows]
+        self.terminal.render(header + body + footer)
     
     def display_lesson(self, lesson_num):
         """
@@ -1890,6 +392,10 @@ print("o" in message)       # True
         - Lesson 15: Exception handling
         - Lesson 16: Bonus study guide questions
         
+        On an ANSI terminal the content, example and exercise are paged to
+        fit the screen, starting at self.lesson_scroll; scrolling only
+        redraws the visible page, never the whole lesson.
+        
         Args:
             lesson_num (int): Index of lesson to display (0-15)
         """
@@ -1897,46 +403,65 @@ print("o" in message)       # True
             return
         
         lesson = self.lessons[lesson_num]
-        self.clear_screen()
-        
-        print("=" * 70)
-        print(f"  LESSON {lesson_num + 1}: {lesson['title']}")
-        print(f"  {lesson.get('section', '')}")
-        print("=" * 70)
-        
-        print("\n📚 LESSON CONTENT:")
-        print(lesson['content'])
-        
-        print("\n💡 EXAMPLE CODE:")
-        print("-" * 70)
-        print(lesson['example'])
-        print("-" * 70)
-        
-        print("\n✏️  EXERCISE:")
-        print(lesson['exercise']['description'])
-        print(f"💭 Hint: {lesson['exercise']['hint']}")
+        header = [
+            "=" * 70,
+            f"  LESSON {lesson_num + 1}: {lesson['title']}",
+            f"  {lesson.get('section', '')}",
+            "=" * 70,
+        ]
         
+        text = [
+            "",
+            "📚 LESSON CONTENT:",
+            lesson['content'],
+            "",
+            "💡 EXAMPLE CODE:",
+            "-" * 70,
+            lesson['example'],
+            "-" * 70,
+            "",
+            "✏️  EXERCISE:",
+            lesson['exercise']['description'],
+            f"💭 Hint: {lesson['exercise']['hint']}",
+        ]
         # Show quiz info if available
         if "quiz" in lesson:
-            print(f"\n📝 Quiz available ({len(lesson['quiz'])} questions)")
-        
-        print("\n" + "=" * 70)
-        print("Options:")
-        print("  t - Try the example code")
-        print("  e - Do the exercise")
+            text.extend(["", f"📝 Quiz available ({len(lesson['quiz'])} questions)"])
+        body = self.terminal.fit("\n".join(text).split("\n"))
+        
+        footer = [
+            "",
+            "=" * 70,
+            "Options:",
+            "  t - Try the example code",
+            "  e - Do the exercise",
+        ]
         if "quiz" in lesson:
-            print("  q - Take the quiz for this lesson")
-        print("  m - Back to menu")
-        print("=" * 70)
+            footer.append("  q - Take the quiz for this lesson")
+        footer.append("  m - Back to menu")
+        footer.append("=" * 70)
+        
+        # One extra fixed row for the scroll position line
+        rows = self.terminal.body_rows(len(header) + len(footer) + 1)
+        self.lesson_page_rows = rows
+        if rows is not None and len(body) > rows:
+            total = len(body)
+            self.lesson_scroll = max(0, min(self.lesson_scroll, total - rows))
+            first = self.lesson_scroll
+            body = body[first:first + rows]
+            footer.insert(1, f"  Lines {first + 1}-{first + rows} of {total}"
+                             " | Enter/d - Scroll down | u - Scroll up")
+        self.terminal.render(header + body + footer)
     
     def run_example(self, lesson_num):
         """
         Execute and display lesson example code in a sandboxed environment.
         
         Features:
+        - Runs in a pre-warmed worker process with CPU, memory and time limits
         - Safely executes example code with restricted built-ins
         - Prevents access to dangerous functions (open, import, eval, etc.)
-        - Displays code output for learning
+        - Streams code output for learning (cached after the first run)
         - Handles errors gracefully
         - Uses whitelisted builtins for security
         
@@ -1947,24 +472,15 @@ print("o" in message)       # True
         print("\n🔧 Running example code...\n")
         print("-" * 70)
         
-        try:
-            # Use restricted namespace for safer code execution
-            restricted_globals = {
-                '__builtins__': {
-                    'print': print, 'len': len, 'range': range, 
-                    'enumerate': enumerate, 'zip': zip, 'list': list, 
-                    'dict': dict, 'set': set, 'tuple': tuple, 'str': str, 
-                    'int': int, 'float': float, 'bool': bool, 'type': type, 
-                    'max': max, 'min': min, 'sum': sum, 'sorted': sorted, 
-                    'reversed': reversed, 'filter': filter, 'map': map
-                }
-            }
-            exec(lesson['example'], restricted_globals)
-        except Exception as e:
-            print(f"Error: {e}")
+        # Restricted builtins (code_runner.SAFE_BUILTINS) for safer code execution
+        # Examples are deterministic, so a re-run just replays the first output
+        result = self.executor.run(lesson['example'], restricted=True,
+                                   on_output=self._print_output, memoize=True, cache=True)
+        if result.error:
+            print(f"Error: {result.error}")
         
         print("-" * 70)
-        input(self.PRESS_ENTER_NEWLINE)
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
     
     def take_quiz(self, lesson_num):
         """
@@ -1977,7 +493,7 @@ print("o" in message)       # True
         4. Show immediate feedback with explanation
         5. Calculate final score
         6. Mark lesson as complete if score >= 80%
-        7. Save progress to JSON file
+        7. Journal the score (and completion) to the progress store
         
         Args:
             lesson_num (int): Index of lesson to quiz
@@ -1985,7 +501,7 @@ print("o" in message)       # True
         lesson = self.lessons[lesson_num]
         if "quiz" not in lesson:
             print("\nNo quiz available for this lesson.")
-            input(self.PRESS_ENTER)
+            self.io.pause(self.PRESS_ENTER)
             return
         
         quiz = lesson["quiz"]
@@ -1994,7 +510,7 @@ print("o" in message)       # True
         print("=" * 70)
         print(f"\nThis quiz has {len(quiz)} questions. Answer carefully!")
         print("Enter A, B, C, or D for each question.\n")
-        input("Press Enter to start...")
+        self.io.pause("Press Enter to start...")
         
         correct = 0
         for i, q in enumerate(quiz, 1):
@@ -2006,25 +522,33 @@ print("o" in message)       # True
                 print(f"  {opt}")
             print()
             
+            asked_at = time.monotonic()
             while True:
-                answer = input("Your answer (A/B/C/D): ").strip().upper()
+                answer = self.io.ask("Your answer (A/B/C/D): ").strip().upper()
                 if answer in ['A', 'B', 'C', 'D']:
                     break
                 print("Please enter A, B, C, or D")
             
-            if answer == q["answer"]:
+            is_correct = (answer == q["answer"])
+            self._record_answer(question_bank.question_id(q), answer, is_correct,
+                                time.monotonic() - asked_at, "quiz", lesson["title"])
+            if is_correct:
                 print("\n✅ Correct!")
                 correct += 1
             else:
                 print(f"\n❌ Incorrect. The correct answer is {q['answer']}")
             
             print(f"\n💡 Explanation: {q['explanation']}")
-            input("\nPress Enter for next question...")
+            self.io.pause("\nPress Enter for next question...")
+        
+        self.answer_log.flush()
+        self._flush_reviews()
         
         # Calculate score
         score = int((correct / len(quiz)) * 100)
         self.quiz_scores[str(lesson_num)] = score
-        self.save_progress()
+        self.record_progress(progress_store.EVENT_QUIZ, lesson=lesson_num, score=score)
+        self.io.report("quiz", lesson=lesson_num, correct=correct, total=len(quiz), score=score)
         
         # Show results
         self.clear_screen()
@@ -2037,13 +561,13 @@ print("o" in message)       # True
         if score >= 80:
             print("🎉 Excellent work! You've mastered this topic!")
             self.completed_lessons.add(lesson_num)
-            self.save_progress()
+            self.record_progress(progress_store.EVENT_COMPLETED, lesson=lesson_num)
         elif score >= 60:
             print("👍 Good job! Review the lesson to improve further.")
         else:
             print("📚 Keep studying! Review the lesson and try again.")
         
-        input(self.PRESS_ENTER_NEWLINE)
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
     
     def do_exercise(self, lesson_num):
         """
@@ -2077,7 +601,7 @@ print("o" in message)       # True
         code_lines = []
         while True:
             try:
-                line = input(">>> " if not code_lines else "... ")
+                line = self.io.ask(">>> " if not code_lines else "... ")
                 if line.strip().lower() == 'done':
                     break
                 elif line.strip().lower() == 'cancel':
@@ -2093,65 +617,101 @@ print("o" in message)       # True
             print("\n✅ Great job! Your solution looks good!")
             print("\nLet's run it:")
             print("-" * 70)
-            try:
-                exec(user_code)
-            except Exception as e:
-                print(f"Runtime error: {e}")
+            # Runs in a worker process, so an endless loop can't hang the tutor
+            result = self.executor.run(user_code, restricted=False, on_output=self._print_output)
+            if result.error:
+                print(f"Runtime error: {result.error}")
             print("-" * 70)
             
             print("\n🎉 Exercise completed!")
+            self.io.report("exercise", lesson=lesson_num, passed=True,
+                           output=result.output, error=result.error)
         else:
             print("\n⚠️  Your code doesn't quite match the exercise requirements.")
             print("💭 Check the hint and try again!")
+            self.io.report("exercise", lesson=lesson_num, passed=False)
         
-        input(self.PRESS_ENTER_NEWLINE)
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
     
-    def _ask_exam_question(self, i, q):
-        """Ask a single exam question and return answer"""
+    def _ask_exam_question(self, i, q, total, remaining=None):
+        """
+        Ask a single exam question and time the answer.
+        
+        Args:
+            i (int): Question number
+            q (dict): Question to ask
+            total (int): Number of questions in the exam
+            remaining (float): Seconds left on the exam clock, None if untimed
+        
+        Returns:
+            tuple: (answer letter, seconds from showing the question to a valid answer)
+        """
         self.clear_screen()
-        print(f"\n📝 Question {i}/20:\n")
+        clock = f"  ⏱️  {_format_duration(remaining)} left" if remaining is not None else ""
+        print(f"\n📝 Question {i}/{total}:{clock}\n")
         print(q["question"])
         print()
         for opt in q["options"]:
             print(f"  {opt}")
         print()
         
+        asked_at = time.monotonic()
         while True:
-            answer = input("Your answer (A/B/C/D): ").strip().upper()
+            answer = self.io.ask("Your answer (A/B/C/D): ").strip().upper()
             if answer in ['A', 'B', 'C', 'D']:
-                return answer
+                return answer, time.monotonic() - asked_at
             print("Please enter A, B, C, or D")
     
-    def _show_exam_results(self, correct, results):
+    def _show_exam_results(self, correct, results, blueprint):
         """
         Display practice exam results with detailed feedback and review.
         
         Shows:
-        1. Score and pass/fail status (70% = passing)
-        2. Topic-by-topic breakdown of performance
+        1. Score and pass/fail status (blueprint's passing score)
+        2. Section and topic breakdown of performance, and pacing (time per
+           section, slowest questions)
         3. Incorrect answers with correct solutions
         4. Detailed explanations for learning
         5. Recommendations for improvement
         
         Args:
             correct (int): Number of questions answered correctly
-            results (list): List of answer records with explanations
+            results (list): Answer records (question text and explanation are
+                looked up in the bank by id for the incorrect ones)
+            blueprint (exam_blueprint.Blueprint): The exam that was taken
         """
-        score = int((correct / 20) * 100)
+        score = int((correct / len(results)) * 100)
         
         self.clear_screen()
         print("\n" + "=" * 70)
-        print("  📊 PRACTICE EXAM RESULTS")
+        print(f"  📊 {blueprint.name} RESULTS")
         print("=" * 70)
-        print(f"\nYou got {correct} out of 20 questions correct!")
+        print(f"\nYou got {correct} out of {len(results)} questions correct!")
         print(f"Score: {score}%\n")
         
-        if score >= 70:
+        if score >= blueprint.passing_score:
             print("🎉 PASS! You're ready for the PCEP exam!")
         else:
             print("📚 Keep studying! Review weak areas and try again.")
         
-        print(f"\nPassing score: 70% (You scored: {score}%)")
+        print(f"\nPassing score: {blueprint.passing_score}% (You scored: {score}%)")
+        
+        # Section breakdown against the blueprint
+        print("\nBy exam section:")
+        for section in blueprint.section_weights:
+            answered = [r for r in results if r["section"] == section]
+            if answered:
+                right = sum(1 for r in answered if r["is_correct"])
+                print(f"  Section {section}: {right}/{len(answered)} correct")
+        
+        self._show_pacing(results, blueprint)
+        
+        # Weakest topics so far - these get more questions in the next exam
+        topics = sorted({r["topic"] for r in results}, key=self.topic_stats.error_rate, reverse=True)
+        print("\nTopics to focus on (error rate over all your answers):")
+        for topic in topics[:3]:
+            print(f"  {topic}: {self.topic_stats.error_rate(topic):.0%} "
+                  f"({self.topic_stats.answered(topic)} answered)")
         
         # Show incorrect answers
         print("\n" + "=" * 70)
@@ -2160,20 +720,63 @@ print("o" in message)       # True
         
         for i, r in enumerate(results, 1):
             if not r["is_correct"]:
-                print(f"\n❌ Q{i}: {r['question']}")
-                print(f"   Your answer: {r['your_answer']}")
+                q = self.practice_questions.find(r["id"])
+                print(f"\n❌ Q{i}: {q['question'] if q else r['id']}")
+                print(f"   Your answer: {r['your_answer'] or '(not answered - time ran out)'}")
                 print(f"   Correct: {r['correct_answer']}")
                 print(f"   Topic: {r['topic']}")
-                print(f"   Explanation: {r['explanation']}")
+                if q:
+                    print(f"   Explanation: {q['explanation']}")
+        
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
+    
+    def _show_pacing(self, results, blueprint):
+        """
+        Print how the exam time was spent.
         
-        input(self.PRESS_ENTER_NEWLINE)
+        Args:
+            results (list): Answer records with latency and section
+            blueprint (exam_blueprint.Blueprint): The exam that was taken
+        """
+        answered = [r for r in results if r["your_answer"]]
+        if not answered:
+            return
+        spent = sum(r["latency"] for r in answered)
+        print("\n⏱️  Pacing:")
+        if blueprint.time_limit:
+            target = blueprint.time_limit / blueprint.question_count
+            print(f"  Time used: {_format_duration(spent)} of {_format_duration(blueprint.time_limit)}")
+            print(f"  Average: {spent / len(answered):.0f}s per question (target {target:.0f}s)")
+        else:
+            print(f"  Time used: {_format_duration(spent)}")
+            print(f"  Average: {spent / len(answered):.0f}s per question")
+        
+        for section in blueprint.section_weights:
+            timed = [r["latency"] for r in answered if r["section"] == section]
+            if timed:
+                print(f"  Section {section}: {_format_duration(sum(timed))} "
+                      f"({sum(timed) / len(timed):.0f}s per question)")
+        
+        numbered = [(r["latency"], i) for i, r in enumerate(results, 1) if r["your_answer"]]
+        slowest = sorted(numbered, reverse=True)[:3]
+        print("  Slowest: " + ", ".join(f"Q{i} ({_format_duration(latency)})" for latency, i in slowest))
+        if len(answered) < len(results):
+            print(f"  ⏰ Time ran out with {len(results) - len(answered)} questions unanswered")
     
-    def take_practice_exam(self):
+    def take_practice_exam(self, blueprint=exam_blueprint.PRACTICE_EXAM):
         """
-        Take a 20-question practice exam simulating the real PCEP exam.
+        Take a practice exam simulating the real PCEP exam.
         
         Features:
-        - Randomly samples 20 questions from 245+ question pool
+        - Follows a blueprint: question count and the PCEP section weights
+          (18/29/25/28%) - 20 questions by default, or the full 30-question
+          exam with exam_blueprint.PCEP_EXAM
+        - Within each section, draws more from topics with a high error rate
+          in earlier answers (adaptive.py)
+        - Reproducible question selection when --seed is given
+        - Timed blueprints (the 40-minute full exam) run against a monotonic
+          deadline; questions left when it passes count as unanswered
+        - Every answer is timed for the pacing report
         - No immediate feedback during exam (like real PCEP exam)
         - Questions from original lessons + study guide
         - Shows score and pass/fail status (70% = pass)
@@ -2183,43 +786,199 @@ print("o" in message)       # True
         Question sources:
         - Original 62 quiz questions from 15 lessons
         - 183 questions from Certify4Sure study guide
+        - 35 questions from ADDITIONAL_QUESTIONS and EXTENDED_QUESTIONS
+        
+        Args:
+            blueprint (exam_blueprint.Blueprint): Exam to assemble
         """
-        if len(self.practice_questions) < 20:
+        total = blueprint.question_count
+        
+        # Fill the section quotas, weighted towards topics answered wrongly before
+        try:
+            questions = exam_blueprint.assemble(self.practice_questions, blueprint,
+                                                seed=self.exam_seed, posterior=self.topic_stats)
+        except ValueError:
             print("\nNot enough questions available for practice exam.")
-            input(self.PRESS_ENTER)
+            self.io.pause(self.PRESS_ENTER)
             return
         
-        # Select 20 random questions
-        questions = random.sample(self.practice_questions, 20)
-        
         print("\n" + "=" * 70)
-        print("  🎯 PCEP PRACTICE EXAM")
+        print(f"  🎯 {blueprint.name}")
         print("=" * 70)
-        print("\nThis practice exam has 20 questions covering all PCEP topics.")
-        print("Passing score: 70%")
+        print(f"\nThis exam has {total} questions covering all PCEP sections.")
+        print(f"Passing score: {blueprint.passing_score}%")
+        if blueprint.time_limit:
+            print(f"Time limit: {_format_duration(blueprint.time_limit)} - the clock starts now.")
         print("\nAnswer carefully - this simulates the real exam!")
-        input(self.PRESS_ENTER_NEWLINE)
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
+        
+        deadline = time.monotonic() + blueprint.time_limit if blueprint.time_limit else None
         
         correct = 0
         results = []
         
         for i, q in enumerate(questions, 1):
-            answer = self._ask_exam_question(i, q)
+            qid = question_bank.question_id(q)
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            answer, latency = None, 0.0
+            if remaining is None or remaining > 0:
+                answer, latency = self._ask_exam_question(i, q, total, remaining)
+                if deadline is not None and time.monotonic() > deadline:
+                    answer = None  # submitted after the time ran out
             is_correct = (answer == q["answer"])
             
             if is_correct:
                 correct += 1
             
+            if answer is not None:
+                self._record_answer(qid, answer, is_correct, latency, "exam", q["topic"])
+            # Text and explanation are read back from the bank if the review needs them
             results.append({
-                "question": q["question"],
+                "id": qid,
                 "your_answer": answer,
                 "correct_answer": q["answer"],
                 "is_correct": is_correct,
-                "explanation": q["explanation"],
-                "topic": q["topic"]
+                "latency": latency,
+                "topic": q["topic"],
+                "section": q["section"]
             })
         
-        self._show_exam_results(correct, results)
+        self.answer_log.flush()
+        self._flush_reviews()
+        score = int((correct / len(results)) * 100)
+        self.io.report("exam", name=blueprint.name, correct=correct, total=len(results), score=score,
+                       passed=score >= blueprint.passing_score, answers=[
+                           {"id": r["id"], "answer": r["your_answer"], "correct": r["is_correct"],
+                            "latency": round(r["latency"], 3), "section": r["section"]}
+                           for r in results
+                       ])
+        self._show_exam_results(correct, results, blueprint)
+    
+    def review_due(self, limit=10):
+        """
+        Review questions whose spaced-repetition interval has run out.
+        
+        Every quiz and exam answer schedules its question (SM-2): correct
+        answers come back after growing intervals, missed ones the next day.
+        This session asks the most overdue questions with immediate feedback
+        and reschedules each one from the new answer.
+        
+        Args:
+            limit (int): Maximum number of questions in one session
+        """
+        # Cards whose question left the bank (e.g. after a question id
+        # change) are dropped for good, then the next due ones fill their place
+        while True:
+            questions = []
+            dropped = False
+            for qid in self.reviews.due(limit):
+                q = self.practice_questions.find(qid)
+                if q is None:
+                    self.reviews.discard(qid)
+                    self.record_progress(progress_store.EVENT_DISCARD, qid=qid)
+                    dropped = True
+                else:
+                    questions.append((qid, q))
+            if not dropped:
+                break
+        
+        if not questions:
+            print("\n✅ Nothing to review right now.")
+            next_due = self.reviews.next_due()
+            if next_due is not None:
+                print(f"Next review: {time.strftime('%Y-%m-%d %H:%M', time.localtime(next_due))}")
+            self.io.pause(self.PRESS_ENTER)
+            return
+        
+        correct = 0
+        for i, (qid, q) in enumerate(questions, 1):
+            self.clear_screen()
+            print(f"\n🔁 Review {i}/{len(questions)} ({q['topic']}):\n")
+            print(q["question"])
+            print()
+            for opt in q["options"]:
+                print(f"  {opt}")
+            print()
+            
+            asked_at = time.monotonic()
+            while True:
+                answer = self.io.ask("Your answer (A/B/C/D): ").strip().upper()
+                if answer in ['A', 'B', 'C', 'D']:
+                    break
+                print("Please enter A, B, C, or D")
+            
+            is_correct = (answer == q["answer"])
+            self._record_answer(qid, answer, is_correct, time.monotonic() - asked_at,
+                                "review", q["topic"])
+            if is_correct:
+                print("\n✅ Correct!")
+                correct += 1
+            else:
+                print(f"\n❌ Incorrect. The correct answer is {q['answer']}")
+            
+            print(f"\n💡 Explanation: {q['explanation']}")
+            self.io.pause("\nPress Enter for next question...")
+        
+        self.answer_log.flush()
+        self._flush_reviews()
+        self.io.report("review", reviewed=len(questions), correct=correct)
+        print(f"\nReviewed {len(questions)} questions, {correct} correct.")
+        self.io.pause(self.PRESS_ENTER)
+    
+    def _search_snippet(self, kind, ref, terms):
+        """Return the first line of a search hit that contains one of the query terms"""
+        if kind == search_index.KIND_LESSON:
+            lesson = self.lessons[ref]
+            text = "\n".join([lesson.get("content", ""), lesson.get("example", "")])
+        else:
+            q = self.practice_questions.find(ref)
+            text = "\n".join([q["question"], *q["options"], q["explanation"]]) if q else ""
+        for line in text.splitlines():
+            if any(term in search_index.tokenize(line) for term in terms):
+                return line.strip()[:64]
+        return ""
+    
+    def search(self):
+        """
+        Search lessons and practice questions for a word or phrase.
+        
+        Results are ranked with BM25 over an inverted index of every lesson
+        (title, content, example) and every practice question (text, options,
+        explanation). The index is built on the first search and persisted,
+        so later sessions load it instantly. Typing a lesson number opens it.
+        """
+        if self._search_index is None:
+            docs = search_index.documents(self.lessons, self.practice_questions)
+            self._search_index = search_index.load_index(docs)
+        
+        self.clear_screen()
+        print("=" * 70)
+        print("  🔍 SEARCH LESSONS AND QUESTIONS")
+        print("=" * 70)
+        query = self.io.ask("\nSearch for (e.g. bitwise, slicing): ").strip()
+        terms = search_index.tokenize(query)
+        if not terms:
+            return
+        
+        results = self._search_index.search(query)
+        if not results:
+            print(f"\nNo lessons or questions mention '{query}'.")
+            self.io.pause(self.PRESS_ENTER)
+            return
+        
+        print(f"\nTop {len(results)} results for '{query}':\n")
+        for score, kind, ref, title in results:
+            snippet = self._search_snippet(kind, ref, terms)
+            if kind == search_index.KIND_LESSON:
+                print(f"  📘 Lesson {ref + 1}: {title}")
+            else:
+                print(f"  ❓ Question: {title[:60]}")
+            if snippet:
+                print(f"       …{snippet}")
+        
+        choice = self.io.ask("\nLesson number to open, or Enter to return: ").strip()
+        if choice.isdigit():
+            self._handle_lesson_choice(choice)
     
     def show_study_tips(self):
         """Display PCEP exam study tips"""
@@ -2284,34 +1043,38 @@ KEY THINGS TO MEMORIZE:
 - Mutable vs immutable types
 - Boolean truthy/falsy values
         """)
-        input(self.PRESS_ENTER_NEWLINE)
+        self.io.pause(self.PRESS_ENTER_NEWLINE)
     
     def _handle_navigation_choice(self, choice):
         """Handle navigation commands (n, p)"""
         if choice == 'n' and self.current_lesson < len(self.lessons) - 1:
             self.current_lesson += 1
-            return True
-        if choice == 'p' and self.current_lesson > 0:
+        elif choice == 'p' and self.current_lesson > 0:
             self.current_lesson -= 1
-            return True
-        return False
+        else:
+            return False
+        self.record_progress(progress_store.EVENT_CURRENT, lesson=self.current_lesson)
+        return True
     
     def _handle_reset_progress(self):
         """Handle progress reset command"""
-        confirm = input("Are you sure you want to reset progress? (yes/no): ")
+        confirm = self.io.ask("Are you sure you want to reset progress? (yes/no): ")
         if confirm.lower() == 'yes':
             self.completed_lessons.clear()
             self.quiz_scores.clear()
+            self.reviews = scheduler.ReviewScheduler()
+            self._pending_reviews.clear()
             self.current_lesson = 0
-            self.save_progress()
+            self.record_progress(progress_store.EVENT_RESET)
             print("Progress reset!")
-            input(self.PRESS_ENTER)
+            self.io.pause(self.PRESS_ENTER)
     
     def _handle_lesson_choice(self, choice):
         """Handle numeric lesson selection"""
         lesson_num = int(choice) - 1
         if 0 <= lesson_num < len(self.lessons):
             self.current_lesson = lesson_num
+            self.record_progress(progress_store.EVENT_CURRENT, lesson=lesson_num)
             self.lesson_mode(lesson_num)
             return True
         return False
@@ -2324,24 +1087,36 @@ KEY THINGS TO MEMORIZE:
         - Choose a lesson number (1-16) to learn and quiz
         - Press 'n'/'p' to navigate to next/previous lesson
         - Press 'e' to take a 20-question practice exam
+        - Press 'x' to take the full 30-question PCEP exam simulation
+        - Press 'v' to review questions that are due again
+        - Press 'f' to search lessons and questions
         - Press 's' to view study tips
         - Press 'r' to reset progress
         - Press 'q' to quit the application
         
-        Loop continues until user quits, saving progress after each action.
+        Loop continues until user quits, journaling progress after each action.
         """
         while True:
             self.display_menu()
             
-            choice = input("\nYour choice: ").strip().lower()
+            choice = self.io.ask("\nYour choice: ").strip().lower()
             
             if choice == 'q':
                 print("\n👋 Good luck on your PCEP exam! Keep coding!")
                 break
             elif self._handle_navigation_choice(choice):
                 continue
-            elif choice == 'e':
+            
+            # Every other command writes below (or over) the menu frame
+            self.terminal.invalidate()
+            if choice == 'e':
                 self.take_practice_exam()
+            elif choice == 'x':
+                self.take_practice_exam(exam_blueprint.PCEP_EXAM)
+            elif choice == 'v':
+                self.review_due()
+            elif choice == 'f':
+                self.search()
             elif choice == 's':
                 self.show_study_tips()
             elif choice == 'r':
@@ -2350,14 +1125,33 @@ KEY THINGS TO MEMORIZE:
                 self._handle_lesson_choice(choice)
             else:
                 print("Invalid choice!")
-                input(self.PRESS_ENTER)
+                self.io.pause(self.PRESS_ENTER)
+    
+    def _scroll_lesson(self, choice):
+        """Handle lesson scrolling commands (Enter/d, u); return True if handled"""
+        page = self.lesson_page_rows
+        if choice in ('', 'd'):
+            if page:
+                self.lesson_scroll += page
+            return True
+        if choice == 'u':
+            if page:
+                self.lesson_scroll = max(0, self.lesson_scroll - page)
+            return True
+        return False
     
     def lesson_mode(self, lesson_num):
         """Interactive mode for a specific lesson"""
+        self._start_executor()  # pre-warm the workers while the lesson is read
+        self.lesson_scroll = 0
         while True:
             self.display_lesson(lesson_num)
-            choice = input("\nYour choice: ").strip().lower()
+            choice = self.io.ask("\nYour choice: ").strip().lower()
             
+            if self._scroll_lesson(choice):
+                continue
+            # Every other command writes below (or over) the lesson frame
+            self.terminal.invalidate()
             if choice == 'm':
                 break
             elif choice == 't':
@@ -2368,21 +1162,128 @@ KEY THINGS TO MEMORIZE:
                 self.take_quiz(lesson_num)
             else:
                 print("Invalid choice!")
-                input(self.PRESS_ENTER)
+                self.io.pause(self.PRESS_ENTER)
+
+
+def _format_duration(seconds):
+    """Format seconds as m:ss"""
+    minutes, seconds = divmod(int(max(0, seconds)), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def precompile_snippets():
+    """
+    Compile every lesson example and practice snippet into the shared code
+    cache used by the execution workers.
+    
+    Returns:
+        tuple: (snippets compiled, snippets with syntax errors)
+    """
+    sources = [lesson['example'] for lesson in lessons.LessonRegistry()]
+    for practice in (CODE_PRACTICE, EXTENDED_PRACTICE):
+        sources.extend(item['code'] for item in practice.values())
+    failures = code_runner.SnippetCache().precompile(sources)
+    return len(sources), failures
+
+
+def bank_validation_records():
+    """
+    Collect every question the practice bank is built from, in raw form.
+    
+    Returns:
+        list: bank_validator records for the lesson quizzes, the study guide
+            JSON and the additional/extended practice sets
+    """
+    import bank_validator
+    
+    records = []
+    for lesson_num, lesson in enumerate(lessons.LessonRegistry()):
+        source = f"Lesson {lesson_num + 1} quiz"
+        records.extend(bank_validator.to_record(q, source, i) for i, q in enumerate(lesson.get("quiz", [])))
+    pdf_json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PCEP_Questions.json")
+    try:
+        records.extend(bank_validator.load_json_records(pdf_json_path, question_bank.SOURCE_STUDY_GUIDE))
+    except (OSError, ValueError):
+        pass
+    for source, questions in ((question_bank.SOURCE_ADDITIONAL, ADDITIONAL_QUESTIONS),
+                              (question_bank.SOURCE_EXTENDED, EXTENDED_QUESTIONS)):
+        records.extend(bank_validator.to_record(q, source, i) for i, q in enumerate(questions))
+    return records
+
+
+def _parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="PCEP Python Exam Tutor")
+    parser.add_argument("--db", metavar="PATH",
+                        help="store progress in a shared SQLite database instead of the local JSON file")
+    parser.add_argument("--user", default=None,
+                        help="learner name for --db (default: the login name)")
+    parser.add_argument("--precompile", action="store_true",
+                        help="compile all example and practice code into the snippet cache and exit")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed practice exam question selection for reproducible exams")
+    parser.add_argument("--script", metavar="FILE",
+                        help="run scripted sessions headless from FILE ('-' for stdin) and print JSON results")
+    parser.add_argument("--results", metavar="FILE",
+                        help="with --script, write the JSON Lines results to FILE instead of stdout")
+    parser.add_argument("--validate-bank", nargs="?", const="", metavar="JSON",
+                        help="check the question bank (or a question JSON file) for broken entries and exit")
+    parser.add_argument("--import-text", metavar="TXT",
+                        help="convert a 'QUESTION n' text dump (like PCEP_Questions.txt) to question JSON and exit")
+    parser.add_argument("--output", metavar="JSON",
+                        help="with --import-text, the JSON file to write (default: TXT with a .json suffix)")
+    parser.add_argument("--force", action="store_true",
+                        help="with --import-text, replace an existing JSON file")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="with --validate-bank or --import-text, number of worker processes (default: CPU count)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report per-phase startup time and peak memory, compared with the baseline")
+    parser.add_argument("--profile-output", metavar="FILE",
+                        help="with --profile-startup, also dump cProfile stats to FILE")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="with --profile-startup, save this run as startup_baseline.json")
+    return parser.parse_args(argv)
 
 
 def main():
     """Entry point for the application"""
-    tutor = PythonTutor()
+    args = _parse_args()
+    if args.precompile:
+        compiled, failures = precompile_snippets()
+        print(f"Compiled {compiled - failures} snippets ({failures} with syntax errors)")
+        return
+    if args.validate_bank is not None:
+        import bank_validator
+        if args.validate_bank:
+            records = bank_validator.load_json_records(args.validate_bank)
+        else:
+            records = bank_validation_records()
+        sys.exit(bank_validator.run(records, args.jobs))
+    if args.import_text:
+        import text_importer
+        sys.exit(text_importer.run(args.import_text, args.output, args.jobs, args.force))
+    if args.script:
+        import headless
+        sys.exit(headless.run(PythonTutor, args.script, args.results))
+    if args.profile_startup:
+        import startup_profile
+        sys.exit(startup_profile.run(PythonTutor, args.profile_output, args.update_baseline))
+    
+    # Batch each screen's output into one write (input() flushes it)
+    terminal.use_buffered_stdout()
+    
+    store = None
+    if args.db:
+        store = progress_store.SQLiteProgressStore(args.db, args.user or getpass.getuser())
+    tutor = PythonTutor(store)
+    tutor.exam_seed = args.seed
     try:
         tutor.run()
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
         sys.exit(0)
-
-
-if __name__ == "__main__":
-    main()
+    finally:
+        tutor.close()
 
 
 # Additional Practice Questions and Code Examples
@@ -2999,3 +1900,7 @@ for i in range(3):
 """
     }
 }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,727 @@
+"""
+Question bank loading and indexing for the PCEP tutor.
+
+Parsing PCEP_Questions.json and reformatting every entry is the most expensive
+part of tutor startup, and it grows with the question bank. This module keeps
+a compiled copy of the normalized questions next to the JSON file:
+
+- The cache is a marshal file holding the normalized question list
+- It is keyed by the JSON file's mtime, size and SHA-256 hash
+- A stale or unreadable cache is rebuilt automatically from the JSON
+- A read-only install directory simply falls back to parsing the JSON
+
+JSON question files are parsed incrementally (iter_json_questions), one
+question at a time, whether they hold a JSON array or JSON Lines, so even a
+question set of hundreds of MB is normalized and indexed without the whole
+file or a second copy of it in memory.
+
+QuestionBank holds the combined practice pool column by column (texts,
+option tuples, one-byte answer codes and sections, interned topics) and
+indexes it by topic, lesson, source, difficulty and PCEP exam section so
+exams and drills can sample any subset without scanning the whole bank.
+Questions are handed out as compact Question rows. Near-identical questions
+(see near_duplicates.py) are never sampled together.
+"""
+
+import codecs
+import hashlib
+import json
+import marshal
+import os
+import random
+import re
+import sys
+from array import array
+
+import atomic_file
+import near_duplicates
+
+
+CACHE_VERSION = 4
+CACHE_SUFFIX = ".cache"
+
+
+SOURCE_LESSON_QUIZ = "Lesson Quiz"
+SOURCE_STUDY_GUIDE = "PDF Study Guide"
+SOURCE_ADDITIONAL = "Additional Practice"
+SOURCE_EXTENDED = "Extended Practice"
+
+_OPTION_LABEL = re.compile(r"[A-D][).]\s+")
+
+# Bytes read per step while streaming a JSON question file
+STREAM_CHUNK_SIZE = 1 << 16
+# Largest single question accepted (keeps a malformed item from pulling in the whole file)
+MAX_ITEM_CHARS = 1 << 24
+_JSON_SKIP = re.compile(r"[\s,]*")
+_JSON_PARTIAL_TOKEN = re.compile(r"[\w.+-]*")
+
+DIFFICULTY_EASY = "easy"
+DIFFICULTY_MEDIUM = "medium"
+DIFFICULTY_HARD = "hard"
+
+# PCEP exam sections (see show_study_tips) and keywords that point to each,
+# used to place questions that don't come with a lesson section
+EXAM_SECTIONS = (1, 2, 3, 4)
+_SECTION_KEYWORDS = {
+    1: ("interpret", "compil", "source code", "bytecode", "cpython", "keyword",
+        "indentation", "comment", "lexis", "syntax", "semantic", "python 3"),
+    2: ("literal", "variable", "input(", "int(", "float(", "str(", "sep=", "end=",
+        "operator", "**", "//", "%", "octal", "hexadecimal", "0o", "0x", "scientific",
+        "string", "concatenat", "escape", "type("),
+    3: ("true", "false", "boolean", "if ", "elif", "else", "while", "for ", "break",
+        "continue", "range(", "list", "append", "insert", "del ", "slic", " and ",
+        " or ", "not ", "bitwise", "<<", ">>", "=="),
+    4: ("def ", "return", "function", "lambda", "global", "tuple", "dictionar",
+        "items()", "keys()", "import", "module", "package", "except", "raise",
+        "try:", "exception", "none", "argument", "parameter", "recursi"),
+}
+_SECTION_PATTERN = re.compile("|".join(
+    re.escape(word) for words in _SECTION_KEYWORDS.values() for word in words
+))
+_SECTION_OF_KEYWORD = {word: section for section, words in _SECTION_KEYWORDS.items() for word in words}
+_SECTION_LABEL = re.compile(r"Section (\d)")
+
+
+def _file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def question_id(question):
+    """
+    Return a stable id for a question, derived from its text.
+
+    Positions in the bank shift as questions are added, so logs and progress
+    data refer to questions by a short hash of the question text and option
+    texts instead (many study guide questions share the same wording, e.g.
+    "What is the expected output of the following code?"). Option labels
+    are ignored, so a lesson quiz question and its normalized copy agree.
+
+    Args:
+        question: Question or question dictionary
+
+    Returns:
+        str: 12-character hex id
+    """
+    digest = hashlib.sha1(question.get("question", "").encode('utf-8'))
+    for option in question.get("options", []):
+        digest.update(b"\x00" + _option_text(option).encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+def _option_text(option):
+    """Strip an existing "A) " / "A. " label from an option"""
+    match = _OPTION_LABEL.match(option)
+    return option[match.end():] if match else option
+
+
+def normalize_question(raw, topic):
+    """
+    Convert a question from any supported source into the bank schema.
+
+    Accepted layouts:
+    - Lesson quizzes: question, options (labelled list), answer letter
+    - ADDITIONAL_QUESTIONS / EXTENDED_QUESTIONS: options (unlabelled list),
+      integer correct index
+    - Study guide JSON: question_text, options dict keyed by letter,
+      correct_answer letters
+
+    Args:
+        raw (dict): Question in one of the layouts above
+        topic (str): Topic shown in exam reviews
+
+    Returns:
+        dict: Question with question, options ("A) ..." labels), answer
+            letter, explanation and topic
+    """
+    if "question_text" in raw:
+        text = raw.get('question_text', '')
+        explanation = raw.get('explanation', 'See study guide for details.')
+        options = raw.get('options')
+        options = [options[key] for key in sorted(options)] if isinstance(options, dict) else []
+        answer = raw.get('correct_answer', 'A')
+    else:
+        text = raw.get('question', '')
+        explanation = raw.get('explanation', '')
+        options = list(raw.get('options', []))
+        answer = raw['answer'] if 'answer' in raw else chr(ord('A') + raw.get('correct', 0))
+
+    # Multi-answer keys keep their first letter (the quiz takes one answer)
+    answer = answer[0] if answer else 'A'
+    if answer not in 'ABCD':
+        answer = 'A'
+
+    return {
+        "question": text,
+        "options": [f"{chr(ord('A') + i)}) {_option_text(opt)}" for i, opt in enumerate(options[:4])],
+        "answer": answer,
+        "explanation": explanation,
+        "topic": topic
+    }
+
+
+def iter_json_questions(path, digest=None):
+    """
+    Yield the questions of a JSON file one at a time.
+
+    The file may hold a JSON array of question objects (like
+    PCEP_Questions.json) or JSON Lines with one object per line. It is read
+    in STREAM_CHUNK_SIZE pieces and only the unparsed tail is kept, so memory
+    stays flat however large the file is. Items that are not objects are
+    skipped.
+
+    Args:
+        path (str): JSON or JSON Lines file
+        digest: hashlib object updated with every byte read, if given
+
+    Yields:
+        dict: Raw question in the file's layout (see normalize_question)
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file is not valid JSON, or one item is larger
+            than MAX_ITEM_CHARS
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8-sig')()
+    with open(path, 'rb') as f:
+        def read_more():
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if digest is not None:
+                digest.update(chunk)
+            return text.decode(chunk, final=not chunk), not chunk
+
+        buffer, pos = "", 0
+        in_array = None
+        eof = False
+        while True:
+            pos = _JSON_SKIP.match(buffer, pos).end()
+            if pos == len(buffer) or pos > STREAM_CHUNK_SIZE:
+                # Drop what has been parsed and read the next piece
+                buffer, pos = buffer[pos:], 0
+                if not eof:
+                    more, eof = read_more()
+                    buffer += more
+                    continue
+                if not buffer:
+                    if in_array:
+                        raise ValueError("unterminated JSON array")
+                    return
+            if in_array is None:
+                in_array = buffer[pos] == "["
+                pos += in_array
+                continue
+            if in_array and buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # An item cut off by the end of the piece fails at the end of
+                # the buffer, inside a partial literal there ("tr"), or at the
+                # opening quote of a string still being read; any other error
+                # is real and raised right away
+                cut_off = (_JSON_PARTIAL_TOKEN.fullmatch(buffer, e.pos)
+                           or e.msg.startswith("Unterminated string"))
+                if eof or not cut_off:
+                    raise
+            else:
+                # A number that reaches the end of the piece may go on in the
+                # next one ("12." of "12.5e3")
+                if eof or not _JSON_PARTIAL_TOKEN.fullmatch(buffer, end):
+                    pos = end
+                    if isinstance(item, dict):
+                        yield item
+                    continue
+            if len(buffer) - pos > MAX_ITEM_CHARS:
+                raise ValueError(f"question at character {pos} is larger than "
+                                 f"{MAX_ITEM_CHARS} characters")
+            more, eof = read_more()
+            buffer += more
+
+
+def _read_cache(cache_path, stat, json_path):
+    """
+    Return cached questions if the cache matches the JSON file, else None.
+
+    The mtime/size pair is checked first so an unchanged file is never
+    re-read; the content hash only decides when the mtime has moved (for
+    example after a fresh checkout).
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            version, mtime_ns, size, digest, questions = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if version != CACHE_VERSION or size != stat.st_size:
+        return None
+    if mtime_ns == stat.st_mtime_ns:
+        return questions
+    if digest == _file_digest(json_path):
+        # Same content with a new mtime - refresh the key so the next start is fast
+        _write_cache(cache_path, stat, digest, questions)
+        return questions
+    return None
+
+
+def _write_cache(cache_path, stat, digest, questions):
+    """Atomically write the compiled cache, ignoring unwritable locations"""
+    try:
+        atomic_file.atomic_write(
+            cache_path, marshal.dumps((CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, questions)))
+    except OSError:
+        pass
+
+
+def load_study_questions(json_path, use_cache=True):
+    """
+    Load normalized study guide questions, using the compiled cache when fresh.
+
+    Args:
+        json_path (str): Path to PCEP_Questions.json
+        use_cache (bool): Read and refresh the compiled cache next to the JSON
+
+    Returns:
+        list: Normalized question dictionaries, empty list if file not found
+    """
+    try:
+        stat = os.stat(json_path)
+    except OSError:
+        return []
+
+    cache_path = json_path + CACHE_SUFFIX
+    if use_cache:
+        questions = _read_cache(cache_path, stat, json_path)
+        if questions is not None:
+            return questions
+
+    digest = hashlib.sha256()
+    questions = []
+    try:
+        for raw in iter_json_questions(json_path, digest):
+            question = normalize_question(raw, SOURCE_STUDY_GUIDE)
+            # Classified once here so the cache carries the section
+            question["section"] = classify_section(question)
+            questions.append(question)
+    except (OSError, ValueError, AttributeError, TypeError):
+        return []
+
+    if use_cache:
+        _write_cache(cache_path, stat, digest.hexdigest(), questions)
+    return questions
+
+
+def estimate_difficulty(question, source):
+    """
+    Estimate a question's difficulty when the source does not provide one.
+
+    Lesson quiz questions check a single concept right after it is taught, so
+    they count as easy. Study guide questions are exam-style (medium), and
+    become hard when they include a code listing or ask for several answers.
+
+    Args:
+        question (dict): Question dictionary
+        source (str): SOURCE_LESSON_QUIZ or SOURCE_STUDY_GUIDE
+
+    Returns:
+        str: DIFFICULTY_EASY, DIFFICULTY_MEDIUM or DIFFICULTY_HARD
+    """
+    if source == SOURCE_LESSON_QUIZ:
+        return DIFFICULTY_EASY
+    text = question.get("question", "")
+    if "\n" in text.strip() or "(Select two answers" in text:
+        return DIFFICULTY_HARD
+    return DIFFICULTY_MEDIUM
+
+
+def section_number(label):
+    """
+    Return the exam section (1-4) named in a lesson's section label.
+
+    Args:
+        label (str): Lesson section such as "PCEP Section 3.4"
+
+    Returns:
+        int: Section number, or None for labels without one (bonus lessons)
+    """
+    match = _SECTION_LABEL.search(label or "")
+    return int(match.group(1)) if match else None
+
+
+def classify_section(question):
+    """
+    Guess the PCEP exam section of a question from keywords in its text.
+
+    The section whose keywords match most often wins. Ties go to the later
+    section: a question using def and print() is about functions, since the
+    later sections build on the earlier ones.
+
+    Args:
+        question (dict): Question in the bank schema
+
+    Returns:
+        int: Exam section (1-4)
+    """
+    text = " ".join([question.get("question", "")] + list(question.get("options", []))).lower()
+    scores = dict.fromkeys(EXAM_SECTIONS, 0)
+    for word in _SECTION_PATTERN.findall(text):
+        scores[_SECTION_OF_KEYWORD[word]] += 1
+    best = max(scores.values())
+    if best == 0:
+        return 2  # the largest section
+    return max(section for section, score in scores.items() if score == best)
+
+
+ANSWER_LETTERS = "ABCD"
+
+
+class Question:
+    """
+    One practice question, without a per-question dict.
+
+    Topic and difficulty strings are interned (a bank has a few dozen
+    distinct topics shared by thousands of questions), the answer is stored
+    as its option index and options as a tuple. Exam and review screens read
+    questions with the same subscripts as lesson quiz dicts (q["answer"],
+    q.get("topic")), so both kinds go through the same code.
+
+    Args:
+        question (str): Question text
+        options (tuple): Labelled options ("A) ...")
+        answer_code (int): Index of the correct option (0 for A)
+        explanation (str): Why the answer is right
+        topic (str): Topic shown in exam reviews
+        section (int): PCEP exam section
+        difficulty (str): Difficulty label, None if not known
+    """
+
+    __slots__ = ("question", "options", "answer_code", "explanation", "topic", "section", "difficulty")
+
+    def __init__(self, question, options, answer_code, explanation, topic, section=None, difficulty=None):
+        self.question = question
+        self.options = options
+        self.answer_code = answer_code
+        self.explanation = explanation
+        self.topic = topic
+        self.section = section
+        self.difficulty = difficulty
+
+    @classmethod
+    def from_dict(cls, question):
+        """Build a Question from a dict in the bank schema (see normalize_question)"""
+        answer = question.get("answer", "A")
+        return cls(
+            question.get("question", ""),
+            tuple(question.get("options", ())),
+            ANSWER_LETTERS.index(answer) if answer in ANSWER_LETTERS else 0,
+            question.get("explanation", ""),
+            sys.intern(question.get("topic", "")),
+            question.get("section"),
+            question.get("difficulty"),
+        )
+
+    @property
+    def answer(self):
+        """Letter of the correct option"""
+        return ANSWER_LETTERS[self.answer_code]
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        """Return a field like dict.get (None fields count as missing)"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def to_dict(self):
+        """Return the question in the bank schema"""
+        question = {
+            "question": self.question,
+            "options": list(self.options),
+            "answer": self.answer,
+            "explanation": self.explanation,
+            "topic": self.topic,
+            "section": self.section,
+        }
+        if self.difficulty is not None:
+            question["difficulty"] = self.difficulty
+        return question
+
+
+class QuestionBank:
+    """
+    Practice question pool with precomputed lookup indexes.
+
+    Every question gets an integer id (its position in the bank). Ids are
+    bucketed by topic, lesson, source, difficulty and exam section as
+    questions are added, so looking up a bucket is a dict access and sampling
+    from it costs O(1) per draw instead of a scan over the whole bank. Filter
+    combinations are intersected once and cached.
+
+    Fields are kept in parallel columns rather than one object per question:
+    answer codes and sections in byte arrays, topics and difficulties as
+    interned strings. bank[i] builds the Question row on demand.
+    """
+
+    def __init__(self):
+        self._text = []
+        self._options = []
+        self._answer = array('B')
+        self._explanation = []
+        self._topic = []
+        self._section = array('B')
+        self._difficulty = []
+        self._indexes = {"topic": {}, "lesson": {}, "source": {}, "difficulty": {}, "section": {}}
+        self._combined = {}
+        self._by_stable_id = {}
+        self._clusters = None
+
+    def __len__(self):
+        return len(self._text)
+
+    def __getitem__(self, question_id):
+        return Question(self._text[question_id], self._options[question_id], self._answer[question_id],
+                        self._explanation[question_id], self._topic[question_id],
+                        self._section[question_id], self._difficulty[question_id])
+
+    def __iter__(self):
+        for question_id in range(len(self._text)):
+            yield self[question_id]
+
+    def column(self, name):
+        """
+        Return one field of every question, in id order (do not modify).
+
+        Args:
+            name (str): "question", "options", "answer_code", "explanation",
+                "topic", "section" or "difficulty"
+        """
+        return {
+            "question": self._text,
+            "options": self._options,
+            "answer_code": self._answer,
+            "explanation": self._explanation,
+            "topic": self._topic,
+            "section": self._section,
+            "difficulty": self._difficulty,
+        }[name]
+
+    def add(self, question, source, lesson=None, difficulty=None, section=None):
+        """
+        Add a question and index it.
+
+        Logs, exam results and review cards refer to questions by stable id,
+        so a question whose stable id is already in the bank (same text and
+        options) is not added again: the copy added first is the one every
+        lookup returns, whatever answer key the later copy carries.
+
+        Args:
+            question: Question, or dict with question, options, answer,
+                explanation and topic
+            source (str): Where the question came from (SOURCE_* constant)
+            lesson (int): Index of the lesson the question belongs to, if any
+            difficulty (str): Difficulty label, estimated when omitted
+            section (int): PCEP exam section, classified by keyword when omitted
+
+        Returns:
+            int: The question's id (the earlier copy's for a duplicate)
+        """
+        if not isinstance(question, Question):
+            question = Question.from_dict(question)
+        stable_id = question_id(question)
+        if stable_id in self._by_stable_id:
+            return self._by_stable_id[stable_id]
+        new_id = len(self._text)
+        self._by_stable_id[stable_id] = new_id
+        if difficulty is None:
+            difficulty = question.difficulty or estimate_difficulty(question, source)
+        if section is None:
+            section = question.section or classify_section(question)
+        difficulty = sys.intern(difficulty)
+
+        self._text.append(question.question)
+        self._options.append(question.options)
+        self._answer.append(question.answer_code)
+        self._explanation.append(question.explanation)
+        self._topic.append(sys.intern(question.topic))
+        self._section.append(section)
+        self._difficulty.append(difficulty)
+        keys = {
+            "topic": question.topic,
+            "lesson": lesson,
+            "source": source,
+            "difficulty": difficulty,
+            "section": section,
+        }
+        for name, key in keys.items():
+            self._indexes[name].setdefault(key, []).append(new_id)
+        self._combined.clear()
+        return new_id
+
+    def ingest(self, raw_questions, source, topic, lesson=None, section=None):
+        """
+        Normalize questions from any supported layout and add them.
+
+        Args:
+            raw_questions (iterable): Question dicts (see normalize_question)
+            source (str): SOURCE_* constant for all of them
+            topic (str): Topic for all of them
+            lesson (int): Lesson index, if they belong to a lesson
+            section (int): Exam section of all of them (classified per question if None)
+
+        Returns:
+            int: Number of questions added (duplicates of questions already
+                in the bank are not counted)
+        """
+        before = len(self)
+        for raw in raw_questions:
+            self.add(normalize_question(raw, topic), source=source, lesson=lesson, section=section)
+        return len(self) - before
+
+    def ingest_file(self, path, source, topic=None, section=None):
+        """
+        Stream a JSON array or JSON Lines question file into the bank.
+
+        Each question is parsed, normalized and indexed as it is read (see
+        iter_json_questions), so large imported sets never sit in memory
+        twice.
+
+        Args:
+            path (str): Question file in any layout normalize_question accepts
+            source (str): SOURCE_* constant (or vendor name) for all of them
+            topic (str): Topic for all of them (defaults to source)
+            section (int): Exam section of all of them (classified per question if None)
+
+        Returns:
+            int: Number of questions added
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the file is not valid JSON (questions read before
+                the error stay in the bank)
+        """
+        return self.ingest(iter_json_questions(path), source, topic or source, section=section)
+
+    def add_normalized(self, questions, source, lesson=None):
+        """Add questions that are already in the bank schema (e.g. from the cache)"""
+        for question in questions:
+            self.add(question, source=source, lesson=lesson)
+
+    def find(self, stable_id):
+        """
+        Return the question with a given stable id, or None if it is not in the bank.
+
+        Args:
+            stable_id (str): Id from question_id() (as stored in logs and progress)
+        """
+        index = self._by_stable_id.get(stable_id)
+        return None if index is None else self[index]
+
+    def clusters(self):
+        """
+        Return the near-duplicate cluster id of every question.
+
+        Computed on first use, so building the bank stays cheap; the
+        practice bank file (mapped_bank) stores the ids, so the clustering
+        only runs when that file is rebuilt.
+        """
+        if self._clusters is None or len(self._clusters) != len(self):
+            self._clusters = near_duplicates.cluster(list(self))
+        return self._clusters
+
+    def keys(self, index):
+        """Return the distinct values of one index (topic, lesson, source, difficulty, section)"""
+        return list(self._indexes[index])
+
+    def labels(self, index):
+        """
+        Return every question's key in one index, in id order.
+
+        Args:
+            index (str): topic, lesson, source, difficulty or section
+        """
+        labels = [None] * len(self)
+        for key, bucket in self._indexes[index].items():
+            for qid in bucket:
+                labels[qid] = key
+        return labels
+
+    def ids(self, topic=None, lesson=None, source=None, difficulty=None, section=None):
+        """
+        Return the ids of questions matching every given filter.
+
+        Single filters return the precomputed bucket directly; combinations
+        are built from the smallest bucket once and then cached.
+
+        Returns:
+            list: Question ids (do not modify - buckets are shared)
+        """
+        filters = tuple(
+            (name, key) for name, key in (
+                ("topic", topic), ("lesson", lesson), ("source", source),
+                ("difficulty", difficulty), ("section", section)
+            ) if key is not None
+        )
+        if not filters:
+            return range(len(self))
+        if len(filters) == 1:
+            name, key = filters[0]
+            return self._indexes[name].get(key, [])
+
+        cached = self._combined.get(filters)
+        if cached is None:
+            buckets = sorted((self._indexes[name].get(key, []) for name, key in filters), key=len)
+            others = [set(bucket) for bucket in buckets[1:]]
+            cached = [qid for qid in buckets[0] if all(qid in other for other in others)]
+            self._combined[filters] = cached
+        return cached
+
+    def count(self, **filters):
+        """Return how many questions match the filters"""
+        return len(self.ids(**filters))
+
+    def sample(self, k, rng=random, taken_clusters=None, **filters):
+        """
+        Draw k questions matching the filters, no two of them near duplicates.
+
+        Args:
+            k (int): Number of questions to draw
+            rng (random.Random): Random source (module-level random by default)
+            taken_clusters (set): Clusters already used by the caller (e.g. in
+                other sections of the same exam); updated with the new picks
+            **filters: topic, lesson, source, difficulty and/or section
+
+        Returns:
+            list: Questions
+
+        Raises:
+            ValueError: If fewer than k distinct questions match
+        """
+        ids = self.ids(**filters)
+        clusters = self.clusters()
+        taken = set() if taken_clusters is None else taken_clusters
+        picked = []
+        for qid in rng.sample(ids, k):
+            if clusters[qid] not in taken:
+                taken.add(clusters[qid])
+                picked.append(qid)
+        if len(picked) < k:
+            # Near duplicates collided - top up from the unused clusters
+            free = [qid for qid in ids if clusters[qid] not in taken]
+            rng.shuffle(free)
+            for qid in free:
+                if len(picked) == k:
+                    break
+                if clusters[qid] not in taken:
+                    taken.add(clusters[qid])
+                    picked.append(qid)
+            if len(picked) < k:
+                raise ValueError("Not enough distinct questions")
+        return [self[qid] for qid in picked]
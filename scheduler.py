@@ -0,0 +1,165 @@
+"""
+Spaced-repetition review scheduling for the PCEP tutor.
+
+Every question the learner answers becomes a review card scheduled with the
+SM-2 algorithm: a correct answer pushes the next review further out (by the
+card's ease factor), a wrong answer brings it back the next day and lowers
+the ease. Cards sit in a heap keyed by due time, so finding the next due
+card costs O(log n) however many questions have been seen.
+"""
+
+import heapq
+import time
+
+
+DAY_SECONDS = 24 * 60 * 60
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+
+# SM-2 answer quality (0-5) for the tutor's right/wrong answers
+QUALITY_CORRECT = 4
+QUALITY_INCORRECT = 1
+
+
+class ReviewCard:
+    """
+    Scheduling state of one question.
+
+    Attributes:
+        qid (str): Question id (question_bank.question_id)
+        ease (float): SM-2 ease factor
+        interval (int): Days between the last review and the next one
+        reps (int): Correct reviews in a row
+        due (float): Epoch seconds when the card is next due
+    """
+
+    __slots__ = ("qid", "ease", "interval", "reps", "due")
+
+    def __init__(self, qid, ease=INITIAL_EASE, interval=0, reps=0, due=0.0):
+        self.qid = qid
+        self.ease = ease
+        self.interval = interval
+        self.reps = reps
+        self.due = due
+
+    def to_list(self):
+        """Return the compact [ease, interval, reps, due] form used in progress data"""
+        return [round(self.ease, 3), self.interval, self.reps, round(self.due, 1)]
+
+
+class ReviewScheduler:
+    """
+    SM-2 scheduler with a due-time heap.
+
+    The heap holds (due, qid) entries; rescheduling a card pushes a new entry
+    and leaves the old one behind, which is skipped when it surfaces because
+    it no longer matches the card's due time.
+    """
+
+    def __init__(self):
+        self.cards = {}
+        self._heap = []
+
+    @classmethod
+    def from_dict(cls, reviews):
+        """
+        Build a scheduler from progress data.
+
+        Args:
+            reviews (dict): {qid: [ease, interval, reps, due]}
+        """
+        scheduler = cls()
+        for qid, (ease, interval, reps, due) in reviews.items():
+            scheduler.cards[qid] = ReviewCard(qid, ease, interval, reps, due)
+        scheduler._heap = [(card.due, qid) for qid, card in scheduler.cards.items()]
+        heapq.heapify(scheduler._heap)
+        return scheduler
+
+    def to_dict(self):
+        """Return progress data for every card ({qid: [ease, interval, reps, due]})"""
+        return {qid: card.to_list() for qid, card in self.cards.items()}
+
+    def __len__(self):
+        return len(self.cards)
+
+    def review(self, qid, quality, now=None):
+        """
+        Record an answer and reschedule the question (SM-2).
+
+        Args:
+            qid (str): Question id
+            quality (int): 0-5 answer quality (QUALITY_CORRECT / QUALITY_INCORRECT)
+            now (float): Current epoch seconds (defaults to time.time())
+
+        Returns:
+            ReviewCard: The updated card
+        """
+        now = time.time() if now is None else now
+        card = self.cards.get(qid)
+        if card is None:
+            card = self.cards[qid] = ReviewCard(qid)
+
+        if quality < 3:
+            card.reps = 0
+            card.interval = 1
+        else:
+            card.reps += 1
+            if card.reps == 1:
+                card.interval = 1
+            elif card.reps == 2:
+                card.interval = 6
+            else:
+                card.interval = int(round(card.interval * card.ease))
+        card.ease = max(MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        card.due = now + card.interval * DAY_SECONDS
+
+        heapq.heappush(self._heap, (card.due, qid))
+        return card
+
+    def discard(self, qid):
+        """Forget a question (e.g. one that is no longer in the bank)"""
+        self.cards.pop(qid, None)
+
+    def _drop_stale(self):
+        """Pop heap entries that no longer match their card's due time"""
+        heap = self._heap
+        while heap:
+            due, qid = heap[0]
+            card = self.cards.get(qid)
+            if card is not None and card.due == due:
+                return
+            heapq.heappop(heap)
+
+    def next_due(self):
+        """Return the due time of the earliest card, or None if there are no cards"""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def due(self, limit, now=None):
+        """
+        Return up to limit question ids that are due, most overdue first.
+
+        Costs O(limit log n); the entries stay scheduled until review() moves them.
+
+        Args:
+            limit (int): Maximum number of ids
+            now (float): Current epoch seconds (defaults to time.time())
+
+        Returns:
+            list: Question ids
+        """
+        now = time.time() if now is None else now
+        taken = []
+        while len(taken) < limit:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            taken.append(heapq.heappop(self._heap))
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return [qid for _, qid in taken]
+
+    def due_count(self, cap=99, now=None):
+        """Return how many questions are due, counting at most cap of them"""
+        return len(self.due(cap, now))
@@ -0,0 +1,161 @@
+"""
+Full-text search over lessons and practice questions for the PCEP tutor.
+
+An inverted index maps every word to the documents containing it (lesson
+title, content and example; question text, options and explanation) with
+its term frequency. Queries are ranked with Okapi BM25, touching only the
+posting lists of the query words, so a search takes milliseconds.
+
+Building the index means tokenizing every lesson and question, so it is
+persisted with marshal in __pycache__ together with a hash of the indexed
+text, and only rebuilt when a lesson or question changes.
+"""
+
+import hashlib
+import heapq
+import marshal
+import math
+import os
+import re
+
+import atomic_file
+import question_bank
+
+
+INDEX_VERSION = 1
+INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__pycache__", "pcep_search.marshal"
+)
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+KIND_LESSON = "lesson"
+KIND_QUESTION = "question"
+
+_TOKEN = re.compile(r"[a-z_][a-z0-9_]*|\d+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or the this to what which "
+    "with will that following code output expected".split()
+)
+
+
+def tokenize(text):
+    """Return the lowercase search terms of a text, without stop words"""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def documents(lessons, bank):
+    """
+    Return the searchable documents as (kind, ref, title, text) tuples.
+
+    Args:
+        lessons (LessonRegistry): All lessons (every body gets loaded)
+        bank (QuestionBank): Practice questions
+
+    Returns:
+        list: ref is the lesson index or the question's stable id
+    """
+    docs = []
+    for lesson_num, lesson in enumerate(lessons):
+        text = "\n".join([lesson["title"], lesson.get("content", ""), lesson.get("example", "")])
+        docs.append((KIND_LESSON, lesson_num, lesson["title"], text))
+    for question in bank:
+        text = "\n".join([question["question"], *question["options"], question["explanation"]])
+        title = question["question"].strip().splitlines()[0] if question["question"].strip() else ""
+        docs.append((KIND_QUESTION, question_bank.question_id(question), title, text))
+    return docs
+
+
+def content_hash(docs):
+    """Return a hash of every document's text (the persisted index's key)"""
+    digest = hashlib.sha1()
+    for _, ref, _, text in docs:
+        digest.update(f"{ref}\x00{text}\x01".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SearchIndex:
+    """
+    Inverted index with BM25 ranking.
+
+    Args:
+        docs (list): (kind, ref, title) for each document
+        postings (dict): {term: [(doc number, term frequency), ...]}
+        lengths (list): Number of terms in each document
+    """
+
+    def __init__(self, docs, postings, lengths):
+        self.docs = docs
+        self.postings = postings
+        self.lengths = lengths
+        self.average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    @classmethod
+    def build(cls, docs):
+        """Tokenize documents ((kind, ref, title, text) tuples) into a new index"""
+        postings = {}
+        lengths = []
+        for number, (_, _, _, text) in enumerate(docs):
+            terms = tokenize(text)
+            lengths.append(len(terms))
+            counts = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                postings.setdefault(term, []).append((number, count))
+        return cls([(kind, ref, title) for kind, ref, title, _ in docs], postings, lengths)
+
+    def search(self, query, limit=10):
+        """
+        Rank documents for a query with BM25.
+
+        Args:
+            query (str): Words to look for
+            limit (int): Maximum number of results
+
+        Returns:
+            list: (score, kind, ref, title) tuples, best first
+        """
+        n = len(self.docs)
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for number, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[number] / self.average_length)
+                scores[number] = scores.get(number, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, *self.docs[number]) for number, score in best]
+
+
+def load_index(docs, path=INDEX_PATH):
+    """
+    Return the index for docs, read from disk when the content hash matches.
+
+    A missing, stale or unreadable index file is rebuilt and rewritten
+    atomically; an unwritable location just skips persisting.
+
+    Args:
+        docs (list): Documents from documents()
+        path (str): marshal file for the persisted index
+    """
+    key = content_hash(docs)
+    try:
+        with open(path, 'rb') as f:
+            version, cached_key, entries, postings, lengths = marshal.loads(f.read())
+        if version == INDEX_VERSION and cached_key == key:
+            return SearchIndex(entries, postings, lengths)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    index = SearchIndex.build(docs)
+    try:
+        atomic_file.atomic_write(
+            path, marshal.dumps((INDEX_VERSION, key, index.docs, index.postings, index.lengths)))
+    except OSError:
+        pass
+    return index
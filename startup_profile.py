@@ -0,0 +1,227 @@
+"""
+Startup profiling for the PCEP tutor (python_tutor.py --profile-startup).
+
+Measures where the tutor spends its time before the first menu appears:
+
+- imports: `python -X importtime -c "import python_tutor"` in a subprocess,
+  reporting the total and the slowest modules
+- lesson index, progress load, tutor construction, question bank load,
+  bank build, clear_screen and the first display_menu, each timed with
+  time.perf_counter_ns (fastest of TIMING_RUNS runs) and measured for peak
+  memory with tracemalloc in a separate pass (tracing slows the code it
+  traces)
+
+Results are compared with the checked-in startup_baseline.json; a phase
+that is clearly slower than its baseline is reported as a regression and
+the command exits with status 1. A cProfile dump of the whole startup can
+be written for a closer look with pstats or snakeviz.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import lessons
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+# A phase regresses when it is slower than baseline * factor + slack (timings
+# jitter a lot on sub-millisecond phases, so both are needed)
+REGRESSION_FACTOR = 1.5
+REGRESSION_SLACK_MS = 2.0
+# Each phase is timed this many times and the fastest run is kept, so a
+# garbage collection or a busy machine doesn't read as a regression
+TIMING_RUNS = 3
+
+
+def _startup_phases(tutor_class):
+    """
+    Return the startup phases as (name, callable) pairs.
+
+    Each callable redoes its step from scratch, mirroring main(): the lesson
+    index and progress are loaded by the constructor, the question bank on
+    the first exam, and clear_screen/display_menu draw the first screen.
+
+    "question bank" is the usual start, opening the bank file written by an
+    earlier run (it is written here first if missing, untimed). "bank build"
+    is what a start after a source change costs: building the bank and its
+    near-duplicate clusters from the question sources.
+    """
+    tutor = tutor_class()
+    with contextlib.redirect_stdout(io.StringIO()):
+        len(tutor.practice_questions)
+
+    def load_bank():
+        tutor._practice_questions = None
+        return len(tutor.practice_questions)
+
+    def build_bank():
+        return len(tutor._generate_practice_bank().clusters())
+
+    return [
+        ("lesson index", lessons.LessonRegistry),
+        ("progress load", tutor.load_progress),
+        ("tutor init", tutor_class),
+        ("question bank", load_bank),
+        ("bank build", build_bank),
+        ("clear screen", tutor.clear_screen),
+        ("first menu", tutor.display_menu),
+    ]
+
+
+def _time_phases(phases, runs=TIMING_RUNS):
+    """Return {phase: milliseconds}, the fastest of `runs` untraced runs of every phase"""
+    timings = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, step in phases:
+            fastest = None
+            for _ in range(runs):
+                start = time.perf_counter_ns()
+                step()
+                elapsed = time.perf_counter_ns() - start
+                fastest = elapsed if fastest is None else min(fastest, elapsed)
+            timings[name] = fastest / 1e6
+    return timings
+
+
+def _trace_phases(phases):
+    """Return {phase: peak KiB allocated} measured with tracemalloc"""
+    peaks = {}
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name, step in phases:
+                tracemalloc.clear_traces()
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+                step()
+                peaks[name] = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def profile_imports(top=5):
+    """
+    Time `import python_tutor` in a fresh interpreter.
+
+    Returns:
+        tuple: (total milliseconds, [(module, self milliseconds), ...] slowest first)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import python_tutor"],
+        cwd=here, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True, check=False
+    )
+    total = 0.0
+    modules = []
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].split(":")[1])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # column header
+        name = parts[2].strip()
+        modules.append((name, self_us / 1000))
+        if name == "python_tutor":
+            total = cumulative_us / 1000
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return total, modules[:top]
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Return the baseline {phase: milliseconds}, or {} if there is none"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get("timings_ms", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(timings, path=BASELINE_PATH):
+    """Write timings as the new baseline"""
+    with open(path, 'w') as f:
+        json.dump({
+            "python": sys.version.split()[0],
+            "timings_ms": {name: round(ms, 3) for name, ms in timings.items()}
+        }, f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(timings, baseline):
+    """Return [(phase, measured ms, baseline ms)] for phases over their budget"""
+    regressions = []
+    for name, ms in timings.items():
+        expected = baseline.get(name)
+        if expected is not None and ms > expected * REGRESSION_FACTOR + REGRESSION_SLACK_MS:
+            regressions.append((name, ms, expected))
+    return regressions
+
+
+def run(tutor_class, cprofile_path=None, update_baseline=False):
+    """
+    Profile tutor startup and print a report.
+
+    Args:
+        tutor_class: PythonTutor (passed in to avoid importing the script twice)
+        cprofile_path (str): Also dump cProfile stats of one startup to this file
+        update_baseline (bool): Store this run's timings as the new baseline
+
+    Returns:
+        int: Exit status (1 if a phase regressed against the baseline)
+    """
+    import_ms, slowest_imports = profile_imports()
+    timings = {"imports": import_ms}
+    timings.update(_time_phases(_startup_phases(tutor_class)))
+    peaks = _trace_phases(_startup_phases(tutor_class))
+
+    if cprofile_path:
+        profiler = cProfile.Profile()
+        with contextlib.redirect_stdout(io.StringIO()):
+            profiler.enable()
+            for _, step in _startup_phases(tutor_class):
+                step()
+            profiler.disable()
+        profiler.dump_stats(cprofile_path)
+
+    baseline = load_baseline()
+    print("=" * 70)
+    print("  ⏱️  STARTUP PROFILE")
+    print("=" * 70)
+    print(f"\n{'Phase':<16}{'Time (ms)':>12}{'Baseline':>12}{'Peak (KiB)':>14}")
+    for name, ms in timings.items():
+        expected = baseline.get(name)
+        expected_text = f"{expected:.3f}" if expected is not None else "-"
+        peak_text = f"{peaks[name]:.1f}" if name in peaks else "-"
+        print(f"{name:<16}{ms:>12.3f}{expected_text:>12}{peak_text:>14}")
+    print(f"{'total':<16}{sum(timings.values()):>12.3f}")
+
+    print("\nSlowest imports (self time):")
+    for name, ms in slowest_imports:
+        print(f"  {ms:8.3f} ms  {name}")
+    if cprofile_path:
+        print(f"\ncProfile stats written to {cprofile_path}")
+
+    if update_baseline:
+        save_baseline(timings)
+        print(f"\nBaseline updated: {BASELINE_PATH}")
+        return 0
+
+    regressions = find_regressions(timings, baseline)
+    if regressions:
+        print("\n⚠️  Startup regressions:")
+        for name, ms, expected in regressions:
+            print(f"  {name}: {ms:.3f} ms (baseline {expected:.3f} ms)")
+        return 1
+    return 0
@@ -0,0 +1,185 @@
+"""
+Terminal output for the PCEP tutor.
+
+The tutor used to clear the screen by spawning `clear`/`cls` before every
+question and menu - a fork+exec per screen, which is noticeable over SSH.
+Terminal clears with ANSI escape sequences instead and only falls back to the
+subprocess on terminals without ANSI support. Output that is not a terminal
+(a pipe or file) is never cleared.
+
+use_buffered_stdout() swaps sys.stdout for a block-buffered stream: every
+print() of a screen collects in the buffer, and input() flushes it before
+prompting, so each screen reaches the terminal in a single write.
+
+Menus and lessons go through Terminal.render(), a double-buffered renderer:
+it keeps the previous frame and, on ANSI terminals, only rewrites the rows
+that changed. Frames are kept within the terminal height (long lesson text is
+paged with body_rows()/fit()) so rows can be addressed directly; anything
+else that writes to the screen invalidates the kept frame.
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+
+
+# Cursor home, clear screen, clear scrollback (what `clear` itself sends)
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+# Rows kept free under a frame for the prompt, the typed answer and a message
+PROMPT_ROWS = 4
+
+
+def supports_ansi(stream):
+    """
+    Return True if stream is a terminal that understands ANSI escape codes.
+
+    Args:
+        stream: File object to check (normally sys.stdout)
+    """
+    try:
+        if not stream.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+    if os.environ.get("TERM") == "dumb":
+        return False
+    if os.name == 'nt':
+        # Classic conhost only handles escapes in newer, opted-in consoles
+        return any(name in os.environ for name in ("WT_SESSION", "ANSICON", "TERM"))
+    return True
+
+
+def use_buffered_stdout(buffer_size=STDOUT_BUFFER_SIZE):
+    """
+    Replace sys.stdout with a block-buffered stream on the same descriptor.
+
+    Python line-buffers a terminal stdout, turning a screen of print() calls
+    into dozens of writes. input() flushes sys.stdout before reading, so
+    with block buffering a screen is written once, right before the prompt.
+
+    Returns:
+        bool: True if sys.stdout was replaced
+    """
+    stream = sys.stdout
+    try:
+        fd = stream.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return False
+    stream.flush()
+    raw = open(fd, 'wb', buffering=buffer_size, closefd=False)
+    sys.stdout = io.TextIOWrapper(raw, encoding=stream.encoding, errors=stream.errors,
+                                  line_buffering=False)
+    return True
+
+
+class Terminal:
+    """
+    Screen operations for the tutor's terminal.
+
+    Args:
+        stream: Output stream used to detect capabilities (defaults to sys.stdout)
+    """
+
+    def __init__(self, stream=None):
+        stream = stream or sys.stdout
+        self.is_terminal = _isatty(stream)
+        self.ansi = supports_ansi(stream)
+        self._frame = None
+
+    def size(self):
+        """Return the terminal size as (columns, rows)"""
+        columns, rows = shutil.get_terminal_size()
+        return columns, rows
+
+    def body_rows(self, fixed_rows):
+        """
+        Return how many body rows fit beside fixed_rows of header and footer.
+
+        Returns:
+            int: Rows available for a scrolling body, or None when the output
+                is not an ANSI terminal (show everything, nothing to page)
+        """
+        if not self.ansi:
+            return None
+        return max(1, self.size()[1] - fixed_rows - PROMPT_ROWS)
+
+    def fit(self, lines):
+        """
+        Split lines wider than the terminal into several rows.
+
+        Only needed for text that will be paged; on non-ANSI output the lines
+        are returned unchanged.
+        """
+        if not self.ansi:
+            return list(lines)
+        # Leave a margin for double-width characters such as emoji
+        width = max(20, self.size()[0] - 2)
+        rows = []
+        for line in lines:
+            while len(line) > width:
+                rows.append(line[:width])
+                line = line[width:]
+            rows.append(line)
+        return rows
+
+    def invalidate(self):
+        """Forget the kept frame - something else has written to the screen"""
+        self._frame = None
+
+    def render(self, lines):
+        """
+        Draw a full-screen frame, rewriting only rows that changed.
+
+        Falls back to clearing and printing the whole frame on non-ANSI
+        output, or when the frame is taller than the terminal (a scrolled
+        screen can't be addressed row by row).
+
+        Args:
+            lines (list): Rows of the frame, top to bottom
+        """
+        lines = list(lines)
+        if not self.ansi or len(lines) + PROMPT_ROWS > self.size()[1]:
+            self.clear()
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+
+        previous = self._frame
+        out = [] if previous is not None else [CLEAR_SCREEN]
+        for row, line in enumerate(lines):
+            if previous is None or row >= len(previous) or previous[row] != line:
+                out.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+        # Park the cursor under the frame and erase old frame rows and prompts
+        out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        sys.stdout.write("".join(out))
+        self._frame = lines
+
+    def clear(self):
+        """Clear the screen with ANSI codes, or `clear`/`cls` as a fallback"""
+        self._frame = None
+        if self.ansi:
+            # Written into the buffered stream with the rest of the screen
+            sys.stdout.write(CLEAR_SCREEN)
+            return
+        if not self.is_terminal:
+            return
+        sys.stdout.flush()
+        try:
+            if os.name == 'nt':
+                subprocess.run(['cmd', '/c', 'cls'], shell=False, check=False)
+            else:
+                subprocess.run(['clear'], shell=False, check=False)
+        except OSError:
+            pass
+
+
+def _isatty(stream):
+    """Return True if stream is attached to a terminal"""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
@@ -0,0 +1,33 @@
+import os
+
+import answer_log
+
+
+def test_learners_get_separate_log_files(tmp_path):
+    path = str(tmp_path / "answers.jsonl")
+    logs = {user: answer_log.AnswerLog(path, user=user) for user in (None, "alice", "bob/../x y")}
+    for n, (user, log) in enumerate(logs.items()):
+        log.record(f"q{n}", "A", True, 1.0, topic="Loops")
+        log.close()
+
+    assert logs[None].path == path
+    assert logs["alice"].path == str(tmp_path / "answers.alice.jsonl")
+    assert os.path.dirname(logs["bob/../x y"].path) == str(tmp_path)
+    for n, log in enumerate(logs.values()):
+        assert [record["qid"] for record in answer_log.read_answers(log.path)] == [f"q{n}"]
+
+
+def test_read_answers_skips_damaged_lines(tmp_path):
+    path = tmp_path / "answers.jsonl"
+    path.write_text('{"qid": "a"}\n{"qid": \n[1]\n{"qid": "b"}\n', encoding="utf-8")
+    assert [record["qid"] for record in answer_log.read_answers(str(path))] == ["a", "b"]
+    assert answer_log.read_answers(str(tmp_path / "missing.jsonl")) == []
+
+
+def test_records_are_buffered_until_the_batch_is_full(tmp_path):
+    path = str(tmp_path / "answers.jsonl")
+    log = answer_log.AnswerLog(path, batch_size=2)
+    log.record("a", "A", True, 0.5)
+    assert answer_log.read_answers(path) == []
+    log.record("b", "B", False, 0.5)
+    assert [record["correct"] for record in answer_log.read_answers(path)] == [True, False]
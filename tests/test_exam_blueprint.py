@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+import adaptive
+import exam_blueprint
+import question_bank
+from question_bank import QuestionBank
+
+
+def make_question(text):
+    return {"question": text, "options": ["A) yes", "B) no", "C) maybe", "D) never"],
+            "answer": "A", "explanation": "", "topic": text.split()[0]}
+
+
+@pytest.fixture
+def bank():
+    """Sections 1 and 2 hold the same question (one near-duplicate cluster)"""
+    bank = QuestionBank()
+    shared = "Shared question about whether the interpreter compiles source code to bytecode first"
+    bank.add(make_question(shared), question_bank.SOURCE_LESSON_QUIZ, section=1)
+    bank.add(make_question(shared.upper()), question_bank.SOURCE_STUDY_GUIDE, section=2)
+    for n in range(5):
+        bank.add(make_question(f"Loop{n} question number {n} about for loops and range {n * 7}"),
+                 question_bank.SOURCE_LESSON_QUIZ, section=3)
+    return bank
+
+
+BLUEPRINT = exam_blueprint.Blueprint("TEST", 3, section_weights={1: 1, 2: 1, 3: 1})
+
+
+@pytest.mark.parametrize("posterior", [None, adaptive.TopicPosterior()])
+def test_quota_of_a_section_whose_clusters_are_taken_moves_on(bank, posterior):
+    clusters = bank.clusters()
+    assert clusters[0] == clusters[1]
+    for seed in range(5):
+        questions = exam_blueprint.assemble(bank, BLUEPRINT, seed=seed, posterior=posterior)
+        assert len(questions) == 3
+        assert [q.section for q in questions] == [1, 3, 3]
+
+
+def test_quotas_follow_the_weights():
+    assert exam_blueprint.PCEP_EXAM.quotas() == {1: 5, 2: 9, 3: 8, 4: 8}
+    assert sum(exam_blueprint.PRACTICE_EXAM.quotas().values()) == 20
+
+
+def test_too_few_distinct_questions_raises(bank):
+    with pytest.raises(ValueError):
+        exam_blueprint.assemble(bank, exam_blueprint.Blueprint("TEST", 7), seed=1)
+
+
+def test_sections_come_in_blueprint_order():
+    bank = QuestionBank()
+    rng = random.Random(3)
+    for n in range(40):
+        words = " ".join(f"w{rng.randrange(10 ** 6)}" for _ in range(8))
+        bank.add(make_question(f"Topic{n % 4} {words}"), question_bank.SOURCE_ADDITIONAL, section=n % 4 + 1)
+    questions = exam_blueprint.assemble(bank, exam_blueprint.PRACTICE_EXAM, seed=2)
+    assert [q.section for q in questions] == sorted(q.section for q in questions)
+    assert len({q.question for q in questions}) == 20
@@ -0,0 +1,107 @@
+import hashlib
+import json
+
+import pytest
+
+import question_bank
+
+
+QUESTIONS = [
+    {"question_text": "What is the output?\n\nprint('[1, 2]')", "options": {"A": "[1, 2]", "B": "{}"},
+     "correct_answer": "A", "explanation": "Brackets \"inside\" strings don't end the item \\ ]"},
+    {"question": "Ünïcödé – “quotes” and emoji 🐍", "options": ["A. yes", "B. no"], "answer": "A"},
+    {"question": "Literals", "correct": 1, "weight": -1.5e3, "flags": [True, False, None], "nested": {"a": []}},
+    {"question": "", "options": []},
+]
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, 1 << 16]
+
+
+@pytest.fixture(params=CHUNK_SIZES)
+def chunk_size(request, monkeypatch):
+    monkeypatch.setattr(question_bank, "STREAM_CHUNK_SIZE", request.param)
+    return request.param
+
+
+def write(tmp_path, data, name="questions.json"):
+    path = tmp_path / name
+    path.write_bytes(data if isinstance(data, bytes) else data.encode("utf-8"))
+    return str(path)
+
+
+def parse(path):
+    return list(question_bank.iter_json_questions(path))
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_array_matches_json_load(tmp_path, chunk_size, indent):
+    path = write(tmp_path, json.dumps(QUESTIONS, indent=indent, ensure_ascii=False))
+    with open(path, encoding="utf-8") as f:
+        assert parse(path) == json.load(f)
+
+
+def test_json_lines(tmp_path, chunk_size):
+    text = "\n".join(json.dumps(q, ensure_ascii=False) for q in QUESTIONS) + "\n"
+    assert parse(write(tmp_path, text, "questions.jsonl")) == QUESTIONS
+
+
+def test_byte_order_mark(tmp_path, chunk_size):
+    data = b"\xef\xbb\xbf" + json.dumps(QUESTIONS, ensure_ascii=False).encode("utf-8")
+    assert parse(write(tmp_path, data)) == QUESTIONS
+
+
+def test_items_that_are_not_objects_are_skipped(tmp_path, chunk_size):
+    text = json.dumps([12345, -1.5e-3, "text", QUESTIONS[0], None, [QUESTIONS[1]], True, QUESTIONS[2]])
+    assert parse(write(tmp_path, text)) == [QUESTIONS[0], QUESTIONS[2]]
+
+
+@pytest.mark.parametrize("text", ["", "   \n", "[]", " [ ] \n"])
+def test_empty_files(tmp_path, chunk_size, text):
+    assert parse(write(tmp_path, text)) == []
+
+
+def test_digest_covers_every_byte(tmp_path, chunk_size):
+    data = json.dumps(QUESTIONS).encode("utf-8")
+    digest = hashlib.sha256()
+    list(question_bank.iter_json_questions(write(tmp_path, data), digest))
+    assert digest.hexdigest() == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.parametrize("text", [
+    '[{"question": "a"}',                      # unterminated array
+    '[{"question": "a"',                       # unterminated object
+    '[{"question": "a}]',                      # unterminated string
+    '[{"question": "a"}, {"question" "b"}]',   # missing colon
+    '[{"question": "a"}, tru]',                # bad literal
+    '{"question": "a"}\n{"question": }\n',     # bad JSON Lines item
+])
+def test_malformed_input_raises(tmp_path, chunk_size, text):
+    with pytest.raises(ValueError):
+        parse(write(tmp_path, text))
+
+
+def test_malformed_item_fails_without_reading_the_rest(tmp_path, monkeypatch):
+    monkeypatch.setattr(question_bank, "STREAM_CHUNK_SIZE", 64)
+    tail = json.dumps([{"question": "x" * 100}] * 1000)[1:]
+    path = write(tmp_path, '[{"question": "a", oops}, ' + tail)
+
+    class Counter:
+        read = 0
+
+        def update(self, chunk):
+            self.read += len(chunk)
+
+    counter = Counter()
+    with pytest.raises(ValueError):
+        list(question_bank.iter_json_questions(path, counter))
+    assert counter.read <= 64 * 2
+
+
+def test_oversized_item_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(question_bank, "STREAM_CHUNK_SIZE", 16)
+    monkeypatch.setattr(question_bank, "MAX_ITEM_CHARS", 100)
+    path = write(tmp_path, json.dumps([{"question": "a"}, {"question": "x" * 500}]))
+    items = question_bank.iter_json_questions(path)
+    assert next(items) == {"question": "a"}
+    with pytest.raises(ValueError, match="larger than"):
+        next(items)
@@ -0,0 +1,97 @@
+import os
+import random
+
+import pytest
+
+import mapped_bank
+import question_bank
+from question_bank import QuestionBank
+
+
+QUESTIONS_JSON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "PCEP_Questions.json")
+INDEXES = ("topic", "lesson", "source", "difficulty", "section")
+
+
+@pytest.fixture(scope="module")
+def built():
+    bank = QuestionBank()
+    bank.add({"question": "Ünïcödé 🐍 text", "options": ["A) ä", "B) b\nwith a second line"],
+              "answer": "B", "explanation": "", "topic": "Strings"},
+             question_bank.SOURCE_LESSON_QUIZ, lesson=0)
+    bank.add({"question": "No options", "options": [], "answer": "A", "explanation": "None",
+              "topic": "Misc"}, question_bank.SOURCE_ADDITIONAL, lesson=3, difficulty="hard")
+    bank.ingest_file(QUESTIONS_JSON, question_bank.SOURCE_STUDY_GUIDE, "PCEP Study Guide")
+    return bank
+
+
+@pytest.fixture
+def mapped(built, tmp_path):
+    path = str(tmp_path / "cache" / "practice.bank")
+    mapped_bank.write_bank(built, path, "key-1")
+    bank = mapped_bank.MappedQuestionBank(path)
+    yield bank
+    bank.close()
+
+
+def test_fields_round_trip(built, mapped):
+    assert mapped.meta["key"] == "key-1"
+    assert len(mapped) == len(built)
+    for original, loaded in zip(built, mapped):
+        assert loaded.to_dict() == original.to_dict()
+    for name in ("question", "options", "answer_code", "explanation", "topic", "section", "difficulty"):
+        assert list(mapped.column(name)) == list(built.column(name))
+
+
+def test_indexes_and_clusters_round_trip(built, mapped):
+    for index in INDEXES:
+        assert mapped.labels(index) == built.labels(index)
+        for key in built.keys(index):
+            assert list(mapped.ids(**{index: key})) == list(built.ids(**{index: key}))
+    assert list(mapped.clusters()) == list(built.clusters())
+
+
+def test_find(built, mapped):
+    for question in built:
+        stable_id = question_bank.question_id(question)
+        assert mapped.find(stable_id).to_dict() == built.find(stable_id).to_dict()
+    assert mapped.find("0" * 12) is None
+
+
+def test_sample_matches_the_built_bank(built, mapped):
+    for seed in range(5):
+        expected = built.sample(20, rng=random.Random(seed))
+        assert [q.to_dict() for q in mapped.sample(20, rng=random.Random(seed))] \
+            == [q.to_dict() for q in expected]
+    filtered = mapped.sample(5, rng=random.Random(0), section=2)
+    assert [q.to_dict() for q in filtered] \
+        == [q.to_dict() for q in built.sample(5, rng=random.Random(0), section=2)]
+    assert all(q.section == 2 for q in filtered)
+
+
+def test_mapped_bank_is_read_only(mapped):
+    with pytest.raises(TypeError):
+        mapped.add(mapped[0], question_bank.SOURCE_LESSON_QUIZ)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.bank"
+    path.write_bytes(b"NOTABANK" + bytes(64))
+    with pytest.raises(ValueError):
+        mapped_bank.MappedQuestionBank(str(path))
+
+
+def test_load_bank_rebuilds_when_the_key_changes(built, tmp_path):
+    path = str(tmp_path / "practice.bank")
+    builds = []
+
+    def build():
+        builds.append(1)
+        return built
+
+    for key in ("key-1", "key-1", "key-2"):
+        bank = mapped_bank.load_bank(path, key, build)
+        assert isinstance(bank, mapped_bank.MappedQuestionBank)
+        assert bank.meta["key"] == key
+        bank.close()
+    assert len(builds) == 2
@@ -0,0 +1,52 @@
+import sqlite3
+import threading
+
+import pytest
+
+import progress_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(progress_store, "SQLITE_RETRY_DELAY", 0.05)
+    store = progress_store.SQLiteProgressStore(str(tmp_path / "progress.db"), "alice", timeout=0.05)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def other_writer(store):
+    conn = sqlite3.connect(store.db_path, isolation_level=None, check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+def test_busy_database_is_retried(store, other_writer):
+    other_writer.execute("BEGIN IMMEDIATE")
+    threading.Timer(0.15, other_writer.execute, ("COMMIT",)).start()
+    store.record(progress_store.EVENT_QUIZ, lesson=1, score=80)
+    assert store.load()["quiz_scores"] == {"1": 80}
+
+
+def test_failed_batch_is_reported(store, other_writer):
+    other_writer.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(OSError, match="locked"):
+            store.record_batch([(progress_store.EVENT_QUIZ, {"lesson": 1, "score": 80}),
+                                (progress_store.EVENT_COMPLETED, {"lesson": 1})])
+    finally:
+        other_writer.execute("COMMIT")
+    assert store.load() == progress_store.empty_state()
+
+
+def test_batch_is_one_transaction(store):
+    store.record_batch([(progress_store.EVENT_REVIEW, {"qid": "q1", "card": [2.5, 1, 1, 100]}),
+                        (progress_store.EVENT_REVIEW, {"qid": "q2", "card": [2.5, 1, 1, 200]})])
+    store.record(progress_store.EVENT_DISCARD, qid="q1")
+    assert store.load()["reviews"] == {"q2": [2.5, 1, 1, 200]}
+
+
+def test_journal_write_errors_are_raised(tmp_path):
+    store = progress_store.JournalProgressStore(str(tmp_path / "missing" / "progress.json"))
+    with pytest.raises(OSError):
+        store.record(progress_store.EVENT_CURRENT, lesson=1)
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+import question_bank
+from question_bank import Question, QuestionBank
+
+
+def make_question(n, topic="Loops", answer="B"):
+    return {
+        "question": f"Question {n}: what does loop number {n} print?",
+        "options": [f"A) {n}", f"B) {n + 1}", f"C) {n + 2}", f"D) {n + 3}"],
+        "answer": answer,
+        "explanation": f"Explanation {n}",
+        "topic": topic,
+    }
+
+
+@pytest.fixture
+def bank():
+    bank = QuestionBank()
+    for n in range(6):
+        bank.add(make_question(n), question_bank.SOURCE_LESSON_QUIZ, lesson=n % 2,
+                 difficulty=question_bank.DIFFICULTY_EASY, section=3)
+    for n in range(6, 10):
+        bank.add(make_question(n, topic="Functions", answer="D"), question_bank.SOURCE_STUDY_GUIDE,
+                 difficulty=question_bank.DIFFICULTY_HARD, section=4)
+    return bank
+
+
+def test_question_row_reads_like_a_dict():
+    question = Question.from_dict(dict(make_question(1), difficulty="hard", section=2))
+    assert question["question"] == question.question
+    assert question["answer"] == question.answer == "B"
+    assert question.answer_code == 1
+    assert isinstance(question.options, tuple)
+    assert question.get("difficulty") == "hard"
+    assert question.get("missing", 5) == 5
+    with pytest.raises(KeyError):
+        question["missing"]
+    assert Question.from_dict(question.to_dict()).to_dict() == question.to_dict()
+
+
+def test_question_row_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Question.from_dict(make_question(1)).extra = 1
+
+
+def test_rows_and_columns_agree(bank):
+    assert len(bank) == 10
+    for name in Question.__slots__:
+        assert list(bank.column(name)) == [getattr(question, name) for question in bank]
+    assert bank[7].to_dict() == dict(make_question(7, topic="Functions", answer="D"),
+                                     section=4, difficulty=question_bank.DIFFICULTY_HARD)
+
+
+def test_indexes(bank):
+    assert list(bank.ids(topic="Loops")) == [0, 1, 2, 3, 4, 5]
+    assert list(bank.ids(lesson=1)) == [1, 3, 5]
+    assert list(bank.ids(source=question_bank.SOURCE_STUDY_GUIDE, section=4)) == [6, 7, 8, 9]
+    assert bank.count(topic="Loops", section=4) == 0
+    assert bank.count() == 10
+    assert sorted(bank.keys("section")) == [3, 4]
+    assert bank.labels("lesson") == [0, 1, 0, 1, 0, 1] + [None] * 4
+
+
+def test_find_by_stable_id(bank):
+    for question in bank:
+        assert bank.find(question_bank.question_id(question)).to_dict() == question.to_dict()
+    assert bank.find("0" * 12) is None
+
+
+def test_sample_draws_distinct_matching_questions(bank):
+    drawn = bank.sample(4, rng=random.Random(1), topic="Loops")
+    assert len({question.question for question in drawn}) == 4
+    assert all(question.topic == "Loops" for question in drawn)
+    with pytest.raises(ValueError):
+        bank.sample(5, rng=random.Random(1), topic="Functions")
+
+
+def test_sample_skips_near_duplicates():
+    bank = QuestionBank()
+    original = make_question(1)
+    bank.add(original, question_bank.SOURCE_LESSON_QUIZ)
+    bank.add(dict(original, question=original["question"].upper()), question_bank.SOURCE_STUDY_GUIDE)
+    bank.add(make_question(50), question_bank.SOURCE_LESSON_QUIZ)
+    clusters = bank.clusters()
+    assert clusters[0] == clusters[1] != clusters[2]
+    for seed in range(10):
+        drawn = bank.sample(2, rng=random.Random(seed))
+        assert len({question.question.lower() for question in drawn}) == 2
+
+
+def test_ingest_file_normalizes_study_guide_layout(tmp_path):
+    path = tmp_path / "questions.jsonl"
+    path.write_text('{"question_text": "Pick one", "options": {"B": "two", "A": "one"}, '
+                    '"correct_answer": "BA", "explanation": "Because"}\n', encoding="utf-8")
+    bank = QuestionBank()
+    assert bank.ingest_file(str(path), "Vendor") == 1
+    question = bank[0]
+    assert question.options == ("A) one", "B) two")
+    assert question.answer == "B"
+    assert question.topic == "Vendor"
+    assert bank.ids(source="Vendor") == [0]
+
+
+def test_duplicate_stable_ids_are_folded_together():
+    bank = QuestionBank()
+    first = make_question(1, answer="D")
+    assert bank.add(first, question_bank.SOURCE_STUDY_GUIDE) == 0
+    assert bank.add(make_question(2), question_bank.SOURCE_STUDY_GUIDE) == 1
+    # Same text and options, different answer key: the first copy wins
+    assert bank.add(dict(first, answer="A"), question_bank.SOURCE_STUDY_GUIDE) == 0
+    assert len(bank) == 2
+    assert bank.find(question_bank.question_id(first)).answer == "D"
+    assert bank.ingest([{"question": first["question"], "options": first["options"], "correct": 0}],
+                       question_bank.SOURCE_ADDITIONAL, "Extra") == 0
@@ -0,0 +1,116 @@
+import json
+import os
+
+import question_bank
+import text_importer
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_DUMP = os.path.join(ROOT, "PCEP_Questions.txt")
+SAMPLE_JSON = os.path.join(ROOT, "PCEP_Questions.json")
+
+RULE = "-" * 40
+DUMP = f"""EXAM QUESTIONS EXTRACTED
+
+QUESTION 1
+{RULE}
+Question Text:
+What is the output of the following snippet?
+
+print(1 + 2)
+
+Answer Options:
+  A. 3
+  B. 12
+     (the strings are concatenated)
+  C) an error
+
+Correct Answer: A
+
+Explanation:  1 + 2 adds two integers.
+Second line.
+
+{RULE}
+
+QUESTION 2
+{RULE}
+Question Text:
+
+Answer Options:
+  A. orphaned options
+
+QUESTION 3
+{RULE}
+Question Text:
+Select two answers.
+Answer Options:
+  A. one
+  B. two
+Correct Answer: AB
+"""
+
+
+def test_parse_question():
+    chunk = text_importer.split_questions(DUMP)[0]
+    assert text_importer.parse_question(chunk) == {
+        "question_text": "What is the output of the following snippet?\n\nprint(1 + 2)",
+        "options": {"A": "3", "B": "12\n(the strings are concatenated)", "C": "an error"},
+        "correct_answer": "A",
+        "explanation": " 1 + 2 adds two integers.\nSecond line.",
+    }
+
+
+def test_parse_dump_drops_chunks_without_question_text():
+    questions = text_importer.parse_dump(DUMP, jobs=1)
+    assert [q["question_text"] for q in questions] == ["What is the output of the following snippet?\n\nprint(1 + 2)",
+                                                       "Select two answers."]
+    assert questions[1]["correct_answer"] == "AB"
+    assert "explanation" not in questions[1]
+
+
+def test_sample_dump_matches_the_study_guide_json():
+    with open(SAMPLE_DUMP, encoding="utf-8") as f:
+        parsed = text_importer.parse_dump(f.read(), jobs=1)
+    with open(SAMPLE_JSON, encoding="utf-8") as f:
+        expected = json.load(f)
+    assert len(parsed) == len(expected)
+    for question, reference in zip(parsed, expected):
+        assert question["question_text"] == reference["question_text"]
+        assert question["options"] == reference["options"]
+        assert question["correct_answer"] == reference["correct_answer"]
+        # The dump shortens long explanations
+        assert reference.get("explanation", "").startswith(question.get("explanation", ""))
+
+
+def test_parallel_parse_matches_serial(monkeypatch):
+    with open(SAMPLE_DUMP, encoding="utf-8") as f:
+        text = f.read()
+    monkeypatch.setattr(text_importer, "PARALLEL_THRESHOLD", 10)
+    monkeypatch.setattr(text_importer, "BATCH_SIZE", 40)
+    assert text_importer.parse_dump(text, jobs=2) == text_importer.parse_dump(text, jobs=1)
+
+
+def test_run_refuses_to_overwrite_without_force(tmp_path, capsys):
+    dump = tmp_path / "dump.txt"
+    dump.write_text(DUMP, encoding="utf-8")
+    output = tmp_path / "dump.json"
+    output.write_text("[]", encoding="utf-8")
+
+    assert text_importer.run(str(dump)) == 1
+    assert output.read_text(encoding="utf-8") == "[]"
+    assert "--force" in capsys.readouterr().out
+
+    assert text_importer.run(str(dump), force=True) == 0
+    assert len(question_bank.load_study_questions(str(output))) == 2
+
+
+def test_run_reports_undecodable_dumps(tmp_path, capsys):
+    dump = tmp_path / "dump.txt"
+    dump.write_bytes(b"QUESTION 1\nQuestion Text:\n\xff\xfe\n")
+    assert text_importer.run(str(dump)) == 1
+    assert "Import failed" in capsys.readouterr().out
+    assert not (tmp_path / "dump.json").exists()
+
+
+def test_run_reports_missing_dumps(tmp_path):
+    assert text_importer.run(str(tmp_path / "missing.txt")) == 1
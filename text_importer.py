@@ -0,0 +1,176 @@
+"""
+Importer for PCEP question dumps in the text layout (python_tutor.py --import-text).
+
+PCEP_Questions.txt and the output of our PDF extraction tools use this layout:
+
+    QUESTION 5
+    ----------
+    Question Text:
+    How many hashes (+) does the code output to the screen?
+    ...
+    Answer Options:
+      A. one
+      B. zero (the code outputs nothing)
+    Correct Answer: C
+    Explanation:  The code snippet ...
+
+The dump is split on the QUESTION delimiters, the chunks are parsed in a
+process pool (in batches, so multi-thousand-question dumps use every core),
+and the result is written as a study guide JSON array with the same fields
+as PCEP_Questions.json. The compiled question cache (see question_bank.py)
+is rebuilt right away, so the next tutor start loads the new questions from
+the cache.
+"""
+
+import concurrent.futures
+import json
+import os
+import re
+
+import atomic_file
+import question_bank
+
+
+# Below this many questions a process pool costs more than it saves
+PARALLEL_THRESHOLD = 1000
+BATCH_SIZE = 250
+
+_QUESTION_DELIMITER = re.compile(r"^QUESTION \d+[ \t]*$", re.MULTILINE)
+_RULE = re.compile(r"^-{10,}[ \t]*$", re.MULTILINE)
+_FIELD = re.compile(r"^(Question Text|Answer Options|Correct Answer|Explanation):[ \t]?", re.MULTILINE)
+_OPTION = re.compile(r"^[ \t]*([A-Z])[.)][ \t]+(.*)$")
+
+
+def split_questions(text):
+    """Return the text of each question in a dump (the part after each QUESTION n line)"""
+    return _QUESTION_DELIMITER.split(text)[1:]
+
+
+def parse_question(chunk):
+    """
+    Parse one question chunk into the study guide JSON layout.
+
+    Option lines that don't start with a letter label continue the option
+    above them.
+
+    Args:
+        chunk (str): Text between two QUESTION delimiters
+
+    Returns:
+        dict: question_text, options {letter: text}, correct_answer and
+            explanation, or None if the chunk has no question text
+    """
+    fields = {}
+    parts = _FIELD.split(_RULE.sub("", chunk))
+    for name, value in zip(parts[1::2], parts[2::2]):
+        fields[name] = value
+
+    question_text = fields.get("Question Text", "").strip()
+    if not question_text:
+        return None
+
+    options = {}
+    letter = None
+    for line in fields.get("Answer Options", "").splitlines():
+        match = _OPTION.match(line)
+        if match:
+            letter = match.group(1)
+            options[letter] = match.group(2).strip()
+        elif letter and line.strip():
+            options[letter] += "\n" + line.strip()
+
+    question = {
+        "question_text": question_text,
+        "options": options,
+        "correct_answer": fields.get("Correct Answer", "").strip(),
+    }
+    explanation = fields.get("Explanation", "").rstrip()
+    if explanation:
+        question["explanation"] = explanation
+    return question
+
+
+def _parse_batch(chunks):
+    return [parse_question(chunk) for chunk in chunks]
+
+
+def parse_dump(text, jobs=None):
+    """
+    Parse every question in a dump, in parallel for large dumps.
+
+    Args:
+        text (str): Whole dump
+        jobs (int): Worker processes (default: one per CPU)
+
+    Returns:
+        list: Parsed questions in dump order (chunks without question text
+            are dropped)
+    """
+    chunks = split_questions(text)
+    if len(chunks) < PARALLEL_THRESHOLD or jobs == 1:
+        parsed = _parse_batch(chunks)
+    else:
+        batches = [chunks[i:i + BATCH_SIZE] for i in range(0, len(chunks), BATCH_SIZE)]
+        parsed = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            for batch in pool.map(_parse_batch, batches):
+                parsed.extend(batch)
+    return [question for question in parsed if question is not None]
+
+
+def import_text(text_path, json_path, jobs=None):
+    """
+    Convert a text dump to a study guide JSON file and rebuild its cache.
+
+    The JSON file is written atomically, so a failed import leaves the old
+    one in place.
+
+    Args:
+        text_path (str): Dump in the QUESTION n layout
+        json_path (str): JSON file to write (e.g. PCEP_Questions.json)
+        jobs (int): Worker processes for parsing
+
+    Returns:
+        int: Number of questions imported
+
+    Raises:
+        OSError: If the dump can't be read or the JSON can't be written
+        UnicodeDecodeError: If the dump is not UTF-8
+    """
+    with open(text_path, 'r', encoding='utf-8') as f:
+        questions = parse_dump(f.read(), jobs)
+
+    atomic_file.atomic_write(json_path, json.dumps(questions, indent=2, ensure_ascii=False) + "\n")
+
+    question_bank.load_study_questions(json_path)
+    return len(questions)
+
+
+def run(text_path, json_path=None, jobs=None, force=False):
+    """
+    Import a text dump and print a summary.
+
+    An existing output file is only replaced with force: the dumps carry
+    shortened explanations, so importing PCEP_Questions.txt over
+    PCEP_Questions.json would lose text.
+
+    Args:
+        text_path (str): Dump in the QUESTION n layout
+        json_path (str): Output file (default: the dump's name with .json)
+        jobs (int): Worker processes for parsing
+        force (bool): Overwrite an existing output file
+
+    Returns:
+        int: Exit status (1 if the import failed or was refused)
+    """
+    json_path = json_path or os.path.splitext(text_path)[0] + ".json"
+    if os.path.exists(json_path) and not force:
+        print(f"{json_path} already exists - pass --force to replace it, or choose --output")
+        return 1
+    try:
+        count = import_text(text_path, json_path, jobs)
+    except (OSError, ValueError) as e:  # ValueError covers UnicodeDecodeError
+        print(f"Import failed: {e}")
+        return 1
+    print(f"Imported {count} questions from {text_path} into {json_path}")
+    return 0
@@ -0,0 +1,71 @@
+"""
+Learner input for the PCEP tutor.
+
+The tutor never calls input() directly; it asks its io object, so the same
+lessons, quizzes and exams can be driven from the keyboard or from a script:
+
+- ask(prompt): a real answer (menu choice, option letter, line of code)
+- pause(prompt): a "Press Enter to continue" stop with nothing to answer
+- report(event, **data): a finished quiz, exam, review or exercise
+
+ConsoleIO is the interactive terminal. ScriptedIO feeds answers from a list
+or stream, skips pauses, and keeps the reports as structured records (see
+headless.py).
+"""
+
+
+class ConsoleIO:
+    """Interactive keyboard input; reports are only shown on screen"""
+
+    def ask(self, prompt):
+        """Prompt the learner and return the line they typed"""
+        return input(prompt)
+
+    def pause(self, prompt):
+        """Wait for Enter"""
+        input(prompt)
+
+    def report(self, event, **data):
+        """Nothing to record - the tutor has already printed the results"""
+
+
+class ScriptedIO:
+    """
+    Answers read from a script instead of the keyboard.
+
+    Pauses don't consume answers, so a script only lists what the learner
+    would actually type (menu choices, option letters, code lines).
+
+    Args:
+        answers (iterable): Answer strings, one per ask()
+
+    Attributes:
+        records (list): {"event": ..., **data} for every report
+        asked (int): Number of answers consumed
+    """
+
+    def __init__(self, answers):
+        self._answers = iter(answers)
+        self.records = []
+        self.asked = 0
+
+    def ask(self, prompt):
+        """
+        Return the next scripted answer.
+
+        Raises:
+            EOFError: When the script has run out, like input() at end of file
+        """
+        try:
+            answer = next(self._answers)
+        except StopIteration:
+            raise EOFError("script ended") from None
+        self.asked += 1
+        return answer
+
+    def pause(self, prompt):
+        """Scripts never wait"""
+
+    def report(self, event, **data):
+        """Keep a structured record of a finished activity"""
+        self.records.append({"event": event, **data})